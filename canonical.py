@@ -0,0 +1,111 @@
+"""
+중복 판정용 정규화
+
+- canonical_url     : 같은 기사를 가리키는 URL 변형(추적 파라미터, 모바일/데스크톱 호스트,
+                      네이버 oid/aid 변형)을 하나의 문자열로 통일
+- title_fingerprint : [단독]/[속보]/(종합) 같은 말머리, 괄호, 문장부호, 공백을
+                      걷어낸 제목의 sha256
+
+episodes.canonical_link / episodes.title_fingerprint 컬럼과 중복 검사, 본문 추출 캐시 키가 모두 이 규칙을 쓴다.
+규칙을 바꾸면 scripts/backfill_canonical.py --all 로 기존 행을 다시 계산할 것.
+"""
+import re
+import hashlib
+import unicodedata
+import urllib.parse
+
+# 추적/유입 경로용 쿼리 파라미터 (기사 식별과 무관)
+_TRACKING_PREFIXES = ("utm_",)
+_TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "igshid", "_ga", "ref", "ref_src", "cmpid",
+    "from", "cloc", "rc", "ntype", "nclick", "sns", "share",
+}
+
+_MOBILE_PREFIXES = ("m.", "mobile.", "www.")
+
+# 네이버 기사 ID 형태
+_NAVER_PATH_RE = re.compile(r"/(?:mnews/)?article/(?!comment/)(\d{3})/(\d{10})")
+_NAVER_HOST_SUFFIX = "naver.com"
+NAVER_CANONICAL = "https://n.news.naver.com/article/{oid}/{aid}"
+
+
+def _naver_article_id(host, path, query):
+    if not host.endswith(_NAVER_HOST_SUFFIX):
+        return None
+    m = _NAVER_PATH_RE.search(path)
+    if m:
+        return m.group(1), m.group(2)
+    params = dict(urllib.parse.parse_qsl(query))
+    oid, aid = params.get("oid"), params.get("aid")
+    if oid and aid and oid.isdigit() and aid.isdigit():
+        return oid, aid
+    return None
+
+
+def _strip_host(host):
+    host = host.lower().rstrip(".")
+    if host.endswith(":80") or host.endswith(":443"):
+        host = host.rsplit(":", 1)[0]
+    for prefix in _MOBILE_PREFIXES:
+        # m.example.com → example.com (최소 두 단계 도메인은 남김)
+        if host.startswith(prefix) and host.count(".") >= 2:
+            return host[len(prefix):]
+    return host
+
+
+def canonical_url(url):
+    """
+    같은 기사의 URL 변형을 하나로.
+    - 네이버 뉴스(n.news / m.news / news / entertain / sports, oid·aid 쿼리 포함) → n.news.naver.com/article/oid/aid
+    - 그 외: https 통일, 호스트 소문자화 + m./mobile./www. 제거, 기본 포트/fragment/끝 슬래시 제거,
+      추적용 파라미터 제거 후 파라미터 정렬
+    """
+    if not url:
+        return url
+    parts = urllib.parse.urlsplit(url.strip())
+    host = parts.netloc.lower()
+    naver_id = _naver_article_id(host, parts.path, parts.query)
+    if naver_id:
+        return NAVER_CANONICAL.format(oid=naver_id[0], aid=naver_id[1])
+
+    query = [
+        (k, v) for k, v in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in _TRACKING_PARAMS and not k.lower().startswith(_TRACKING_PREFIXES)
+    ]
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+    scheme = "https" if parts.scheme.lower() in ("http", "https") else parts.scheme.lower()
+    return urllib.parse.urlunsplit((
+        scheme,
+        _strip_host(host),
+        path,
+        urllib.parse.urlencode(sorted(query)),
+        "",
+    ))
+
+
+# [단독] (종합2보) 【속보】 <포토> 등 괄호로 감싼 말머리/꼬리표
+_BRACKETED_RE = re.compile(r"\[[^\]]*\]|\([^)]*\)|【[^】]*】|<[^>]*>|〈[^〉]*〉|《[^》]*》|「[^」]*」")
+# 한자(美·中·日 등)는 기사를 구분하는 글자라 남긴다
+_NON_WORD_RE = re.compile(r"[^0-9a-z가-힣\u4e00-\u9fff]+")
+
+
+def normalize_title(title):
+    """
+    비교용 제목: 말머리/괄호/문장부호/공백 제거, 소문자.
+    " - …" 같은 뒷부분은 부제일 수 있어 지우지 않는다 (네이버 검색 제목에는 언론사 꼬리표가 없음).
+    """
+    if not title:
+        return ""
+    text = unicodedata.normalize("NFKC", title)
+    text = _BRACKETED_RE.sub(" ", text)
+    return _NON_WORD_RE.sub("", text.lower())
+
+
+def title_fingerprint(title):
+    """정규화한 제목의 sha256. 정규화 후 남는 글자가 없으면 None."""
+    normalized = normalize_title(title)
+    if not normalized:
+        return None
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
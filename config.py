@@ -0,0 +1,137 @@
+"""
+설정 (환경변수 / .env)
+
+.env는 이 모듈에서 한 번만 읽고, 모든 설정값을 하나의 config 객체로 제공한다.
+각 모듈은 `from config import config` 후 config.DB_HOST 처럼 환경변수와 같은 이름으로 사용.
+환경변수는 프로세스 시작 시 한 번 읽으므로, 값을 바꾸려면 import 전에 설정할 것.
+"""
+import os
+
+from dotenv import load_dotenv
+
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+_CACHE_DIR = os.path.join(_SCRIPT_DIR, "cache")
+
+
+def _flag(value):
+    return value == "1"
+
+
+# (환경변수 이름, 변환 함수, 기본값 문자열)
+_SETTINGS = [
+    # ----- DB -----
+    ("DB_HOST", str, "localhost"),
+    ("DB_PORT", int, "3306"),
+    ("DB_USER", str, "root"),
+    ("DB_PASSWORD", str, ""),
+    ("DB_NAME", str, "news_db"),
+    ("DB_POOL_SIZE", int, "5"),
+    ("DB_POOL_TIMEOUT_SEC", float, "10"),
+    ("DB_POOL_MAX_LIFETIME_SEC", float, "1800"),
+    ("DB_POOL_PING_AFTER_SEC", float, "30"),
+    # 1이면 init_db에서 밀린 마이그레이션을 바로 적용 (기본: 경고만, scripts/migrate.py로 적용)
+    ("DB_AUTO_MIGRATE", _flag, "0"),
+    # 에피소드 검색: mysql(ngram FULLTEXT) / python(메모리 역색인, FULLTEXT가 없는 환경용)
+    ("SEARCH_BACKEND", str, "mysql"),
+    ("SEARCH_CACHE_SIZE", int, "256"),
+    ("SEARCH_CACHE_TTL_SEC", float, "60"),
+    # 최신성 가중치: 이 일수가 지날 때마다 점수 절반
+    ("SEARCH_RECENCY_HALF_LIFE_DAYS", float, "30"),
+    # 에피소드 일괄 저장: N건이 모이거나 T초가 지나면 한 트랜잭션으로 INSERT
+    ("EPISODE_WRITER_BATCH", int, "20"),
+    ("EPISODE_WRITER_FLUSH_SEC", float, "5"),
+    # ----- DB 오류 메일 알림 -----
+    ("ALERT_EMAIL", str, ""),
+    ("SMTP_EMAIL", str, ""),
+    ("SMTP_PASSWORD", str, ""),
+    # ----- SFTP 업로드 -----
+    ("SFTP_HOST", str, ""),
+    ("SFTP_PORT", int, "22"),
+    ("SFTP_USER", str, ""),
+    ("SFTP_PASSWORD", str, ""),
+    ("SFTP_KEY_FILE", str, ""),
+    ("SFTP_REMOTE_DIR", str, "/root/flask-app/static/podcast"),
+    ("SFTP_KEEPALIVE_SEC", int, "30"),
+    ("PODCAST_WEB_URL", str, "https://sosig.shop/podcast"),
+    # ----- 대본/오디오 -----
+    ("PODCAST_MODEL", str, "sonnet"),
+    ("FFMPEG_PATH", str, ""),
+    # ----- 카카오 메시지 -----
+    ("KAKAO_REST_API_KEY", str, ""),
+    # ----- HTTP 캐시 -----
+    ("HTTP_CACHE_ENABLED", _flag, "1"),
+    ("HTTP_CACHE_PATH", str, os.path.join(_CACHE_DIR, "http_cache.sqlite3")),
+    ("HTTP_CACHE_MAX_MB", float, "200"),
+    ("HTTP_CACHE_MAX_AGE_DAYS", float, "7"),
+    ("HTTP_CACHE_ARTICLE_TTL", int, "3600"),
+    # ----- 도메인별 요청 속도 -----
+    ("RATE_LIMIT_INITIAL", float, "0.5"),
+    ("RATE_LIMIT_MIN", float, "0.05"),
+    ("RATE_LIMIT_MAX", float, "5.0"),
+    ("RATE_LIMIT_BURST", float, "2"),
+    ("RATE_LIMIT_INCREASE", float, "0.05"),
+    ("RATE_LIMIT_BACKOFF", float, "0.5"),
+    ("RATE_LIMIT_STATE_PATH", str, os.path.join(_CACHE_DIR, "rate_limits.json")),
+    # ----- HTTP 연결 -----
+    ("HTTP_POOL_HOSTS", int, "32"),
+    ("HTTP_POOL_MAXSIZE", int, "8"),
+    ("HTTP_CONNECT_TIMEOUT", float, "5"),
+    ("HTTP_READ_TIMEOUT", float, "15"),
+    # ----- 크롤링 동시성 -----
+    ("FETCH_MAX_WORKERS", int, "8"),
+    ("FETCH_PER_HOST_LIMIT", int, "2"),
+    ("KEYWORD_WORKERS", int, "3"),
+    ("SEARCH_MAX_PAGES", int, "3"),
+    ("EXTRACT_WORKERS", int, str(min(4, os.cpu_count() or 1))),
+    # ----- 본문 추출 캐시 -----
+    ("EXTRACT_CACHE_ENABLED", _flag, "1"),
+    ("EXTRACT_CACHE_PATH", str, os.path.join(_CACHE_DIR, "extraction_cache.sqlite3")),
+    ("EXTRACT_CACHE_MAX_MB", float, "50"),
+    ("EXTRACT_NEGATIVE_TTL", int, str(6 * 3600)),
+    # ----- 키워드 워터마크 -----
+    ("WATERMARK_ENABLED", _flag, "1"),
+    ("WATERMARK_PATH", str, os.path.join(_CACHE_DIR, "watermarks.json")),
+    ("WATERMARK_QUIET_INTERVAL_MIN", float, "30"),
+    ("WATERMARK_QUIET_MAX_MIN", float, "240"),
+    ("WATERMARK_KEEP_LINKS", int, "50"),
+    # 본문을 받지 못한 기사를 멈춤 지점과 상관없이 다시 시도하는 기간(시간). EXTRACT_NEGATIVE_TTL보다 길게
+    ("WATERMARK_RETRY_HOURS", float, "24"),
+    # ----- 유사 기사 -----
+    ("NEAR_DUP_ENABLED", _flag, "1"),
+    ("NEAR_DUP_MAX_DISTANCE", int, "3"),
+    ("NEAR_DUP_DAYS", int, "7"),
+    # ----- 단계별 파이프라인 (fetch는 FETCH_MAX_WORKERS 사용) -----
+    ("PIPELINE_SCRIPT_WORKERS", int, "2"),
+    ("PIPELINE_RENDER_WORKERS", int, "1"),
+    ("PIPELINE_UPLOAD_WORKERS", int, "1"),
+    ("PIPELINE_RECORD_WORKERS", int, "1"),
+    ("PIPELINE_QUEUE_SIZE", int, "2"),
+    # ----- 기사별 단계 저널 -----
+    ("JOURNAL_ENABLED", _flag, "1"),
+    ("JOURNAL_PATH", str, os.path.join(_CACHE_DIR, "stage_journal.sqlite3")),
+    ("JOURNAL_AUDIO_DIR", str, os.path.join(_CACHE_DIR, "journal_audio")),
+    ("JOURNAL_MAX_ATTEMPTS", int, "3"),
+    # ----- 상주 모드 -----
+    ("DAEMON_DEFAULT_INTERVAL_MIN", float, "60"),
+    ("DAEMON_TICK_SEC", float, "30"),
+    ("DAEMON_REFRESH_MIN", float, "360"),
+]
+
+
+class Config:
+    """_SETTINGS의 각 항목을 같은 이름의 속성으로 가진 설정 객체."""
+
+    def __init__(self, environ=None):
+        environ = os.environ if environ is None else environ
+        for name, convert, default in _SETTINGS:
+            setattr(self, name, convert(environ.get(name, default)))
+
+    def as_dict(self, hide_secrets=True):
+        return {
+            name: ("***" if hide_secrets and "PASSWORD" in name and getattr(self, name) else getattr(self, name))
+            for name, _, _ in _SETTINGS
+        }
+
+
+load_dotenv()
+config = Config()
@@ -1,13 +1,17 @@
 import pymysql
-from datetime import datetime
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from datetime import datetime, date, timedelta
 import time
+import base64
+import atexit
 import hashlib
+import threading
 
-import os
-from dotenv import load_dotenv
+from config import config
+from canonical import canonical_url, title_fingerprint
+from dedup_index import DedupIndex
+from db_pool import ConnectionPool
+import db_migrate
+import search_index
 
 STATIC_PREFIX = "/root/flask-app/static/"
 
@@ -21,20 +25,30 @@ def normalize_mp3_path(mp3_path):
         return mp3_path[len(STATIC_PREFIX):]
     return mp3_path
 
-# Load environment variables
-load_dotenv()
-
 # Database Configuration
-DB_HOST = os.getenv("DB_HOST", "localhost")
-DB_PORT = int(os.getenv("DB_PORT", 3306))
-DB_USER = os.getenv("DB_USER", "root")
-DB_PASS = os.getenv("DB_PASSWORD", "")
-DB_NAME = os.getenv("DB_NAME", "news_db")
+DB_HOST = config.DB_HOST
+DB_PORT = config.DB_PORT
+DB_USER = config.DB_USER
+DB_PASS = config.DB_PASSWORD
+DB_NAME = config.DB_NAME
+
+# Connection Pool
+DB_POOL_SIZE = config.DB_POOL_SIZE
+DB_POOL_TIMEOUT_SEC = config.DB_POOL_TIMEOUT_SEC  # 모든 연결이 사용 중일 때 최대 대기
+DB_POOL_MAX_LIFETIME_SEC = config.DB_POOL_MAX_LIFETIME_SEC  # 이보다 오래된 연결은 반납 시 닫음
+DB_POOL_PING_AFTER_SEC = config.DB_POOL_PING_AFTER_SEC  # 이 시간 이상 놀던 연결은 ping 후 사용
+DB_AUTO_MIGRATE = config.DB_AUTO_MIGRATE  # 1이면 init_db에서 마이그레이션 적용
+
+# Search
+SEARCH_BACKEND = config.SEARCH_BACKEND  # mysql / python
+SEARCH_CACHE_SIZE = config.SEARCH_CACHE_SIZE
+SEARCH_CACHE_TTL_SEC = config.SEARCH_CACHE_TTL_SEC  # 다른 프로세스가 저장/삭제한 에피소드가 반영되는 최대 지연
+SEARCH_RECENCY_HALF_LIFE_DAYS = config.SEARCH_RECENCY_HALF_LIFE_DAYS
 
 # Email Alert Configuration
-ALERT_EMAIL = os.getenv("ALERT_EMAIL", "")  # 알림 받을 이메일
-SMTP_EMAIL = os.getenv("SMTP_EMAIL", "")    # Gmail 계정
-SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")  # Gmail 앱 비밀번호
+ALERT_EMAIL = config.ALERT_EMAIL  # 알림 받을 이메일
+SMTP_EMAIL = config.SMTP_EMAIL  # Gmail 계정
+SMTP_PASSWORD = config.SMTP_PASSWORD  # Gmail 앱 비밀번호
 
 # 알림 쿨다운 (중복 알림 방지)
 _last_alert_time = 0
@@ -55,6 +69,11 @@ def send_db_error_alert(error_message):
         return False
     
     try:
+        # 알림은 드물게 발생하므로 메일 모듈은 이때 import
+        import smtplib
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+
         msg = MIMEMultipart()
         msg['From'] = SMTP_EMAIL
         msg['To'] = ALERT_EMAIL
@@ -109,133 +128,717 @@ def get_connection():
         send_db_error_alert(error_msg)
         raise
 
-def _try_alter(cursor, sql, label):
-    try:
-        cursor.execute(sql)
-        print(f"[migrate] {label}")
-    except pymysql.err.OperationalError:
-        pass
+# ===== 커넥션 풀 =====
+# 아래 함수들은 풀에서 연결을 빌려 쓰고 반납한다. get_connection()은 단독 스크립트용 (직접 close).
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _pooled_connect():
+    conn = get_connection()
+    conn.autocommit(True)  # 재사용 연결에 이전 조회의 스냅샷이 남지 않도록
+    return conn
+
+
+def _is_connection_error(e):
+    return isinstance(e, (pymysql.err.OperationalError, pymysql.err.InterfaceError))
+
+
+def get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool(
+                _pooled_connect,
+                size=DB_POOL_SIZE,
+                timeout=DB_POOL_TIMEOUT_SEC,
+                max_lifetime=DB_POOL_MAX_LIFETIME_SEC,
+                ping_after=DB_POOL_PING_AFTER_SEC,
+                is_broken=_is_connection_error,
+            )
+            atexit.register(_pool.close)
+        return _pool
+
+
+def connection():
+    """
+    풀에서 연결을 빌려 쓰는 context manager.
+        with db_manager.connection() as conn:
+            with conn.cursor() as cursor: ...
+    autocommit 연결이므로 여러 문장을 묶으려면 conn.begin() → conn.commit().
+    """
+    return get_pool().connection()
+
+
+def get_pool_stats():
+    """풀 사용 통계 (대기 시간, 재사용률 등). 풀을 아직 안 썼으면 None."""
+    return _pool.stats() if _pool is not None else None
+
+
+def close_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+
+
+class PendingMigrationsError(RuntimeError):
+    """크롤러가 쓰는 컬럼/테이블을 만드는 마이그레이션이 아직 적용되지 않음."""
+
+
+# 적용 전이어도 돌아가는 마이그레이션 (해당 기능만 건너뛰거나 대체 경로 사용)
+# - episode_calendar : 달력 집계 쓰기를 건너뜀 (적용 후 scripts/rebuild_calendar.py)
+# - fulltext_ngram   : 검색이 메모리 역색인으로 대체
+_OPTIONAL_MIGRATIONS = {"episode_calendar", "fulltext_ngram"}
+
+# init_db에서 확인한 미적용 마이그레이션 이름 (적용 전이면 해당 기능의 쓰기를 건너뜀)
+_pending_migrations = set()
 
 
 def init_db():
-    """Initialize the database table if it doesn't exist."""
+    """
+    스키마가 최신인지 확인 (schema_migrations 조회 1번, DDL 없음).
+    적용은 python scripts/migrate.py 로 따로 한다. 필수 마이그레이션이 밀려 있으면
+    PendingMigrationsError → 없는 컬럼 때문에 Claude/TTS/업로드 비용만 쓰고 저장에 실패하는 일을 막는다.
+    선택 마이그레이션(_OPTIONAL_MIGRATIONS)만 밀려 있으면 경고 후 진행.
+    DB_AUTO_MIGRATE=1이면 여기서 바로 적용 (새 DB / 개발 환경용).
+    """
+    global _pending_migrations
+    with connection() as conn:
+        if DB_AUTO_MIGRATE:
+            db_migrate.migrate(conn)
+            _pending_migrations = set()
+            return
+        pending = db_migrate.check(conn)
+    _pending_migrations = {m.name for m in pending}
+    if not pending:
+        print("DB 스키마 최신 상태")
+        return
+    names = ", ".join(f"{m.version:04d}_{m.name}" for m in pending)
+    required = [m for m in pending if m.name not in _OPTIONAL_MIGRATIONS]
+    if required:
+        raise PendingMigrationsError(
+            f"적용되지 않은 DB 마이그레이션 {len(pending)}개: {names} → python scripts/migrate.py 실행 후 다시 시작하세요"
+        )
+    print(f"⚠️ 적용되지 않은 DB 마이그레이션 {len(pending)}개: {names}")
+    print("   해당 기능(달력 집계/ngram 검색)은 적용 전까지 제한됨 → python scripts/migrate.py 로 적용하세요")
+
+
+def pending_migrations():
+    """적용되지 않은 마이그레이션 목록 (전용 연결, 조회만)."""
     conn = get_connection()
     try:
-        with conn.cursor() as cursor:
-            sql = """
-            CREATE TABLE IF NOT EXISTS episodes (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                press VARCHAR(100),
-                title VARCHAR(255),
-                title_hash CHAR(64),
-                link VARCHAR(500) NOT NULL,
-                mp3_path VARCHAR(255),
-                duration_sec INT UNSIGNED,
-                summary VARCHAR(280),
-                keyword_id INT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE KEY uk_link (link),
-                INDEX idx_keyword_created (keyword_id, created_at),
-                INDEX idx_title_hash_created (title_hash, created_at),
-                INDEX idx_created_at (created_at),
-                FULLTEXT KEY ft_title (title)
-            )
-            """
-            cursor.execute(sql)
-
-            _try_alter(cursor, "ALTER TABLE episodes ADD COLUMN keyword_id INT",
-                       "add keyword_id")
-            _try_alter(cursor, "ALTER TABLE episodes ADD COLUMN title_hash CHAR(64) AFTER title",
-                       "add title_hash")
-            _try_alter(cursor, "ALTER TABLE episodes ADD COLUMN duration_sec INT UNSIGNED AFTER mp3_path",
-                       "add duration_sec")
-            _try_alter(cursor, "ALTER TABLE episodes ADD COLUMN summary VARCHAR(280) AFTER duration_sec",
-                       "add summary")
-            _try_alter(cursor, "ALTER TABLE episodes MODIFY COLUMN link VARCHAR(500) NOT NULL",
-                       "link → VARCHAR(500) NOT NULL")
-            _try_alter(cursor, "ALTER TABLE episodes ADD UNIQUE KEY uk_link (link)",
-                       "unique(link)")
-            _try_alter(cursor, "ALTER TABLE episodes ADD INDEX idx_title_hash_created (title_hash, created_at)",
-                       "index(title_hash, created_at)")
-            _try_alter(cursor, "ALTER TABLE episodes ADD FULLTEXT KEY ft_title (title)",
-                       "fulltext(title)")
-
-            _try_alter(cursor, "ALTER TABLE keywords ADD COLUMN topic VARCHAR(100)",
-                       "add keywords.topic")
-            cursor.execute("UPDATE keywords SET topic = keyword WHERE topic IS NULL")
+        return db_migrate.check(conn)
+    finally:
+        conn.close()
 
-        conn.commit()
-        print("Database table 'episodes' checked/created.")
+
+def run_migrations(target=None, dry_run=False):
+    """밀린 마이그레이션 적용 (scripts/migrate.py용, 풀 대신 전용 연결 사용). 적용한 목록 반환."""
+    conn = get_connection()
+    try:
+        return db_migrate.migrate(conn, target=target, dry_run=dry_run)
     finally:
         conn.close()
 
+# insert_episodes 행 단위 결과
+INSERTED = "inserted"
+DUPLICATE = "duplicate"
+FAILED = "failed"
+
+_INSERT_EPISODE_SQL = (
+    "INSERT INTO episodes "
+    "(press, title, title_hash, title_fingerprint, link, canonical_link, mp3_path, "
+    "duration_sec, summary, content_simhash, keyword_id) "
+    "VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)"
+)
+_LINK = 4  # _episode_row에서 link 위치
+
+
+def _episode_row(press, title, link, mp3_path, keyword_id=None,
+                 duration_sec=None, summary=None, content_simhash=None):
+    return (
+        press, title, compute_title_hash(title), title_fingerprint(title), link, canonical_url(link),
+        normalize_mp3_path(mp3_path), duration_sec, summary, content_simhash, keyword_id,
+    )
+
+
 def insert_episode(press, title, link, mp3_path, keyword_id=None,
-                   duration_sec=None, summary=None):
-    """Insert a new episode record."""
-    conn = get_connection()
+                   duration_sec=None, summary=None, content_simhash=None):
+    """Insert a new episode record. Returns INSERTED / DUPLICATE / FAILED."""
     try:
-        with conn.cursor() as cursor:
-            sql = ("INSERT INTO episodes "
-                   "(press, title, title_hash, link, mp3_path, duration_sec, summary, keyword_id) "
-                   "VALUES (%s,%s,%s,%s,%s,%s,%s,%s)")
-            cursor.execute(sql, (
-                press, title, compute_title_hash(title), link,
-                normalize_mp3_path(mp3_path), duration_sec, summary, keyword_id,
-            ))
-        conn.commit()
+        outcome, error = insert_episodes([dict(
+            press=press, title=title, link=link, mp3_path=mp3_path, keyword_id=keyword_id,
+            duration_sec=duration_sec, summary=summary, content_simhash=content_simhash,
+        )])[0]
+    except Exception as e:
+        outcome, error = FAILED, str(e)
+    if outcome == INSERTED:
         print(f"DB Logged: {title}")
-    except pymysql.err.IntegrityError as e:
+    elif outcome == DUPLICATE:
         # UNIQUE(link) 충돌 → 조용히 스킵
         print(f"DB Skip (duplicate link): {title}")
+    else:
+        print(f"DB Error: {error}")
+    return outcome
+
+
+def insert_episodes(episodes):
+    """
+    에피소드 여러 개를 한 트랜잭션으로 저장 (커밋 1회).
+    1) SELECT로 이미 있는 link 조회 → DUPLICATE
+    2) 나머지만 일반 INSERT를 executemany로 (ON DUPLICATE KEY 없음)
+    3) 같은 트랜잭션에서 달력 집계에 INSERT ... SELECT ... ON DUPLICATE KEY UPDATE로 더함
+    episodes: insert_episode 인자 dict 리스트
+    Returns: 입력 순서대로 [(INSERTED / DUPLICATE / FAILED, 오류 메시지 또는 None), ...]
+    도중에 오류가 나면(조회 후 다른 작업이 같은 link를 넣은 UNIQUE 충돌 등) 롤백하고 행마다 따로
+    INSERT + 집계 + 커밋을 다시 해서, 중복 키(1062)는 DUPLICATE, 그 밖의 실패 행만 FAILED로 돌려준다.
+    접속 자체가 안 되면 예외를 그대로 올린다.
+    """
+    rows = [_episode_row(**e) for e in episodes]
+    outcomes = [None] * len(rows)
+    first = {}
+    for i, row in enumerate(rows):
+        if row[_LINK] in first:
+            outcomes[i] = (DUPLICATE, None)  # 같은 묶음 안의 같은 link
+        else:
+            first[row[_LINK]] = i
+    pending = list(first.values())
+    if not pending:
+        return outcomes
+
+    with connection() as conn:
+        try:
+            conn.begin()
+            with conn.cursor() as cursor:
+                links = [rows[i][_LINK] for i in pending]
+                cursor.execute(f"SELECT link FROM episodes WHERE link {_in_clause(links)}", links)
+                existing = {r['link'] for r in cursor.fetchall()}
+                fresh = [i for i in pending if rows[i][_LINK] not in existing]
+                if fresh:
+                    # 조회 후 다른 작업이 먼저 넣은 link가 있으면 UNIQUE 충돌 → 아래에서 행 단위로 다시 저장
+                    cursor.executemany(_INSERT_EPISODE_SQL, [rows[i] for i in fresh])
+                    _add_to_calendar(cursor, [rows[i][_LINK] for i in fresh])
+            conn.commit()
+            for i in pending:
+                outcomes[i] = (DUPLICATE, None) if rows[i][_LINK] in existing else (INSERTED, None)
+        except Exception as e:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            if _is_connection_error(e):
+                raise
+            print(f"DB Error (insert_episodes, 행 단위로 재시도): {e}")
+            for i in pending:
+                outcomes[i] = _insert_one(conn, rows[i])
+
+    if _dedup_index is not None:
+        for row, (outcome, _) in zip(rows, outcomes):
+            if outcome == INSERTED:
+                _dedup_index.add(row[_LINK + 1], _title_keys(row[1]))
+    if any(outcome == INSERTED for outcome, _ in outcomes):
+        _on_episodes_inserted([row[_LINK] for row, (outcome, _) in zip(rows, outcomes) if outcome == INSERTED])
+    return outcomes
+
+
+def _insert_one(conn, row):
+    try:
+        conn.begin()
+        with conn.cursor() as cursor:
+            cursor.execute(_INSERT_EPISODE_SQL, row)
+            _add_to_calendar(cursor, [row[_LINK]])
+        conn.commit()
+        return INSERTED, None
     except Exception as e:
-        print(f"DB Error: {e}")
-    finally:
-        conn.close()
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+        if isinstance(e, pymysql.err.IntegrityError) and e.args and e.args[0] == 1062:  # ER_DUP_ENTRY
+            return DUPLICATE, None
+        return FAILED, str(e)
 
-def is_duplicate_news(link):
-    """Check if news article already exists in DB by link."""
+
+# ===== 달력 집계 (episode_calendar) =====
+# (날짜, keyword_id)별 에피소드 수/재생 시간 합계. keyword_id가 없는 에피소드는 0으로 집계.
+# 에피소드 저장과 같은 트랜잭션에서 더하고, 정리(cleanup_old_podcasts)에서 뺀다.
+_CALENDAR_GROUP_SQL = (
+    "SELECT DATE(created_at) AS d, COALESCE(keyword_id, 0) AS k, COUNT(*) AS n, "
+    "COALESCE(SUM(duration_sec), 0) AS s FROM episodes {where} GROUP BY d, k"
+)
+
+
+def _calendar_ready():
+    return "episode_calendar" not in _pending_migrations
+
+
+def _add_to_calendar(cursor, links):
+    """방금 넣은 에피소드(link)를 집계에 더한다. created_at은 DB 시각 기준."""
+    if not links or not _calendar_ready():
+        return
+    cursor.execute(
+        "INSERT INTO episode_calendar (day, keyword_id, episode_count, total_duration_sec) SELECT * FROM ("
+        + _CALENDAR_GROUP_SQL.format(where=f"WHERE link {_in_clause(links)}")
+        + ") AS t ON DUPLICATE KEY UPDATE episode_count = episode_count + n, total_duration_sec = total_duration_sec + s",
+        links,
+    )
+
+
+def get_calendar_counts(keyword_id=None, start=None, end=None):
+    """
+    달력 API용 {'YYYY-MM-DD': 에피소드 수}. start/end(date 또는 'YYYY-MM-DD')로 범위 제한.
+    episode_calendar의 (day, keyword_id) / (keyword_id, day) 인덱스 범위 조회라 에피소드 수와 무관하게 빠르다.
+    """
+    where, params = [], []
+    if keyword_id is not None:
+        where.append("keyword_id = %s")
+        params.append(keyword_id)
+    if start is not None:
+        where.append("day >= %s")
+        params.append(start)
+    if end is not None:
+        where.append("day <= %s")
+        params.append(end)
+    sql = "SELECT day, SUM(episode_count) AS cnt FROM episode_calendar"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += " GROUP BY day HAVING cnt > 0 ORDER BY day"
+    with connection() as conn:
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(sql, params)
+                return {r['day'].strftime('%Y-%m-%d'): int(r['cnt']) for r in cursor.fetchall()}
+        except Exception as e:
+            print(f"DB Error (get_calendar_counts): {e}")
+            return {}
+
+
+def _calendar_since(days):
+    """rebuild/check 범위 조건 (days가 없으면 전체)."""
+    if days is None:
+        return "", "", ()
+    return ("WHERE created_at >= CURDATE() - INTERVAL %s DAY", "WHERE day >= CURDATE() - INTERVAL %s DAY",
+            (days,))
+
+
+def check_calendar(days=None):
+    """집계와 실제 에피소드의 차이 [(day, keyword_id, 집계 (수, 시간), 실제 (수, 시간))]. 전용 연결 사용."""
+    episodes_where, calendar_where, params = _calendar_since(days)
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
-            sql = "SELECT 1 FROM episodes WHERE link = %s LIMIT 1"
-            cursor.execute(sql, (link,))
-            return cursor.fetchone() is not None
-    except Exception as e:
-        print(f"DB Error (is_duplicate_news): {e}")
-        return False  # If error, allow processing
+            cursor.execute(_CALENDAR_GROUP_SQL.format(where=episodes_where), params)
+            actual = {(r['d'], r['k']): (int(r['n']), int(r['s'])) for r in cursor.fetchall()}
+            cursor.execute(
+                f"SELECT day, keyword_id, episode_count, total_duration_sec FROM episode_calendar {calendar_where}",
+                params,
+            )
+            stored = {(r['day'], r['keyword_id']): (int(r['episode_count']), int(r['total_duration_sec']))
+                      for r in cursor.fetchall()}
     finally:
         conn.close()
+    drift = []
+    for key in sorted(set(actual) | set(stored)):
+        have, want = stored.get(key, (0, 0)), actual.get(key, (0, 0))
+        if have != want:
+            drift.append((key[0], key[1], have, want))
+    return drift
 
-def is_duplicate_title_recent(title, days=7):
-    """최근 N일 내 동일 제목 에피소드 존재 여부 (Claude/TTS 재비용 방지)."""
+
+def rebuild_calendar(days=None):
+    """집계를 episodes에서 다시 계산 (days가 있으면 최근 N일만). 한 트랜잭션. 집계 행 수 반환."""
+    episodes_where, calendar_where, params = _calendar_since(days)
     conn = get_connection()
     try:
         with conn.cursor() as cursor:
-            sql = ("SELECT 1 FROM episodes "
-                   "WHERE title_hash = %s AND created_at >= DATE_SUB(NOW(), INTERVAL %s DAY) "
-                   "LIMIT 1")
-            cursor.execute(sql, (compute_title_hash(title), days))
-            return cursor.fetchone() is not None
-    except Exception as e:
-        print(f"DB Error (is_duplicate_title_recent): {e}")
-        return False
+            cursor.execute(f"DELETE FROM episode_calendar {calendar_where}", params)
+            rows = cursor.execute(
+                "INSERT INTO episode_calendar (day, keyword_id, episode_count, total_duration_sec) "
+                + _CALENDAR_GROUP_SQL.format(where=episodes_where),
+                params,
+            )
+        conn.commit()
+        return rows
+    except Exception:
+        conn.rollback()
+        raise
     finally:
         conn.close()
 
+# ===== 에피소드 목록 (플레이어 API) =====
+# OFFSET은 앞 페이지 행을 모두 읽고 버리므로 깊은 페이지일수록 느려진다.
+# 대신 마지막으로 본 (created_at, id) 다음부터 읽는 keyset 페이지네이션을 쓴다.
+# 1) idx_keyword_created (keyword_id, created_at [, id]) / idx_created_at (created_at [, id])만으로
+#    페이지의 id를 고르고 (InnoDB 보조 인덱스에는 PK가 붙어 있어 테이블을 읽지 않는 커버링 조회)
+# 2) 고른 limit개만 PK로 읽어 플레이어에 필요한 컬럼을 가져온다 (deferred join)
+_EPISODE_LIST_COLUMNS = "e.id, e.title, e.press, e.link, e.mp3_path, e.duration_sec, e.summary, e.created_at"
+_CURSOR_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _encode_cursor(created_at, episode_id):
+    raw = f"{created_at.strftime(_CURSOR_TIME_FORMAT)}|{episode_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor):
+    """잘못된 커서면 ValueError."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, episode_id = raw.split("|")
+        return datetime.strptime(created_at, _CURSOR_TIME_FORMAT), int(episode_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"잘못된 페이지 커서: {cursor}") from e
+
+
+def _as_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def list_episodes(keyword_id=None, start=None, end=None, cursor=None, limit=20):
+    """
+    최신순 에피소드 목록 한 페이지.
+    keyword_id / start, end(date 또는 'YYYY-MM-DD', 양쪽 포함)로 거르고,
+    cursor는 이전 호출이 돌려준 next_cursor (없으면 첫 페이지).
+    Returns: (에피소드 dict 리스트, next_cursor 또는 None)
+    페이지 깊이와 관계없이 인덱스에서 limit+1개만 읽는다. 잘못된 cursor면 ValueError.
+    """
+    limit = max(1, min(int(limit), 100))
+    where, params = [], []
+    if keyword_id is not None:
+        where.append("keyword_id = %s")
+        params.append(keyword_id)
+    if start is not None:
+        where.append("created_at >= %s")
+        params.append(_as_date(start))
+    if end is not None:
+        where.append("created_at < %s")
+        params.append(_as_date(end) + timedelta(days=1))
+    if cursor:
+        after_time, after_id = _decode_cursor(cursor)
+        where.append("(created_at < %s OR (created_at = %s AND id < %s))")
+        params.extend([after_time, after_time, after_id])
+    sql = (
+        f"SELECT {_EPISODE_LIST_COLUMNS} FROM episodes e JOIN ("
+        f"SELECT id FROM episodes {'WHERE ' + ' AND '.join(where) if where else ''} "
+        f"ORDER BY created_at DESC, id DESC LIMIT %s"
+        f") AS page ON page.id = e.id ORDER BY e.created_at DESC, e.id DESC"
+    )
+    params.append(limit + 1)  # 1개 더 읽어 다음 페이지가 있는지 확인
+    with connection() as conn:
+        try:
+            with conn.cursor() as cur:
+                cur.execute(sql, params)
+                rows = cur.fetchall()
+        except Exception as e:
+            print(f"DB Error (list_episodes): {e}")
+            return [], None
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, _encode_cursor(rows[-1]['created_at'], rows[-1]['id'])
+
+
+# ===== 에피소드 검색 =====
+# 제목 + 요약에 대한 ngram FULLTEXT (마이그레이션 0005). 각 단어를 구(phrase)로 모두 요구하고,
+# 관련도 × 최신성 가중치(SEARCH_RECENCY_HALF_LIFE_DAYS마다 절반) 순으로 정렬.
+# FULLTEXT를 쓸 수 없으면 search_index.InvertedIndex(메모리)로 같은 규칙을 적용한다.
+_search_cache = search_index.ResultCache(SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL_SEC)
+_search_index = None  # 메모리 역색인 (python 백엔드에서 처음 검색할 때 적재)
+_search_index_lock = threading.Lock()
+_search_fallback = False  # FULLTEXT 인덱스가 없어 이번 프로세스는 메모리 역색인 사용
+
+# FULLTEXT 인덱스 없음 / 엔진이 FULLTEXT 미지원
+_NO_FULLTEXT_ERRORS = {1191, 1214}
+
+_SEARCH_SQL = (
+    f"SELECT {_EPISODE_LIST_COLUMNS}, hit.score FROM episodes e JOIN ("
+    "SELECT id, MATCH(title, summary) AGAINST (%s IN BOOLEAN MODE) "
+    "* POW(0.5, TIMESTAMPDIFF(HOUR, created_at, NOW()) / (24 * %s)) AS score "
+    "FROM episodes WHERE MATCH(title, summary) AGAINST (%s IN BOOLEAN MODE) {keyword} "
+    "ORDER BY score DESC, id DESC LIMIT %s"
+    ") AS hit ON hit.id = e.id ORDER BY hit.score DESC, e.id DESC"
+)
+
+
+def _use_python_search():
+    return SEARCH_BACKEND == "python" or _search_fallback or "fulltext_ngram" in _pending_migrations
+
+
+def search_episodes(query, keyword_id=None, limit=20):
+    """
+    제목/요약 검색. 검색어의 단어가 모두 들어 있는 에피소드를 관련도 × 최신성 순으로.
+    Returns: list_episodes와 같은 컬럼 + score. 결과는 SEARCH_CACHE_TTL_SEC 동안 캐시
+    (이 프로세스에서 에피소드를 저장하면 바로 비움).
+    """
+    global _search_fallback
+    terms = search_index.query_terms(query)
+    if not terms:
+        return []
+    limit = max(1, min(int(limit), 100))
+    key = (" ".join(terms), keyword_id, limit)
+    cached = _search_cache.get(key)
+    if cached is not None:
+        return cached
+
+    if _use_python_search():
+        results = _search_in_memory(terms, keyword_id, limit)
+    else:
+        # 각 단어를 구로 요구 → ngram 파서에서 단어의 2-gram이 연속으로 있어야 일치
+        boolean = " ".join(f'+"{t}"' for t in terms)
+        keyword = "AND keyword_id = %s" if keyword_id is not None else ""
+        params = [boolean, SEARCH_RECENCY_HALF_LIFE_DAYS, boolean]
+        params += [keyword_id] if keyword_id is not None else []
+        params.append(limit)
+        with connection() as conn:
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute(_SEARCH_SQL.format(keyword=keyword), params)
+                    results = cursor.fetchall()
+            except pymysql.err.MySQLError as e:
+                if not (e.args and e.args[0] in _NO_FULLTEXT_ERRORS):
+                    print(f"DB Error (search_episodes): {e}")
+                    return []
+                print("⚠️ ngram FULLTEXT 인덱스 없음 → 메모리 역색인으로 검색 (scripts/migrate.py로 0005 적용)")
+                _search_fallback = True
+                results = None
+        if results is None:
+            results = _search_in_memory(terms, keyword_id, limit)
+    _search_cache.put(key, results)
+    return results
+
+
+def _get_search_index():
+    """메모리 역색인 (처음 호출 때 episodes 전체를 한 번 읽어 만든다)."""
+    global _search_index
+    with _search_index_lock:
+        if _search_index is None:
+            index = search_index.InvertedIndex()
+            with connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT id, title, summary, keyword_id, created_at FROM episodes")
+                    for r in cursor.fetchall():
+                        index.add(r['id'], f"{r['title'] or ''} {r['summary'] or ''}",
+                                  r['created_at'].timestamp(), r['keyword_id'])
+            _search_index = index
+        return _search_index
+
+
+def _search_in_memory(terms, keyword_id, limit):
+    try:
+        hits = _get_search_index().search(" ".join(terms), keyword_id=keyword_id, limit=limit,
+                                          half_life_days=SEARCH_RECENCY_HALF_LIFE_DAYS)
+        if not hits:
+            return []
+        ids = [doc_id for doc_id, _ in hits]
+        with connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(f"SELECT {_EPISODE_LIST_COLUMNS} FROM episodes e WHERE e.id {_in_clause(ids)}", ids)
+                rows = {r['id']: r for r in cursor.fetchall()}
+    except Exception as e:
+        print(f"DB Error (search_episodes, 메모리 역색인): {e}")
+        return []
+    return [dict(rows[doc_id], score=score) for doc_id, score in hits if doc_id in rows]
+
+
+def _on_episodes_inserted(links):
+    """검색 캐시 비우기 + 메모리 역색인이 있으면 새 에피소드 추가."""
+    _search_cache.clear()
+    if _search_index is None:
+        return
+    try:
+        with connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT id, title, summary, keyword_id, created_at FROM episodes WHERE link {_in_clause(links)}",
+                    links,
+                )
+                for r in cursor.fetchall():
+                    _search_index.add(r['id'], f"{r['title'] or ''} {r['summary'] or ''}",
+                                      r['created_at'].timestamp(), r['keyword_id'])
+    except Exception as e:
+        print(f"DB Error (검색 색인 갱신): {e}")
+
+
+def get_search_stats():
+    return _search_cache.stats()
+
+
+def _title_keys(title):
+    """제목 중복 판정 키: 원문 제목 해시 + 정규화 제목 지문 (정규화 후 빈 제목이면 해시만)."""
+    if not title:
+        return ()
+    fingerprint = title_fingerprint(title)
+    return (compute_title_hash(title), fingerprint) if fingerprint else (compute_title_hash(title),)
+
+
+# ===== 실행 단위 메모리 중복 색인 =====
+_dedup_index = None
+
+
+def preload_dedup_index(days=7):
+    """
+    전체 canonical link(블룸 필터)와 최근 N일 canonical link/제목 키(set)를 한 번의 조회로 적재.
+    이후 중복 확인은 메모리에서 답하고, 블룸 필터 양성만 DB로 확인한다.
+    canonical_link / title_fingerprint가 아직 비어 있는 행(backfill 전)은 여기서 계산해 채운다.
+    """
+    global _dedup_index
+    with connection() as conn:
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    "SELECT link, canonical_link, title, title_hash, title_fingerprint, "
+                    "created_at >= DATE_SUB(NOW(), INTERVAL %s DAY) AS recent FROM episodes",
+                    (days,),
+                )
+                rows = cursor.fetchall()
+        except Exception as e:
+            print(f"DB Error (preload_dedup_index): {e}")
+            _dedup_index = None
+            return None
+
+    all_links, recent_links, recent_titles = [], [], []
+    for r in rows:
+        canonical = r['canonical_link'] or canonical_url(r['link'])
+        all_links.append(canonical)
+        if r['recent']:
+            recent_links.append(canonical)
+            if r['title_hash']:
+                recent_titles.append(r['title_hash'])
+            fingerprint = r['title_fingerprint'] or title_fingerprint(r['title'])
+            if fingerprint:
+                recent_titles.append(fingerprint)
+    _dedup_index = DedupIndex(all_links, recent_links, recent_titles, days)
+    stats = _dedup_index.stats()
+    print(f"🧠 중복 색인 적재: 전체 {len(rows)}건 (최근 {days}일 {len(recent_links)}건), "
+          f"블룸 필터 {stats['bloom_bytes'] / 1024:.0f}KB")
+    return _dedup_index
+
+
+def get_dedup_stats():
+    """메모리 색인으로 답한 조회 수 / DB로 확인한 조회 수. 색인이 없으면 None."""
+    return _dedup_index.stats() if _dedup_index is not None else None
+
+
+def is_duplicate_news(link):
+    """Check if news article already exists in DB by link (canonical URL 기준)."""
+    return link in find_duplicate_keys([link], [])[0]
+
+def is_duplicate_title_recent(title, days=7):
+    """최근 N일 내 동일(정규화) 제목 에피소드 존재 여부 (Claude/TTS 재비용 방지)."""
+    return title in find_duplicate_keys([], [title], days=days)[1]
+
+def filter_new_candidates(candidates, days=7):
+    """
+    검색 결과 한 페이지의 (link, title) 쌍을 한 번에 중복 확인 (DB 왕복 최대 1회).
+    link는 canonical URL로, 제목은 최근 N일 안의 원문 해시/정규화 지문으로 비교.
+    Returns: (새 후보 리스트(입력 순서 유지), {중복 후보: 'link' 또는 'title'})
+    """
+    dup_links, dup_titles = find_duplicate_keys(
+        [link for link, _ in candidates], [title for _, title in candidates], days=days
+    )
+    new, duplicates = [], {}
+    for candidate in candidates:
+        link, title = candidate
+        if link and link in dup_links:
+            duplicates[candidate] = "link"
+        elif title and title in dup_titles:
+            duplicates[candidate] = "title"
+        else:
+            new.append(candidate)
+    return new, duplicates
+
+
+def _in_clause(values):
+    return f"IN ({','.join(['%s'] * len(values))})"
+
+
+def find_duplicate_keys(links, titles, days=7):
+    """
+    link / 최근 N일 제목 중복을 한 문장(UNION ALL)으로 확인 → 메모리 색인으로 못 답한 것만 DB 왕복 1회.
+    각 분기는 인덱스 하나씩 탄다: uk_link, idx_canonical_link, idx_title_hash_created, idx_title_fp_created.
+    link는 canonical URL, 제목은 원문 해시 또는 정규화 지문이 같으면 중복.
+    Returns: (중복인 입력 link 집합, 중복인 입력 title 집합). DB 오류 시 중복 아님으로 처리.
+    """
+    link_keys = {l: canonical_url(l) for l in links if l}
+    title_keys = {t: _title_keys(t) for t in titles if t}
+    found_links, found_titles = set(), set()
+    if _dedup_index is not None:
+        # 메모리 색인으로 답할 수 있는 것은 빼고 나머지만 DB로
+        dup, unsure = _dedup_index.classify_links(set(link_keys.values()))
+        found_links = {l for l, c in link_keys.items() if c in dup}
+        link_keys = {l: c for l, c in link_keys.items() if c in unsure}
+        if _dedup_index.covers_days(days):
+            hits = _dedup_index.recent_titles(list(title_keys.values()))
+            found_titles = {t for t, keys in title_keys.items() if hits.intersection(keys)}
+            title_keys = {}
+        else:
+            _dedup_index.count_db_lookups(len(title_keys))
+    if not link_keys and not title_keys:
+        return found_links, found_titles
+
+    branches, params = [], []
+    if link_keys:
+        raw, canon = list(link_keys), list(set(link_keys.values()))
+        branches.append(f"SELECT 'L' AS kind, link AS k FROM episodes WHERE link {_in_clause(raw)}")
+        branches.append(f"SELECT 'L', canonical_link FROM episodes WHERE canonical_link {_in_clause(canon)}")
+        params += raw + canon
+    if title_keys:
+        hashes = list({keys[0] for keys in title_keys.values()})
+        fingerprints = list({keys[1] for keys in title_keys.values() if len(keys) > 1})
+        window = "created_at >= DATE_SUB(NOW(), INTERVAL %s DAY)"
+        branches.append(f"SELECT 'T', title_hash FROM episodes WHERE title_hash {_in_clause(hashes)} AND {window}")
+        params += hashes + [days]
+        if fingerprints:
+            branches.append(
+                f"SELECT 'T', title_fingerprint FROM episodes "
+                f"WHERE title_fingerprint {_in_clause(fingerprints)} AND {window}"
+            )
+            params += fingerprints + [days]
+    with connection() as conn:
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(" UNION ALL ".join(branches), params)
+                rows = cursor.fetchall()
+        except Exception as e:
+            print(f"DB Error (find_duplicate_keys): {e}")
+            return found_links, found_titles
+    link_hits = {r['k'] for r in rows if r['kind'] == 'L'}
+    title_hits = {r['k'] for r in rows if r['kind'] == 'T'}
+    found_links |= {l for l, c in link_keys.items() if l in link_hits or c in link_hits}
+    found_titles |= {t for t, keys in title_keys.items() if title_hits.intersection(keys)}
+    return found_links, found_titles
+
+def get_recent_simhashes(days=7):
+    """최근 N일 에피소드의 본문 지문 [(content_simhash, title, created_at epoch), ...] (유사 기사 색인용)."""
+    with connection() as conn:
+        try:
+            with conn.cursor() as cursor:
+                sql = ("SELECT content_simhash, title, UNIX_TIMESTAMP(created_at) AS created_ts FROM episodes "
+                       "WHERE created_at >= DATE_SUB(NOW(), INTERVAL %s DAY) AND content_simhash IS NOT NULL")
+                cursor.execute(sql, (days,))
+                return [(r['content_simhash'], r['title'], float(r['created_ts'])) for r in cursor.fetchall()]
+        except Exception as e:
+            print(f"DB Error (get_recent_simhashes): {e}")
+            return []
+
 def get_active_keywords():
     """Fetch all keywords sorted by priority (highest first)."""
-    conn = get_connection()
     keywords = []
-    try:
-        with conn.cursor() as cursor:
-            # COALESCE: topic이 NULL이면 keyword 값을 사용
-            sql = "SELECT id, keyword, COALESCE(topic, keyword) as topic, requirements FROM keywords WHERE priority > 0 ORDER BY priority DESC"
-            cursor.execute(sql)
-            keywords = cursor.fetchall()
-    except Exception as e:
-        print(f"DB Error (get_keywords): {e}")
-    finally:
-        conn.close()
+    with connection() as conn:
+        try:
+            with conn.cursor() as cursor:
+                # COALESCE: topic이 NULL이면 keyword 값을 사용
+                sql = "SELECT id, keyword, COALESCE(topic, keyword) as topic, requirements, crawl_interval_min FROM keywords WHERE priority > 0 ORDER BY priority DESC"
+                cursor.execute(sql)
+                keywords = cursor.fetchall()
+        except Exception as e:
+            print(f"DB Error (get_keywords): {e}")
     return keywords
 
 if __name__ == "__main__":
@@ -0,0 +1,157 @@
+"""
+버전별 DB 스키마 마이그레이션
+
+migrations/NNNN_설명.sql 파일을 번호 순으로 한 번씩 적용하고 schema_migrations 테이블에 기록한다.
+- 시작 시에는 check()로 schema_migrations 한 번만 조회 (DDL 없음) → 밀린 마이그레이션이 있으면 경고
+- 무거운 DDL(MODIFY COLUMN, 인덱스 추가 등)은 migrate 명령으로 따로 실행:
+      python scripts/migrate.py            # 밀린 마이그레이션 적용
+      python scripts/migrate.py status     # 적용 현황
+- 파일은 여러 번 실행해도 되게 작성한다. "이미 있음" 오류(컬럼/인덱스/테이블 중복)는 적용된 것으로 본다
+  → 중간에 실패해도 고친 뒤 migrate를 다시 실행하면 이어서 진행
+- MySQL DDL은 트랜잭션으로 묶이지 않으므로 문장 단위로 실행하고, 파일이 끝까지 성공하면 기록한다
+"""
+import os
+import re
+import time
+import hashlib
+
+import pymysql
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
+# 이미 적용된 것으로 보는 오류: 테이블 중복, 컬럼 중복, 인덱스 이름 중복, PK 중복, 지울 대상 없음
+_ALREADY_APPLIED = {1050, 1060, 1061, 1068, 1091}
+_NO_SUCH_TABLE = 1146
+# 두 프로세스가 동시에 migrate하지 않도록 (MySQL 이름 잠금)
+_LOCK_NAME = "news_crawler_schema_migrations"
+
+_FILE_RE = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+
+class Migration:
+    def __init__(self, version, name, path):
+        self.version = version
+        self.name = name
+        self.path = path
+        with open(path, encoding="utf-8") as f:
+            self.sql = f.read()
+        self.checksum = hashlib.sha256(self.sql.encode("utf-8")).hexdigest()
+
+    def statements(self):
+        """';'로 끝나는 줄 단위로 문장 분리 (-- 주석 줄 제외)."""
+        statements, current = [], []
+        for line in self.sql.splitlines():
+            if line.strip().startswith("--"):
+                continue
+            current.append(line)
+            if line.rstrip().endswith(";"):
+                statements.append("\n".join(current).strip().rstrip(";"))
+                current = []
+        tail = "\n".join(current).strip()
+        if tail:
+            statements.append(tail)
+        return [s for s in statements if s]
+
+
+_migrations = None
+
+
+def load_migrations():
+    """migrations/의 파일을 번호 순으로 (한 번 읽고 재사용)."""
+    global _migrations
+    if _migrations is None:
+        found = []
+        for filename in sorted(os.listdir(MIGRATIONS_DIR)):
+            m = _FILE_RE.match(filename)
+            if m:
+                found.append(Migration(int(m.group(1)), m.group(2), os.path.join(MIGRATIONS_DIR, filename)))
+        versions = [m.version for m in found]
+        if len(versions) != len(set(versions)):
+            raise ValueError(f"마이그레이션 번호 중복: {versions}")
+        _migrations = found
+    return _migrations
+
+
+def _ensure_table(cursor):
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INT PRIMARY KEY,
+            name VARCHAR(200) NOT NULL,
+            checksum CHAR(64) NOT NULL,
+            duration_ms INT UNSIGNED,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+def applied(conn):
+    """{version: row} - schema_migrations가 없으면 빈 dict."""
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT version, name, checksum, duration_ms, applied_at FROM schema_migrations")
+            return {r["version"]: r for r in cursor.fetchall()}
+    except pymysql.err.MySQLError as e:
+        if e.args and e.args[0] == _NO_SUCH_TABLE:
+            return {}
+        raise
+
+
+def check(conn):
+    """적용되지 않은 마이그레이션 목록 (시작 시 확인용, 조회 1번)."""
+    done = applied(conn)
+    return [m for m in load_migrations() if m.version not in done]
+
+
+def _execute(cursor, statement):
+    try:
+        cursor.execute(statement)
+    except pymysql.err.MySQLError as e:
+        if e.args and e.args[0] in _ALREADY_APPLIED:
+            return False
+        raise
+    return True
+
+
+def migrate(conn, target=None, dry_run=False):
+    """
+    밀린 마이그레이션을 번호 순으로 적용 (target이 있으면 그 번호까지). 적용한 Migration 목록 반환.
+    실패하면 예외를 올리고, 그 파일은 기록하지 않는다 (다시 실행하면 그 파일부터).
+    """
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT GET_LOCK(%s, 0) AS got", (_LOCK_NAME,))
+        if not cursor.fetchone()["got"]:
+            raise RuntimeError("다른 프로세스가 마이그레이션 중입니다")
+    try:
+        with conn.cursor() as cursor:
+            _ensure_table(cursor)
+        pending = [m for m in check(conn) if target is None or m.version <= target]
+        for m in pending:
+            print(f"[migrate] {m.version:04d} {m.name}{' (dry-run)' if dry_run else ''}")
+            if dry_run:
+                continue
+            started = time.time()
+            with conn.cursor() as cursor:
+                for statement in m.statements():
+                    if not _execute(cursor, statement):
+                        print(f"   이미 적용됨: {statement.splitlines()[0][:80]}")
+                    conn.commit()
+                cursor.execute(
+                    "INSERT INTO schema_migrations (version, name, checksum, duration_ms) VALUES (%s, %s, %s, %s)",
+                    (m.version, m.name, m.checksum, int((time.time() - started) * 1000)),
+                )
+            conn.commit()
+            print(f"   완료 ({time.time() - started:.1f}초)")
+        return pending
+    finally:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (_LOCK_NAME,))
+
+
+def status(conn):
+    """[(Migration, 적용 기록 또는 None, 적용 후 파일 변경 여부)]"""
+    done = applied(conn)
+    rows = []
+    for m in load_migrations():
+        row = done.get(m.version)
+        rows.append((m, row, row is not None and row["checksum"] != m.checksum))
+    return rows
@@ -0,0 +1,184 @@
+"""
+스레드 안전 DB 커넥션 풀
+
+db_manager의 함수마다 새로 접속(TCP 핸드셰이크 + MySQL 인증)하던 것을 풀에서 빌려 쓰도록 한다.
+- 최대 size개까지 만들고, 모두 사용 중이면 timeout초까지 반납을 기다림
+- 오래 놀던 연결은 빌려줄 때 ping으로 확인 → 끊겼으면 버리고 새로 접속
+- max_lifetime초보다 오래된 연결은 반납 시 닫음 (서버 wait_timeout / 장애 조치 대비)
+- 사용 중 접속 오류(OperationalError/InterfaceError)가 난 연결은 풀에 돌려놓지 않음
+- 대기 시간, 재사용률(hit rate) 등은 stats()로 확인
+
+풀의 연결은 autocommit으로 연다 → 재사용 시 이전 조회의 스냅샷(REPEATABLE READ)이 남지 않음.
+여러 문장을 한 트랜잭션으로 묶을 때는 conn.begin() 후 commit()/rollback().
+"""
+import time
+import threading
+from contextlib import contextmanager
+
+
+class PoolTimeout(Exception):
+    """timeout 안에 빌릴 수 있는 연결이 없음."""
+
+
+class ConnectionPool:
+    def __init__(self, connect, size=5, timeout=10.0, max_lifetime=1800.0, ping_after=30.0,
+                 is_broken=None):
+        """
+        connect      : 새 연결을 만드는 함수
+        ping_after   : 이 시간(초) 이상 놀던 연결은 빌려주기 전에 ping
+        is_broken(e) : 예외가 연결 자체의 문제인지 (True면 반납하지 않고 닫음)
+        """
+        self._connect = connect
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.ping_after = ping_after
+        self._is_broken = is_broken or (lambda e: False)
+        self._idle = []  # [(conn, created_at, released_at)] - 끝이 가장 최근 반납
+        self._born = {}  # id(conn) → created_at
+        self._opened = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._stats = dict.fromkeys(
+            ("acquired", "reused", "created", "waited", "timeouts", "ping_failed", "expired", "discarded"), 0
+        )
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    # ===== 빌리기 / 반납 =====
+    def acquire(self):
+        began = time.time()
+        deadline = began + self.timeout
+        waited = False
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise PoolTimeout("풀이 닫혔습니다")
+                if self._idle:
+                    conn, created_at, released_at = self._idle.pop()
+                    break
+                if self._opened < self.size:
+                    self._opened += 1
+                    conn = None
+                    break
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    raise PoolTimeout(f"DB 커넥션 풀 대기 시간 초과 ({self.timeout:g}초, 크기 {self.size})")
+                waited = True
+                self._cond.wait(remaining)
+            self._record_wait(time.time() - began, waited)
+
+        if conn is not None and time.time() - released_at >= self.ping_after and not self._ping(conn):
+            conn = None  # 슬롯은 유지한 채 새로 접속
+        if conn is None:
+            try:
+                conn = self._open()
+            except Exception:
+                with self._cond:
+                    self._opened -= 1
+                    self._cond.notify()
+                raise
+        else:
+            with self._cond:
+                self._stats["reused"] += 1
+        return conn
+
+    def release(self, conn, broken=False):
+        # pymysql은 접속이 끊기면 open=False (호출부에서 예외를 삼킨 경우도 여기서 걸러냄)
+        broken = broken or not getattr(conn, "open", True)
+        created_at = self._born.get(id(conn), 0)
+        expired = time.time() - created_at >= self.max_lifetime
+        with self._cond:
+            if broken or expired or self._closed:
+                if broken:
+                    self._stats["discarded"] += 1
+                elif expired:
+                    self._stats["expired"] += 1
+                self._opened -= 1
+                self._born.pop(id(conn), None)
+                doomed = conn
+            else:
+                self._idle.append((conn, created_at, time.time()))
+                doomed = None
+            self._cond.notify()
+        if doomed is not None:
+            self._close_quietly(doomed)
+
+    @contextmanager
+    def connection(self):
+        """with pool.connection() as conn: ... (예외 시 rollback, 접속 오류면 연결 폐기)"""
+        conn = self.acquire()
+        broken = False
+        try:
+            yield conn
+        except Exception as e:
+            broken = self._is_broken(e)
+            if not broken:
+                try:
+                    conn.rollback()
+                except Exception:
+                    broken = True
+            raise
+        finally:
+            self.release(conn, broken=broken)
+
+    # ===== 내부 =====
+    def _open(self):
+        conn = self._connect()
+        with self._cond:
+            self._born[id(conn)] = time.time()
+            self._stats["created"] += 1
+        return conn
+
+    def _ping(self, conn):
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except Exception:
+            with self._cond:
+                self._stats["ping_failed"] += 1
+                self._born.pop(id(conn), None)
+            self._close_quietly(conn)
+            return False
+
+    def _record_wait(self, seconds, waited):
+        """_cond 안에서 호출."""
+        self._stats["acquired"] += 1
+        self._stats["waited"] += waited
+        self._wait_total += seconds
+        self._wait_max = max(self._wait_max, seconds)
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    # ===== 관리 =====
+    def stats(self):
+        with self._cond:
+            s = dict(self._stats)
+            s.update(
+                size=self.size,
+                open=self._opened,
+                idle=len(self._idle),
+                in_use=self._opened - len(self._idle),
+                hit_rate=s["reused"] / s["acquired"] if s["acquired"] else 0.0,
+                avg_wait_ms=self._wait_total / s["acquired"] * 1000 if s["acquired"] else 0.0,
+                max_wait_ms=self._wait_max * 1000,
+            )
+        return s
+
+    def close(self):
+        """놀고 있는 연결을 닫고, 사용 중인 연결은 반납될 때 닫는다."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._opened -= len(idle)
+            for conn, _, _ in idle:
+                self._born.pop(id(conn), None)
+            self._cond.notify_all()
+        for conn, _, _ in idle:
+            self._close_quietly(conn)
@@ -0,0 +1,104 @@
+"""
+크롤링 실행용 메모리 중복 색인
+
+작업 시작 시 db_manager.preload_dedup_index()가 한 번 채운다.
+- 최근 N일 link / 제목 키 : 정확한 set → 있으면 중복으로 바로 답함
+- 전체 link                : 블룸 필터 → 없으면 새 기사로 바로 답함,
+                              있다고 나오면(오래된 기사 또는 오탐) DB로 확인
+link는 canonical URL, 제목 키는 원문 제목 해시와 정규화 제목 지문 (canonical.py).
+실행 중 저장한 에피소드는 add()로 즉시 반영된다.
+"""
+import math
+import hashlib
+import threading
+
+
+class BloomFilter:
+    """bytearray 비트 배열 + 이중 해싱(sha256 앞/뒤 8바이트)."""
+
+    def __init__(self, capacity, error_rate=0.01):
+        capacity = max(capacity, 1000)
+        self.size = int(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        digest = hashlib.sha256(item.encode("utf-8")).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:16], "big") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, item):
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item):
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    @property
+    def nbytes(self):
+        return len(self._bits)
+
+
+class DedupIndex:
+    def __init__(self, all_links, recent_links, recent_titles, days, error_rate=0.01):
+        self.days = days
+        self._lock = threading.Lock()
+        self._bloom = BloomFilter(len(all_links) * 2, error_rate)
+        for link in all_links:
+            self._bloom.add(link)
+        self._recent_links = set(recent_links)
+        self._recent_titles = set(recent_titles)
+        self.memory_hits = 0
+        self.db_lookups = 0
+
+    def classify_links(self, links):
+        """
+        Returns: (중복 확정 집합, DB 확인이 필요한 리스트)
+        블룸 필터에 없는 링크는 새 기사로 확정되어 어느 쪽에도 들어가지 않는다.
+        """
+        dup, unsure = set(), []
+        with self._lock:
+            for link in links:
+                if link in self._recent_links:
+                    dup.add(link)
+                    self.memory_hits += 1
+                elif link in self._bloom:
+                    unsure.append(link)
+                    self.db_lookups += 1
+                else:
+                    self.memory_hits += 1
+        return dup, unsure
+
+    def covers_days(self, days):
+        return days <= self.days
+
+    def recent_titles(self, key_groups):
+        """
+        key_groups: 제목마다 키 튜플의 리스트. 최근 N일 set에 있는 키 집합 반환.
+        set만으로 완전히 답함 (covers_days인 경우에만 호출).
+        """
+        with self._lock:
+            self.memory_hits += len(key_groups)
+            return {k for keys in key_groups for k in keys if k in self._recent_titles}
+
+    def add(self, link, title_keys=()):
+        with self._lock:
+            if link:
+                self._bloom.add(link)
+                self._recent_links.add(link)
+            self._recent_titles.update(k for k in title_keys if k)
+
+    def count_db_lookups(self, n):
+        with self._lock:
+            self.db_lookups += n
+
+    def stats(self):
+        with self._lock:
+            return {
+                "memory_hits": self.memory_hits,
+                "db_lookups": self.db_lookups,
+                "recent_links": len(self._recent_links),
+                "recent_titles": len(self._recent_titles),
+                "bloom_bytes": self._bloom.nbytes,
+            }
@@ -0,0 +1,96 @@
+"""
+에피소드 일괄 저장 (버퍼링 writer)
+
+insert_episode를 건마다 호출하면 연결·INSERT·커밋이 한 행씩 일어난다.
+EpisodeWriter는 저장할 행을 모았다가 batch_size개가 차거나 flush_interval초가 지나면
+db_manager.insert_episodes로 한 트랜잭션에 넣는다 (multi-row INSERT, 커밋 1회).
+
+    writer = EpisodeWriter()
+    future = writer.add(press=..., title=..., link=..., mp3_path=..., ...)
+    future.add_done_callback(lambda f: print(f.result()))   # (INSERTED/DUPLICATE/FAILED, 오류)
+    writer.flush()   # 지금 바로 저장
+    writer.close()   # 남은 행 저장 후 종료 (종료 시 반드시 호출 → atexit 등록 권장)
+"""
+import time
+import threading
+from concurrent.futures import Future
+
+import db_manager
+from config import config
+
+EPISODE_WRITER_BATCH = config.EPISODE_WRITER_BATCH
+EPISODE_WRITER_FLUSH_SEC = config.EPISODE_WRITER_FLUSH_SEC
+
+
+class EpisodeWriter:
+    def __init__(self, batch_size=None, flush_interval=None):
+        self.batch_size = max(1, batch_size or EPISODE_WRITER_BATCH)
+        self.flush_interval = flush_interval or EPISODE_WRITER_FLUSH_SEC
+        self._buffer = []  # [(episode dict, Future)]
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # 한 번에 한 flush만 (행 순서 유지)
+        self._stop = threading.Event()
+        self._thread = None
+        self._closed = False
+        self.stats = {"rows": 0, "batches": 0, db_manager.INSERTED: 0, db_manager.DUPLICATE: 0,
+                      db_manager.FAILED: 0, "flush_sec": 0.0}
+
+    def add(self, **episode):
+        """저장할 행 추가. (결과, 오류 메시지)로 완료되는 Future 반환."""
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("EpisodeWriter가 이미 닫혔습니다")
+            self._buffer.append((episode, future))
+            full = len(self._buffer) >= self.batch_size
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="episode-writer", daemon=True)
+                self._thread.start()
+        if full:
+            self.flush()
+        return future
+
+    def _run(self):
+        # flush_interval마다 쌓인 행 저장 → 한 행이 기다리는 시간은 최대 flush_interval
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """버퍼의 행을 한 트랜잭션으로 저장하고 각 Future를 완료. 결과 리스트 반환."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+            if not batch:
+                return []
+            started = time.time()
+            try:
+                outcomes = db_manager.insert_episodes([episode for episode, _ in batch])
+            except Exception as e:
+                print(f"DB Error (에피소드 일괄 저장): {e}")
+                outcomes = [(db_manager.FAILED, str(e))] * len(batch)
+            with self._lock:
+                self.stats["rows"] += len(batch)
+                self.stats["batches"] += 1
+                self.stats["flush_sec"] += time.time() - started
+                for outcome, _ in outcomes:
+                    self.stats[outcome] += 1
+            for (_, future), outcome in zip(batch, outcomes):
+                future.set_result(outcome)
+            return outcomes
+
+    def close(self):
+        """타이머를 멈추고 남은 행을 저장."""
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        self._stop.set()
+        if thread is not None:
+            thread.join()
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
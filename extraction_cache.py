@@ -0,0 +1,221 @@
+"""
+기사 본문 추출 결과 영구 캐시
+
+get_news_content의 결과(정제된 본문 + 요약)를 정규화 URL 기준으로 저장해
+LLM/TTS/업로드 단계에서 실패해 다음 실행에 다시 시도하는 기사를 재다운로드·재추출하지 않는다.
+
+- 본문은 내용 해시(sha256)로 저장 → 같은 본문을 가리키는 URL 여러 개가 한 벌만 차지
+- 다운로드/추출/검증 실패도 TTL과 함께 기록(negative cache) → 죽은 링크 반복 요청 방지
+- 전체 크기 상한 초과 시 마지막 접근 시각 기준(LRU)으로 제거
+
+관리 CLI: python scripts/manage_extraction_cache.py
+"""
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+
+from canonical import canonical_url
+from config import config
+
+EXTRACT_CACHE_ENABLED = config.EXTRACT_CACHE_ENABLED
+EXTRACT_CACHE_PATH = config.EXTRACT_CACHE_PATH
+EXTRACT_CACHE_MAX_MB = config.EXTRACT_CACHE_MAX_MB
+# 실패 기록 유지 시간 (이 시간 동안은 같은 링크를 다시 받지 않음)
+EXTRACT_NEGATIVE_TTL = config.EXTRACT_NEGATIVE_TTL
+
+# 실패 사유
+DOWNLOAD_FAILED = "download_failed"
+EXTRACT_FAILED = "extract_failed"
+VALIDATION_FAILED = "validation_failed"
+
+
+def _url_key(url):
+    return hashlib.sha256(canonical_url(url).encode("utf-8")).hexdigest()
+
+
+class ExtractionCache:
+    """sqlite3 기반 URL → 본문 해시 매핑 + 해시 → 본문 저장소."""
+
+    _EVICT_EVERY = 20
+
+    def __init__(self, path=None, max_mb=None, negative_ttl=None):
+        self.path = path or EXTRACT_CACHE_PATH
+        self.max_bytes = int((max_mb or EXTRACT_CACHE_MAX_MB) * 1024 * 1024)
+        self.negative_ttl = negative_ttl if negative_ttl is not None else EXTRACT_NEGATIVE_TTL
+        self._lock = threading.Lock()
+        self._puts = 0
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS urls (
+                url_key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                content_hash TEXT,
+                status TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                expires_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_urls_accessed ON urls (accessed_at);
+            CREATE INDEX IF NOT EXISTS idx_urls_hash ON urls (content_hash);
+            CREATE TABLE IF NOT EXISTS contents (
+                content_hash TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                summary TEXT,
+                size INTEGER NOT NULL
+            );
+        """)
+        self._conn.commit()
+
+    def get(self, url):
+        """
+        Returns:
+            None                                   - 기록 없음 (또는 실패 기록 만료)
+            {'status': 'ok', 'text', 'summary'}    - 성공 기록
+            {'status': <실패 사유>, 'expires_at'}   - 유효한 실패 기록
+        """
+        key = _url_key(url)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT u.status, u.expires_at, c.text, c.summary FROM urls u "
+                "LEFT JOIN contents c ON c.content_hash = u.content_hash WHERE u.url_key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            if row["status"] != "ok":
+                if row["expires_at"] is not None and row["expires_at"] < now:
+                    self._conn.execute("DELETE FROM urls WHERE url_key = ?", (key,))
+                    self._conn.commit()
+                    return None
+                return {"status": row["status"], "expires_at": row["expires_at"]}
+            if row["text"] is None:
+                return None
+            self._conn.execute("UPDATE urls SET accessed_at = ? WHERE url_key = ?", (now, key))
+            self._conn.commit()
+        return {"status": "ok", "text": row["text"], "summary": row["summary"]}
+
+    def put(self, url, text, summary=None):
+        content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO contents (content_hash, text, summary, size) VALUES (?,?,?,?)",
+                (content_hash, text, summary, len(text.encode("utf-8"))),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO urls "
+                "(url_key, url, content_hash, status, created_at, accessed_at, expires_at) "
+                "VALUES (?,?,?,'ok',?,?,NULL)",
+                (_url_key(url), url, content_hash, now, now),
+            )
+            self._conn.commit()
+            self._puts += 1
+            due = self._puts % self._EVICT_EVERY == 0
+        if due:
+            self.evict()
+
+    def put_failure(self, url, reason, ttl=None):
+        now = time.time()
+        ttl = self.negative_ttl if ttl is None else ttl
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO urls "
+                "(url_key, url, content_hash, status, created_at, accessed_at, expires_at) "
+                "VALUES (?,?,NULL,?,?,?,?)",
+                (_url_key(url), url, reason, now, now, now + ttl),
+            )
+            self._conn.commit()
+
+    def _drop_orphans(self):
+        self._conn.execute(
+            "DELETE FROM contents WHERE content_hash NOT IN "
+            "(SELECT content_hash FROM urls WHERE content_hash IS NOT NULL)"
+        )
+
+    def evict(self):
+        """만료된 실패 기록 삭제 후, 본문 총량이 상한을 넘으면 오래 안 쓴 URL부터 삭제."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM urls WHERE status != 'ok' AND expires_at < ?", (time.time(),)
+            )
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM contents").fetchone()[0]
+            if total > self.max_bytes:
+                rows = self._conn.execute(
+                    "SELECT u.url_key, u.content_hash, c.size FROM urls u "
+                    "JOIN contents c ON c.content_hash = u.content_hash "
+                    "ORDER BY u.accessed_at ASC"
+                ).fetchall()
+                refs = {}
+                for r in rows:
+                    refs[r["content_hash"]] = refs.get(r["content_hash"], 0) + 1
+                doomed = []
+                for r in rows:
+                    if total <= self.max_bytes:
+                        break
+                    doomed.append((r["url_key"],))
+                    refs[r["content_hash"]] -= 1
+                    if refs[r["content_hash"]] == 0:
+                        total -= r["size"]
+                self._conn.executemany("DELETE FROM urls WHERE url_key = ?", doomed)
+            self._drop_orphans()
+            self._conn.commit()
+
+    # ===== 관리용 =====
+    def stats(self):
+        with self._lock:
+            by_status = {
+                r["status"]: r["cnt"]
+                for r in self._conn.execute("SELECT status, COUNT(*) AS cnt FROM urls GROUP BY status")
+            }
+            contents, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM contents"
+            ).fetchone()
+        return {"urls": by_status, "contents": contents, "bytes": size, "max_bytes": self.max_bytes}
+
+    def entries(self, status=None, limit=50):
+        sql = ("SELECT u.url, u.status, u.created_at, u.accessed_at, u.expires_at, c.size "
+               "FROM urls u LEFT JOIN contents c ON c.content_hash = u.content_hash")
+        params = []
+        if status:
+            sql += " WHERE u.status = ?"
+            params.append(status)
+        sql += " ORDER BY u.accessed_at DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            return [dict(r) for r in self._conn.execute(sql, params)]
+
+    def purge(self, url=None, negative_only=False, older_than_days=None):
+        """조건에 맞는 URL 기록 삭제. 삭제된 URL 수 반환."""
+        clauses, params = [], []
+        if url:
+            clauses.append("url_key = ?")
+            params.append(_url_key(url))
+        if negative_only:
+            clauses.append("status != 'ok'")
+        if older_than_days is not None:
+            clauses.append("accessed_at < ?")
+            params.append(time.time() - older_than_days * 86400)
+        sql = "DELETE FROM urls" + (" WHERE " + " AND ".join(clauses) if clauses else "")
+        with self._lock:
+            deleted = self._conn.execute(sql, params).rowcount
+            self._drop_orphans()
+            self._conn.commit()
+            self._conn.execute("VACUUM")
+        return deleted
+
+
+def open_extraction_cache():
+    """설정에 따라 캐시를 열고, 비활성/실패 시 None."""
+    if not EXTRACT_CACHE_ENABLED:
+        return None
+    try:
+        return ExtractionCache()
+    except Exception as e:
+        print(f"⚠️ 본문 캐시 비활성화 (열기 실패): {e}")
+        return None
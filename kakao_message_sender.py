@@ -11,13 +11,11 @@ import os
 import webbrowser
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
-from dotenv import load_dotenv
 
-# 환경 변수 로드
-load_dotenv()
+from config import config
 
 # 카카오 API 설정
-KAKAO_REST_API_KEY = os.getenv('KAKAO_REST_API_KEY')
+KAKAO_REST_API_KEY = config.KAKAO_REST_API_KEY
 REDIRECT_URI = 'http://localhost:8000'
 TOKEN_FILE = 'kakao_token.json'
 
@@ -0,0 +1,23 @@
+-- 에피소드 테이블 (새 DB용 전체 스키마. 이미 있으면 그대로 둠)
+CREATE TABLE IF NOT EXISTS episodes (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    press VARCHAR(100),
+    title VARCHAR(255),
+    title_hash CHAR(64),
+    title_fingerprint CHAR(64),
+    link VARCHAR(500) NOT NULL,
+    canonical_link VARCHAR(500),
+    mp3_path VARCHAR(255),
+    duration_sec INT UNSIGNED,
+    summary VARCHAR(280),
+    content_simhash BIGINT UNSIGNED,
+    keyword_id INT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE KEY uk_link (link),
+    INDEX idx_keyword_created (keyword_id, created_at),
+    INDEX idx_title_hash_created (title_hash, created_at),
+    INDEX idx_canonical_link (canonical_link),
+    INDEX idx_title_fp_created (title_fingerprint, created_at),
+    INDEX idx_created_at (created_at),
+    FULLTEXT KEY ft_title (title)
+);
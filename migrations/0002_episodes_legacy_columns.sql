@@ -0,0 +1,15 @@
+-- 예전 init_db가 만든 episodes 테이블을 현재 스키마로 (이미 있는 컬럼/인덱스는 건너뜀)
+ALTER TABLE episodes ADD COLUMN keyword_id INT;
+ALTER TABLE episodes ADD COLUMN title_hash CHAR(64) AFTER title;
+ALTER TABLE episodes ADD COLUMN duration_sec INT UNSIGNED AFTER mp3_path;
+ALTER TABLE episodes ADD COLUMN summary VARCHAR(280) AFTER duration_sec;
+ALTER TABLE episodes ADD COLUMN content_simhash BIGINT UNSIGNED AFTER summary;
+ALTER TABLE episodes ADD COLUMN title_fingerprint CHAR(64) AFTER title_hash;
+ALTER TABLE episodes ADD COLUMN canonical_link VARCHAR(500) AFTER link;
+-- 테이블 재작성이 일어날 수 있음 (큰 테이블은 한가한 시간에 실행)
+ALTER TABLE episodes MODIFY COLUMN link VARCHAR(500) NOT NULL;
+ALTER TABLE episodes ADD UNIQUE KEY uk_link (link);
+ALTER TABLE episodes ADD INDEX idx_title_hash_created (title_hash, created_at);
+ALTER TABLE episodes ADD INDEX idx_canonical_link (canonical_link);
+ALTER TABLE episodes ADD INDEX idx_title_fp_created (title_fingerprint, created_at);
+ALTER TABLE episodes ADD FULLTEXT KEY ft_title (title);
@@ -0,0 +1,4 @@
+-- 키워드 주제(topic)와 상주 모드 확인 주기(분, NULL이면 DAEMON_DEFAULT_INTERVAL_MIN)
+ALTER TABLE keywords ADD COLUMN topic VARCHAR(100);
+UPDATE keywords SET topic = keyword WHERE topic IS NULL;
+ALTER TABLE keywords ADD COLUMN crawl_interval_min INT UNSIGNED;
@@ -0,0 +1,19 @@
+-- 날짜 × 키워드별 에피소드 수/재생 시간 합계 (달력 API용 집계)
+-- keyword_id가 없는 에피소드는 0으로 집계. insert_episodes가 같은 트랜잭션에서 갱신하고,
+-- 어긋나면 python scripts/rebuild_calendar.py 로 다시 계산
+CREATE TABLE IF NOT EXISTS episode_calendar (
+    day DATE NOT NULL,
+    keyword_id INT NOT NULL DEFAULT 0,
+    episode_count INT UNSIGNED NOT NULL DEFAULT 0,
+    total_duration_sec BIGINT UNSIGNED NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (day, keyword_id),
+    INDEX idx_keyword_day (keyword_id, day)
+);
+-- 기존 에피소드로 채우기 (다시 실행해도 같은 값)
+INSERT INTO episode_calendar (day, keyword_id, episode_count, total_duration_sec)
+SELECT * FROM (
+    SELECT DATE(created_at) AS d, COALESCE(keyword_id, 0) AS k, COUNT(*) AS n, COALESCE(SUM(duration_sec), 0) AS s
+    FROM episodes GROUP BY d, k
+) AS t
+ON DUPLICATE KEY UPDATE episode_count = n, total_duration_sec = s;
@@ -0,0 +1,4 @@
+-- 한국어 검색용 ngram FULLTEXT (제목 + 요약, 기본 ngram_token_size=2)
+-- 기본 파서의 ft_title은 공백 단위로만 잘라 한국어 검색에 쓸 수 없어 삭제. 큰 테이블은 한가한 시간에 실행
+ALTER TABLE episodes ADD FULLTEXT KEY ft_title_summary (title, summary) WITH PARSER ngram;
+ALTER TABLE episodes DROP INDEX ft_title;
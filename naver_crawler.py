@@ -2,24 +2,33 @@
 import os
 import sys
 import logging
-from logging.handlers import RotatingFileHandler
 
 # 스크립트 위치 기준으로 로그 파일 경로 설정
 _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 _LOG_FILE = os.path.join(_SCRIPT_DIR, "crawler_log.txt")
 
-# 기본 로깅 설정 (import 전에 설정)
-# 10MB × 10개 회전 (최대 ~100MB 보관)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[
-        RotatingFileHandler(
-            _LOG_FILE, maxBytes=10 * 1024 * 1024, backupCount=10, encoding='utf-8'
-        ),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+
+def _setup_logging():
+    """
+    파일(10MB × 10개 회전, 최대 ~100MB) + stdout 로깅.
+    직접 실행할 때만 설정한다 → 다른 스크립트가 import해도 로그 파일을 만들지 않음.
+    """
+    from logging.handlers import RotatingFileHandler
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s [%(levelname)s] %(message)s',
+        handlers=[
+            RotatingFileHandler(
+                _LOG_FILE, maxBytes=10 * 1024 * 1024, backupCount=10, encoding='utf-8'
+            ),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+
+
+if __name__ == "__main__":
+    _setup_logging()
 _logger = logging.getLogger("startup")
 _logger.info("=" * 60)
 _logger.info("스크립트 로드 시작")
@@ -29,25 +38,51 @@ _logger.info(f"스크립트 경로: {_SCRIPT_DIR}")
 # ===== 모듈 Import (오류 시 로그에 기록) =====
 try:
     import requests
-    from bs4 import BeautifulSoup
+    from requests.adapters import HTTPAdapter
     import urllib.parse
     import time
     import random
-    import re
     import signal
+    import json
+    import atexit
+    import sqlite3
+    import hashlib
+    import itertools
+    import multiprocessing
+    import threading
+    import importlib.util
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+    from concurrent.futures.process import BrokenProcessPool
     from datetime import datetime, timedelta
     
+    from config import config
     from podcast_generator import generate_podcast_script
-    from podcast_audio import run_audio_generation
+    from podcast_audio import run_audio_generation, get_audio_segment
+    import sftp_uploader
     from sftp_uploader import upload_file
     import db_manager
+    from article_cleaner import extract_article
+    from article_cleaner import build_summary as _build_summary, ArticleText
+    import extraction_cache
+    import watermarks
+    import stage_journal
+    import stage_pipeline
+    import episode_writer
+    import near_dup
+    from canonical import canonical_url, title_fingerprint
+    from search_parser import parse_search_results, default_parser as search_parser
 
-    # 1차 본문 추출기: trafilatura (설치 안 돼 있어도 기존 로직으로 동작하도록 방어)
+    # brotli 디코더가 있으면 Accept-Encoding에 br 추가 (없으면 gzip/deflate만)
     try:
-        import trafilatura
-        _TRAFILATURA_AVAILABLE = True
+        import brotli  # noqa: F401
+        _BROTLI_AVAILABLE = True
     except ImportError:
-        _TRAFILATURA_AVAILABLE = False
+        _BROTLI_AVAILABLE = False
+
+    # 1차 본문 추출기: trafilatura (설치 안 돼 있어도 기존 로직으로 동작하도록 방어)
+    # 실제 import는 article_cleaner.extract_article에서 (추출 프로세스에서만 로드)
+    _TRAFILATURA_AVAILABLE = importlib.util.find_spec("trafilatura") is not None
+    if not _TRAFILATURA_AVAILABLE:
         _logger.warning("trafilatura 미설치 - 기존 셀렉터 로직만 사용")
 
     _logger.info("모든 모듈 import 성공")
@@ -63,20 +98,13 @@ logger = _logger  # 기존 코드 호환성
 def _measure_mp3_duration(path):
     """MP3 파일 재생 길이를 초 단위로 반환. 실패 시 None."""
     try:
-        from pydub import AudioSegment
+        AudioSegment = get_audio_segment()  # FFmpeg 경로가 설정된 AudioSegment
         return int(len(AudioSegment.from_mp3(path)) / 1000)
     except Exception as e:
         logger.warning(f"duration 측정 실패 ({path}): {e}")
         return None
 
 
-def _build_summary(content, limit=280):
-    """기사 본문에서 공백 정규화한 선두 N자 요약 추출."""
-    if not content:
-        return None
-    cleaned = re.sub(r"\s+", " ", content).strip()
-    return cleaned[:limit] if cleaned else None
-
 # User-Agent 목록 (랜덤 선택으로 차단 방지)
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
@@ -94,14 +122,452 @@ def get_random_headers():
         "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
     }
 
+# ===== 디스크 HTTP 캐시 =====
+# URL 키로 본문 + ETag/Last-Modified 저장 → 재실행 시 조건부 요청(304)으로 대역폭 절약.
+# 크기/나이 상한을 넘으면 마지막 접근 시각 기준(LRU)으로 제거.
+HTTP_CACHE_ENABLED = config.HTTP_CACHE_ENABLED
+HTTP_CACHE_PATH = config.HTTP_CACHE_PATH
+HTTP_CACHE_MAX_MB = config.HTTP_CACHE_MAX_MB
+HTTP_CACHE_MAX_AGE_DAYS = config.HTTP_CACHE_MAX_AGE_DAYS
+# 기사 본문은 거의 바뀌지 않으므로 이 시간 안에는 재검증 없이 캐시 사용
+HTTP_CACHE_ARTICLE_TTL = config.HTTP_CACHE_ARTICLE_TTL
+
+_stats_lock = threading.Lock()
+
+
+class _Lazy:
+    """
+    처음 get()할 때 factory()로 한 번만 만드는 싱글턴.
+    import 시점에 캐시 파일/DB를 열지 않도록 모듈 전역 상태 객체를 감싼다.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._value = None
+        self._created = False
+
+    def get(self):
+        if not self._created:
+            with self._lock:
+                if not self._created:
+                    self._value = self._factory()
+                    self._created = True
+        return self._value
+
+    @property
+    def created(self):
+        return self._created
+
+
+def _bump(stats, key, amount=1):
+    """여러 스레드가 같은 stats dict를 갱신하므로 락으로 보호."""
+    if stats is None:
+        return
+    with _stats_lock:
+        stats[key] = stats.get(key, 0) + amount
+
+
+class _CachedResponse:
+    """캐시에서 꺼낸 본문을 requests.Response처럼 쓰기 위한 최소 래퍼."""
+
+    def __init__(self, url, content, encoding):
+        self.url = url
+        self.status_code = 200
+        self.content = content
+        self.encoding = encoding
+        self.from_cache = True
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def raise_for_status(self):
+        pass
+
+
+class HttpCache:
+    """sqlite3 파일 하나에 응답 본문과 검증 헤더를 저장하는 LRU 캐시."""
+
+    _EVICT_EVERY = 50  # put N회마다 한 번씩 정리
+
+    def __init__(self, path=None, max_mb=None, max_age_days=None):
+        self.path = path or HTTP_CACHE_PATH
+        self.max_bytes = int((max_mb or HTTP_CACHE_MAX_MB) * 1024 * 1024)
+        self.max_age = (max_age_days or HTTP_CACHE_MAX_AGE_DAYS) * 86400
+        self._lock = threading.Lock()
+        self._puts = 0
+        # 적중 시 접근 시각은 메모리에 모았다가 evict()/flush()에서 한 번에 기록
+        # (LRU 정리 순서에만 쓰이므로 적중마다 쓰기 트랜잭션을 열 필요 없음)
+        self._accessed = {}
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS http_cache (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                encoding TEXT,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON http_cache (accessed_at)")
+        self._conn.commit()
+        self.evict()
+
+    @staticmethod
+    def _key(url):
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def get(self, url):
+        """캐시 엔트리 dict 반환 (없으면 None). 접근 시각은 메모리에만 기록."""
+        key = self._key(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, encoding, body, stored_at FROM http_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._accessed[key] = time.time()
+        etag, last_modified, encoding, body, stored_at = row
+        return {
+            "etag": etag, "last_modified": last_modified, "encoding": encoding,
+            "body": body, "stored_at": stored_at,
+        }
+
+    def put(self, url, response):
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        body = response.content
+        now = time.time()
+        key = self._key(url)
+        with self._lock:
+            self._accessed.pop(key, None)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO http_cache "
+                "(key, url, etag, last_modified, encoding, body, size, stored_at, accessed_at) "
+                "VALUES (?,?,?,?,?,?,?,?,?)",
+                (key, url, etag, last_modified, response.encoding,
+                 body, len(body), now, now),
+            )
+            self._conn.commit()
+            self._puts += 1
+            due = self._puts % self._EVICT_EVERY == 0
+        if due:
+            self.evict()
+
+    def touch(self, url):
+        """304 응답: 저장 시각을 갱신해 TTL을 연장."""
+        now = time.time()
+        key = self._key(url)
+        with self._lock:
+            self._accessed.pop(key, None)
+            self._conn.execute(
+                "UPDATE http_cache SET stored_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, key),
+            )
+            self._conn.commit()
+
+    def _write_accessed(self):
+        """_lock 안에서 호출. 모아 둔 접근 시각 기록 (커밋은 호출부)."""
+        if self._accessed:
+            self._conn.executemany("UPDATE http_cache SET accessed_at = ? WHERE key = ?",
+                                   [(at, key) for key, at in self._accessed.items()])
+            self._accessed.clear()
+
+    def flush(self):
+        """모아 둔 접근 시각을 파일에 기록."""
+        with self._lock:
+            if self._accessed:
+                self._write_accessed()
+                self._conn.commit()
+
+    def evict(self):
+        """나이 초과 엔트리 삭제 후, 용량 초과분을 오래 안 쓴 순서로 삭제."""
+        with self._lock:
+            self._write_accessed()
+            self._conn.execute("DELETE FROM http_cache WHERE stored_at < ?", (time.time() - self.max_age,))
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+            if total > self.max_bytes:
+                rows = self._conn.execute("SELECT key, size FROM http_cache ORDER BY accessed_at ASC").fetchall()
+                doomed = []
+                for key, size in rows:
+                    if total <= self.max_bytes:
+                        break
+                    doomed.append((key,))
+                    total -= size
+                self._conn.executemany("DELETE FROM http_cache WHERE key = ?", doomed)
+            self._conn.commit()
+
+
+# ===== 도메인별 적응형 속도 제한 =====
+# 도메인마다 토큰 버킷을 두고, 429/503/연결 끊김이면 속도를 곱셈 감소,
+# 성공하면 조금씩 올린다(AIMD). 학습한 속도는 파일에 저장해 다음 실행에서 이어 쓴다.
+RATE_LIMIT_INITIAL = config.RATE_LIMIT_INITIAL  # req/s (기존 평균 2초 간격)
+RATE_LIMIT_MIN = config.RATE_LIMIT_MIN
+RATE_LIMIT_MAX = config.RATE_LIMIT_MAX
+RATE_LIMIT_BURST = config.RATE_LIMIT_BURST
+RATE_LIMIT_INCREASE = config.RATE_LIMIT_INCREASE  # 성공 1회당 +req/s
+RATE_LIMIT_BACKOFF = config.RATE_LIMIT_BACKOFF  # 차단 신호 시 ×
+RATE_LIMIT_STATE_PATH = config.RATE_LIMIT_STATE_PATH
+
+_THROTTLE_STATUS = (429, 503)
+
+
+class _TokenBucket:
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def reserve(self):
+        """토큰 1개 예약 후 기다려야 할 시간(초) 반환. 음수 토큰으로 순서 보장."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.blocked_until - now)
+
+
+class DomainRateLimiter:
+    """도메인별 _TokenBucket 관리 + 응답 결과에 따른 속도 조정 + 상태 저장/복원."""
+
+    def __init__(self, state_path=None, initial=None, min_rate=None, max_rate=None,
+                 burst=None, increase=None, backoff=None):
+        self.state_path = state_path if state_path is not None else RATE_LIMIT_STATE_PATH
+        self.initial = initial or RATE_LIMIT_INITIAL
+        self.min_rate = min_rate or RATE_LIMIT_MIN
+        self.max_rate = max_rate or RATE_LIMIT_MAX
+        self.burst = burst or RATE_LIMIT_BURST
+        self.increase = increase or RATE_LIMIT_INCREASE
+        self.backoff = backoff or RATE_LIMIT_BACKOFF
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._saved_rates = self._load()
+
+    @staticmethod
+    def _domain(url):
+        return (urllib.parse.urlsplit(url).hostname or "").lower()
+
+    def _load(self):
+        if not self.state_path or not os.path.exists(self.state_path):
+            return {}
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                return {d: float(v["rate"]) for d, v in json.load(f).items()}
+        except Exception as e:
+            logger.warning(f"속도 제한 상태 로드 실패 (초기값 사용): {e}")
+            return {}
+
+    def save(self):
+        if not self.state_path:
+            return
+        with self._lock:
+            state = {d: {"rate": round(b.rate, 4), "updated": int(time.time())}
+                     for d, b in self._buckets.items()}
+            merged = {d: {"rate": r} for d, r in self._saved_rates.items()}
+            merged.update(state)
+        try:
+            os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+            tmp = self.state_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(merged, f, ensure_ascii=False, indent=1)
+            os.replace(tmp, self.state_path)
+        except Exception as e:
+            logger.warning(f"속도 제한 상태 저장 실패: {e}")
+
+    def _bucket(self, domain):
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            rate = min(self.max_rate, max(self.min_rate, self._saved_rates.get(domain, self.initial)))
+            bucket = _TokenBucket(rate, self.burst)
+            self._buckets[domain] = bucket
+        return bucket
+
+    def acquire(self, url):
+        """해당 도메인 토큰이 생길 때까지 대기."""
+        with self._lock:
+            wait = self._bucket(self._domain(url)).reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def record(self, url, status_code=None, error=False, retry_after=None):
+        """응답 결과 반영: 차단 신호면 곱셈 감소, 정상 응답이면 덧셈 증가."""
+        domain = self._domain(url)
+        with self._lock:
+            bucket = self._bucket(domain)
+            if error or status_code in _THROTTLE_STATUS:
+                old = bucket.rate
+                bucket.rate = max(self.min_rate, bucket.rate * self.backoff)
+                bucket.tokens = min(bucket.tokens, 0)
+                if retry_after:
+                    bucket.blocked_until = time.monotonic() + retry_after
+                reason = f"HTTP {status_code}" if status_code else "연결 오류"
+                logger.warning(f"[속도 제한] {domain} {reason} → {old:.2f} → {bucket.rate:.2f} req/s")
+            elif status_code is not None and status_code < 400:
+                bucket.rate = min(self.max_rate, bucket.rate + self.increase)
+
+    def rate(self, url):
+        with self._lock:
+            return self._bucket(self._domain(url)).rate
+
+
+def _retry_after_seconds(response):
+    value = response.headers.get("Retry-After")
+    if value and value.strip().isdigit():
+        return int(value.strip())
+    return None
+
+
+# ===== 공용 HTTP 클라이언트 =====
+# 검색 페이지와 기사 다운로드가 같은 Session을 공유 → 호스트별 keep-alive
+# 커넥션 풀로 search.naver.com / n.news.naver.com TLS 핸드셰이크를 실행 전체에서 재사용.
+HTTP_POOL_HOSTS = config.HTTP_POOL_HOSTS
+HTTP_POOL_MAXSIZE = config.HTTP_POOL_MAXSIZE
+HTTP_CONNECT_TIMEOUT = config.HTTP_CONNECT_TIMEOUT
+HTTP_READ_TIMEOUT = config.HTTP_READ_TIMEOUT
+
+
+class HttpClient:
+    """requests.Session 래퍼: 커넥션 풀 + 압축 + 타임아웃 + User-Agent 로테이션."""
+
+    def __init__(self, pool_hosts=None, pool_maxsize=None,
+                 connect_timeout=None, read_timeout=None, cache=None, limiter=None):
+        self.timeout = (
+            connect_timeout or HTTP_CONNECT_TIMEOUT,
+            read_timeout or HTTP_READ_TIMEOUT,
+        )
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_hosts or HTTP_POOL_HOSTS,
+            pool_maxsize=pool_maxsize or HTTP_POOL_MAXSIZE,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.accept_encoding = "gzip, deflate, br" if _BROTLI_AVAILABLE else "gzip, deflate"
+        self.cache = cache
+        self.limiter = limiter
+
+    def headers(self, extra=None):
+        headers = get_random_headers()
+        headers["Accept-Encoding"] = self.accept_encoding
+        if extra:
+            headers.update(extra)
+        return headers
+
+    def get(self, url, headers=None, timeout=None, **kwargs):
+        """limiter가 있으면 도메인 토큰을 받은 뒤 요청하고, 결과를 limiter에 반영."""
+        if self.limiter is not None:
+            self.limiter.acquire(url)
+        try:
+            response = self.session.get(
+                url,
+                headers=self.headers(headers),
+                timeout=timeout or self.timeout,
+                **kwargs,
+            )
+        except requests.exceptions.ConnectionError:
+            if self.limiter is not None:
+                self.limiter.record(url, error=True)
+            raise
+        if self.limiter is not None:
+            self.limiter.record(url, response.status_code, retry_after=_retry_after_seconds(response))
+        return response
+
+    def cached_get(self, url, fresh_for=0, stats=None):
+        """
+        캐시를 거치는 GET.
+        - fresh_for초 안에 저장된 엔트리는 네트워크 없이 반환 (cache_hit)
+        - 그 외엔 If-None-Match / If-Modified-Since로 재검증, 304면 캐시 본문 반환 (cache_hit)
+        - 200이면 저장 후 반환 (cache_miss)
+        stats dict에 cache_hit / cache_miss / cache_bytes_saved 누적.
+        """
+        if self.cache is None:
+            return self.get(url)
+
+        entry = self.cache.get(url)
+        if entry and fresh_for and time.time() - entry["stored_at"] < fresh_for:
+            _bump(stats, "cache_hit")
+            _bump(stats, "cache_bytes_saved", len(entry["body"]))
+            return _CachedResponse(url, entry["body"], entry["encoding"])
+
+        conditional = {}
+        if entry:
+            if entry["etag"]:
+                conditional["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                conditional["If-Modified-Since"] = entry["last_modified"]
+
+        response = self.get(url, headers=conditional)
+        if response.status_code == 304 and entry:
+            self.cache.touch(url)
+            _bump(stats, "cache_hit")
+            _bump(stats, "cache_bytes_saved", len(entry["body"]))
+            return _CachedResponse(url, entry["body"], entry["encoding"])
+
+        _bump(stats, "cache_miss")
+        if response.status_code == 200 and response.content:
+            self.cache.put(url, response)
+        return response
+
+    def close(self):
+        self.session.close()
+
+
+def _open_http_cache():
+    if not HTTP_CACHE_ENABLED:
+        return None
+    try:
+        cache = HttpCache()
+    except Exception as e:
+        logger.warning(f"HTTP 캐시 비활성화 (열기 실패): {e}")
+        return None
+    atexit.register(cache.flush)
+    return cache
+
+
+def _open_rate_limiter():
+    limiter = DomainRateLimiter()
+    atexit.register(limiter.save)
+    return limiter
+
+
+_rate_limiter = _Lazy(_open_rate_limiter)
+_http_client = _Lazy(lambda: HttpClient(cache=_open_http_cache(), limiter=_rate_limiter.get()))
+
+
+def get_http_client():
+    return _http_client.get()
+
+
+def __getattr__(name):
+    # 기존 코드 호환: naver_crawler.http_client / rate_limiter는 첫 접근 시 생성
+    if name == "http_client":
+        return _http_client.get()
+    if name == "rate_limiter":
+        return _rate_limiter.get()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Graceful Shutdown 플래그
 _shutdown_requested = False
+# 상주 모드의 대기(sleep)를 시그널 즉시 깨우기 위한 이벤트
+_shutdown_event = threading.Event()
 
 def signal_handler(signum, frame):
     """Ctrl+C 등 시그널 처리"""
     global _shutdown_requested
     print("\n⚠️ 종료 요청 감지. 현재 작업 완료 후 종료합니다...")
     _shutdown_requested = True
+    _shutdown_event.set()
 
 
 def safe_remove(filepath, retries=3, delay=1.0):
@@ -138,333 +604,865 @@ def cleanup_stale_mp3(mp3_dir="MP3", age_hours=24):
     if removed:
         logger.info(f"🧹 오래된 MP3 {removed}개 정리 ({age_hours}시간 이상)")
 
-def crawl_naver_news(query, keyword_id=None, requirements=None, use_ai=True, make_audio=True, max_articles=3):
+# ===== 기사 본문 동시 다운로드 =====
+# 호스트별 동시 접속 수를 따로 제한하고, 요청 간격은 http_client의
+# DomainRateLimiter가 도메인별로 맞춘다. 서로 다른 언론사 기사는 병렬로 받아온다.
+FETCH_MAX_WORKERS = config.FETCH_MAX_WORKERS
+FETCH_PER_HOST_LIMIT = config.FETCH_PER_HOST_LIMIT
+
+
+class _HostGate:
+    """단일 호스트에 대한 동시 접속 제한."""
+
+    def __init__(self, limit):
+        self._sem = threading.Semaphore(max(1, limit))
+
+    def __enter__(self):
+        self._sem.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._sem.release()
+        return False
+
+
+class ArticleFetcher:
+    """
+    기사 본문을 스레드 풀로 동시에 받아 추출.
+    호스트별 _HostGate를 거치므로 같은 언론사에는 per_host_limit개까지만
+    동시에 요청하고, 요청 속도는 도메인별 rate_limiter를 따른다.
+    """
+
+    def __init__(self, max_workers=None, per_host_limit=None, extract_fn=None):
+        self.max_workers = max_workers or FETCH_MAX_WORKERS
+        self.per_host_limit = per_host_limit or FETCH_PER_HOST_LIMIT
+        self._extract_fn = extract_fn
+        self._gates = {}
+        self._gates_lock = threading.Lock()
+
+    def _gate(self, url):
+        host = urllib.parse.urlsplit(url).hostname or ""
+        with self._gates_lock:
+            gate = self._gates.get(host)
+            if gate is None:
+                gate = _HostGate(self.per_host_limit)
+                self._gates[host] = gate
+            return gate
+
+    def fetch(self, url, stats=None):
+        """기사 하나의 본문 (호스트 제한 적용). 파이프라인의 fetch 단계에서 호출."""
+        extract = self._extract_fn or get_news_content
+        with self._gate(url):
+            return extract(url, stats=stats)
+
+    def fetch_all(self, urls, stats=None):
+        """urls 순서대로 본문 리스트 반환. 실패한 항목은 빈 문자열."""
+        if not urls:
+            return []
+        workers = min(self.max_workers, len(urls))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch") as pool:
+            futures = [pool.submit(self.fetch, u, stats) for u in urls]
+            results = []
+            for url, fut in zip(urls, futures):
+                try:
+                    results.append(fut.result() or "")
+                except Exception as e:
+                    print(f"  [오류] 본문 다운로드 중 예외 ({url}): {e}")
+                    results.append("")
+            return results
+
+
+# 모든 키워드 작업이 공유 → 호스트별 제한이 키워드 병렬 처리 시에도 유지됨
+_article_fetcher = ArticleFetcher()
+
+
+# ===== 키워드 병렬 처리 =====
+KEYWORD_WORKERS = config.KEYWORD_WORKERS
+
+# 새 기사 max_articles개를 채울 때까지 넘겨 볼 검색 결과 페이지 수 (1이면 첫 페이지만)
+SEARCH_MAX_PAGES = config.SEARCH_MAX_PAGES
+SEARCH_PAGE_SIZE = 10
+
+# 실행 전체에서 고유한 파일 인덱스 (병렬 작업 간 로컬/원격 파일명 충돌 방지)
+_episode_seq = itertools.count()
+
+
+class RunClaims:
+    """
+    한 번의 실행 동안 처리 중인 링크/제목 선점 기록.
+    DB 중복 검사는 insert_episode 이전이라 두 키워드가 같은 기사를 동시에
+    통과할 수 있으므로, 먼저 선점한 작업만 처리하도록 한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._links = set()
+        self._titles = set()
+
+    def claim(self, link, title):
+        """선점 성공 시 True. 이미 다른 작업이 선점했으면 False. (canonical URL / 정규화 제목 기준)"""
+        link = canonical_url(link) if link else None
+        title = (title_fingerprint(title) or db_manager.compute_title_hash(title)) if title else None
+        with self._lock:
+            if link and link in self._links:
+                return False
+            if title and title in self._titles:
+                return False
+            if link:
+                self._links.add(link)
+            if title:
+                self._titles.add(title)
+            return True
+
+
+def crawl_naver_news(query, keyword_id=None, requirements=None, use_ai=True, make_audio=True, max_articles=3,
+                     claims=None, max_pages=None):
     # Encode the query for the URL
     encoded_query = urllib.parse.quote(query)
     
     # Base URL provided by the user
     # Note: query parameter is replaced with the user input
     url = f"https://search.naver.com/search.naver?ssc=tab.news.all&query={encoded_query}&sm=tab_opt&sort=1&nso=so%3Add"
-    
-    headers = get_random_headers()
+    max_pages = max(1, SEARCH_MAX_PAGES if max_pages is None else max_pages)
     
     # Statistics tracking
     stats = {
         'total': 0,
         'success': 0,
         'duplicate': 0,
-        'failed': 0
+        'failed': 0,
+        'cache_hit': 0,
+        'cache_miss': 0,
+        'cache_bytes_saved': 0,
+        'extract_cache_hit': 0,
+        'watermark_skip': 0,
+        'pages': 0,
+        'near_duplicate': 0,
+        'resumed': 0,
     }
     
+    wm = _watermarks.get()
+    wm_key = watermarks.watermark_key(query, keyword_id)
+    # 조용한 키워드는 검색 결과 페이지만 건너뛴다 (저널에서 이어갈 기사, 재시도 기사는 그대로 처리)
+    quiet = wm is not None and wm.should_skip(wm_key)
+
+    # 이번 실행에서 처리가 끝난 링크 (저장 성공 또는 DB 중복 확인) → 다음 실행의 멈춤 지점
+    resolved = []
+    # 할당량이 차서 확인하지 못한 새 기사가 남았는지 (남았으면 멈춤 지점을 옮기지 않음)
+    leftover = False
+
     try:
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Naver News search results list
-        news_list_ul = soup.select_one("ul.list_news")
-        
-        print(f"검색어 '{query}'에 대한 뉴스 검색 결과입니다.\n")
-        
-        if not news_list_ul:                        
-            print("뉴스 기사 리스트를 찾을 수 없습니다.")
-            return stats
+        seen = wm.seen_links(wm_key) if wm is not None else None
+        # 이전 실행에서 본문을 받지 못한 기사 (멈춤 지점 아래에 있어도 다시 후보로)
+        retry = wm.retry_records(wm_key) if wm is not None else []
+        if not quiet:
+            print(f"검색어 '{query}'에 대한 뉴스 검색 결과입니다.\n")
 
+        # 이전 실행에서 중간에 멈춘 기사 (저널에 기록된 마지막 단계 다음부터 이어서 처리)
+        journal = _journal.get()
+        resumed = []
+        if journal is not None:
+            for job in journal.pending(keyword_id=keyword_id, query=query):
+                if claims is None or claims.claim(job['link'], job['title']):
+                    job['resumed'] = True
+                    resumed.append(job)
+            if resumed:
+                stats['resumed'] = len(resumed)
+                print(f"♻️ 이전 실행에서 중단된 기사 {len(resumed)}건 이어서 처리")
 
-        # Find headlines with fallback strategies (내구성 향상)
-        headline_selectors = [
-            lambda c: c and 'sds-comps-text-type-headline1' in c,  # Current selector
-            lambda c: c and 'news_tit' in c,  # Legacy selector
-            lambda c: c and 'title' in c.lower() and 'news' in c.lower(),  # Generic
-        ]
-        
-        headlines = []
-        for selector in headline_selectors:
-            headlines = news_list_ul.find_all(class_=selector)
-            if headlines:
-                print(f"✓ 헤드라인 발견 (셀렉터 전략 사용)")
+        if quiet:
+            next_at = time.strftime('%H:%M', time.localtime(wm.next_check_at(wm_key)))
+            print(f"💤 '{query}': 최근 실행에서 새 기사 없음 → {next_at} 이후 다시 확인")
+            stats['watermark_skip'] = 1
+            if not resumed and not retry:
+                return stats
+
+        # 1단계: 중복 제외 (검색 결과 페이지마다 DB 조회 1회)
+        # 앞쪽 결과가 모두 중복이면 start= 오프셋으로 다음 페이지까지 내려가 max_articles개를 채운다.
+        candidates = []
+        page_links = set()
+        for page in range(max_pages):
+            if quiet:
+                records, reached = [], True
+            else:
+                page_url = url if page == 0 else f"{url}&start={page * SEARCH_PAGE_SIZE + 1}"
+                response = get_http_client().cached_get(page_url, stats=stats)
+                response.raise_for_status()
+                stats['pages'] += 1
+
+                records, reached = parse_search_results(response.text, stop_links=seen)
+
+            if page == 0:
+                if records is None:
+                    print("뉴스 기사 리스트를 찾을 수 없습니다.")
+                    break
+                if wm is not None and not quiet:
+                    wm.mark_checked(wm_key, records[0] if records else None, found_new=bool(records))
+                if not records and not retry:
+                    print("새 기사 없음 (이전에 처리한 기사까지 도달)" if reached else "뉴스 기사를 찾을 수 없습니다.")
+                    break
+                if records:
+                    print(f"✓ 헤드라인 발견 (셀렉터 전략: {search_parser.strategy}"
+                          f"{', 이전 처리 지점까지 ' + str(len(records)) + '건' if reached else ''})")
+                listed = {r['link'] for r in records}
+                extra = [r for r in retry if r['link'] not in listed]
+                if extra:
+                    print(f"🔁 이전 실행에서 본문을 받지 못한 기사 {len(extra)}건 다시 시도")
+                    records = records + extra
+            elif not records:
                 break
+            else:
+                print(f"📄 {page + 1}페이지: 새 기사 {len(records)}건 확인")
 
-        if not headlines:
-             print("뉴스 기사를 찾을 수 없습니다.")
-             return stats
+            # 페이지끼리 겹치는 결과 제거
+            records = [r for r in records if not r['link'] or r['link'] not in page_links]
+            page_links.update(r['link'] for r in records)
 
-        # Limit to top N articles per keyword to avoid spamming
-        for i, headline in enumerate(headlines[:max_articles]):
-            stats['total'] += 1
-            
-            try:
-                # Title
-                title = headline.get_text(strip=True)
-                
-                # Link (parent a tag)
-                link_el = headline.find_parent("a")
-                link = link_el['href'] if link_el else ""
-                
-                # Check for duplicates
-                if link and db_manager.is_duplicate_news(link):
-                    print(f"[중복 건너뛰기] {title}")
-                    stats['duplicate'] += 1
-                    continue
-                if title and db_manager.is_duplicate_title_recent(title, days=7):
-                    print(f"[제목중복 건너뛰기] {title}")
-                    stats['duplicate'] += 1
-                    continue
-                
-                
-                # Press (closest preceding press element) with fallback
-                press_selectors = [
-                    lambda c: c and 'sds-comps-profile-info-title-text' in c,
-                    lambda c: c and 'press' in c.lower(),
-                    lambda c: c and 'info_group' in c,
-                ]
-                
-                press = "언론사 정보 없음"
-                for press_selector in press_selectors:
-                    press_el = headline.find_previous(class_=press_selector)
-                    if press_el:
-                        press = press_el.get_text(strip=True)
-                        break
+            _, duplicates = db_manager.filter_new_candidates(
+                [(r['link'], r['title']) for r in records], days=7
+            )
+            journaled = journal.states([r['link'] for r in records]) if journal is not None else {}
+
+            for record in records:
+                if len(candidates) >= max_articles:
+                    leftover = True
+                    break
+                stats['total'] += 1
 
-                print(f"언론사: {press}")
-                print(f"제목: {title}")
-                print(f"링크: {link}")
-                
-                
-                content = ""
-                if link:
-                    # Rate limiting: Random delay to avoid IP blocking
-                    delay = random.uniform(1.0, 3.0)
-                    print(f"본문 내용 추출 중... (대기: {delay:.1f}초)")
-                    time.sleep(delay)
-                    content = get_news_content(link)
-                    # print(f"본문:\n{content}") # Too verbose
-                
-                if use_ai and content and "본문 내용을 추출할 수 없습니다" not in content:
-                    print("\n[AI 팟캐스트 대본 생성 중...]")
-                    script = generate_podcast_script(title, content, requirements=requirements)
-                    print(f"--- 팟캐스트 대본 ---\n{script[:200]}...\n---------------------")
-                    
-                    if make_audio:
-                        print("[오디오 파일 생성 중...]")
-                        
-                        # Ensure MP3 directory exists
-                        if not os.path.exists("MP3"):
-                            os.makedirs("MP3")
-                            
-                        # Create a safe filename
-                        safe_title = "".join([c for c in title if c.isalnum() or c in (' ', '-', '_')]).strip()[:30]
-                        filename = os.path.join("MP3", f"podcast_{safe_title}_{i}.mp3")
-                        
-                        # Pass title to audio generator for announcement
-                        audio_result = run_audio_generation(script, filename, title=title)
-                        
-                        # Check if audio was successfully generated
-                        if not audio_result:
-                            print("❌ 오디오 생성 실패 - 유효한 대본이 없습니다. 업로드 및 DB 저장 건너뜀.")
-                            stats['failed'] += 1
-                        else:
-                            # ✅ 파일 크기 이중 검증 (안전장치)
-                            try:
-                                file_size = os.path.getsize(filename)
-                                file_size_mb = file_size / (1024 * 1024)
-                                
-                                if file_size < 1048576:  # 1MB = 1048576 bytes
-                                    print(f"❌ 파일 크기 부족: {file_size_mb:.2f}MB (최소 1MB 필요)")
-                                    print(f"   업로드 및 DB 등록 건너뜀")
-                                    if os.path.exists(filename):
-                                        os.remove(filename)
-                                        print(f"   로컬 파일 삭제: {filename}")
-                                    stats['failed'] += 1
-                                    continue
-                                
-                                print(f"✅ 파일 크기 검증 통과: {file_size_mb:.2f}MB")
-                            except Exception as e:
-                                print(f"❌ 파일 크기 확인 중 오류: {e}")
-                                stats['failed'] += 1
-                                continue
-                            
-                            print("[서버로 업로드 중...]")
-                            remote_path = upload_file(filename)
-                            
-                            if remote_path:
-                                duration_sec = _measure_mp3_duration(filename)
-                                summary = _build_summary(content)
-                                print(f"[DB 저장 중...] {title}")
-                                db_manager.insert_episode(
-                                    press, title, link, remote_path,
-                                    keyword_id=keyword_id,
-                                    duration_sec=duration_sec,
-                                    summary=summary,
-                                )
-
-                                if safe_remove(filename):
-                                    print(f"[로컬 파일 삭제] {filename}")
-                                stats['success'] += 1
-                            else:
-                                # 업로드 최종 실패: 다음 실행 때 cleanup_stale_mp3가 정리하도록 둠
-                                print("[업로드 실패] 로컬 파일 유지 (24h 후 자동 정리)")
-                                stats['failed'] += 1
-                else:
-                    print("[본문 추출 실패 또는 AI 처리 건너뛰기]")
+                try:
+                    title = record['title']
+                    link = record['link']
+                    press = record['press']
+
+                    # Check for duplicates
+                    reason = duplicates.get((link, title))
+                    if reason:
+                        print(f"[{'중복' if reason == 'link' else '제목중복'} 건너뛰기] {title}")
+                        stats['duplicate'] += 1
+                        resolved.append(link)
+                        continue
+                    state = journaled.get(link)
+                    if state == stage_journal.ABANDONED:
+                        print(f"[포기한 기사 건너뛰기] {title}")
+                        stats['duplicate'] += 1
+                        resolved.append(link)
+                        continue
+                    if state in (stage_journal.ACTIVE, stage_journal.STUCK):
+                        # active는 위에서 이어서 처리, stuck은 관리 CLI에서 retry/abandon
+                        print(f"[저널에서 처리 중인 기사] {title}")
+                        stats['duplicate'] += 1
+                        continue
+                    if claims is not None and not claims.claim(link, title):
+                        print(f"[다른 키워드에서 처리 중] {title}")
+                        stats['duplicate'] += 1
+                        continue
+
+                    candidates.append((title, link, press))
+                except Exception as e:
+                    print(f"[기사 처리 중 오류] {e}")
                     stats['failed'] += 1
+                    continue
 
-                print("-" * 50)
-                
-            except Exception as e:
-                print(f"[기사 처리 중 오류] {e}")
-                stats['failed'] += 1
-                print("-" * 50)
-                continue  # Move to next article
+            if len(candidates) >= max_articles:
+                # 멈춤 지점에 닿기 전에 할당량이 찼으면 아래쪽 결과는 아직 확인하지 않은 것
+                leftover = leftover or not reached
+                break
+            if reached:
+                break
+
+        # 2단계: 본문 다운로드 → 대본 → 오디오 → 업로드 → DB를 단계별 파이프라인으로 겹쳐 처리
+        # (이어서 처리할 기사는 저널에 기록된 마지막 단계 다음부터 들어감)
+        for job in resumed:
+            print(f"[이어서 처리] {job['title']} (마지막 완료 단계: {job['stage']})")
+        context = {'stats': stats, 'resolved': resolved, 'requirements': requirements,
+                   'use_ai': use_ai, 'make_audio': make_audio}
+        jobs = [dict(job, **context) for job in resumed] + [
+            dict(context, title=title, link=link, press=press, keyword_id=keyword_id, query=query,
+                 content="", stage=None)
+            for title, link, press in candidates
+        ]
+        if candidates:
+            print(f"본문 내용 추출 중... ({len(candidates)}건, 추출이 끝난 기사부터 대본 생성 시작)")
+        _get_pipeline().run_batch(jobs, entry=_entry_stage)
+        # 통계/워터마크에 DB 저장 결과가 반영되도록 이 키워드의 남은 행을 저장
+        _flush_episodes()
+        if wm is not None:
+            # 저널에 들어가기 전(본문 다운로드/추출)에 끝난 기사 → 다음 실행에서 멈춤 지점과 상관없이 재시도
+            done = set(resolved)
+            wm.mark_failed(wm_key, [job for job in jobs
+                                    if not job.get('resumed') and job.get('id') is None and job['link'] not in done],
+                           resolved=done)
             
     except requests.exceptions.RequestException as e:
         print(f"에러가 발생했습니다: {e}")
+    finally:
+        if wm is not None and not leftover:
+            wm.mark_resolved(wm_key, resolved)
     
     # Print statistics
-    print(f"\n📊 크롤링 통계 - 총: {stats['total']}, 성공: {stats['success']}, 중복: {stats['duplicate']}, 실패: {stats['failed']}\n")
+    print(f"\n📊 크롤링 통계 - 페이지: {stats['pages']}, 총: {stats['total']}, 성공: {stats['success']}, 중복: {stats['duplicate']}, 유사: {stats['near_duplicate']}, 실패: {stats['failed']}, 재개: {stats['resumed']}"
+          f" | 캐시 적중: {stats['cache_hit']}, 미스: {stats['cache_miss']}, 절약: {stats['cache_bytes_saved'] / 1024:.0f}KB"
+          f", 본문캐시: {stats['extract_cache_hit']}\n")
     return stats
 
-def validate_content(content):
-    """Validate article content quality."""
-    if not content or len(content) < 200:
-        return False
-    
-    # Check Korean character ratio
-    korean_chars = len([c for c in content if '가' <= c <= '힣'])
-    total_chars = len(content.replace('\n', '').replace(' ', ''))
-    
-    if total_chars == 0:
-        return False
-    
-    if korean_chars / total_chars < 0.3:  # At least 30% Korean
-        return False
-    
-    return True
+def _episode_audio_path(job):
+    """저널 항목이면 보관 폴더에 항목 id로, 아니면 MP3/에 실행 내 순번으로."""
+    safe_title = "".join([c for c in job['title'] if c.isalnum() or c in (' ', '-', '_')]).strip()[:30]
+    if job.get('id') is not None:
+        os.makedirs(stage_journal.JOURNAL_AUDIO_DIR, exist_ok=True)
+        return os.path.join(stage_journal.JOURNAL_AUDIO_DIR, f"podcast_{safe_title}_{job['id']}.mp3")
+    if not os.path.exists("MP3"):
+        os.makedirs("MP3")
+    return os.path.join("MP3", f"podcast_{safe_title}_{next(_episode_seq)}.mp3")
 
 
-def clean_article_text(text):
-    """Remove reporter info, copyright, and other unwanted patterns from article text."""
-    if not text:
-        return text
-    
-    # 기자 이메일 제거
-    text = re.sub(r'\w+@\w+\.\w+', '', text)
-    
-    # 기자 서명 패턴 제거
-    reporter_patterns = [
-        r'.*?기자\s*=\s*',
-        r'.*?특파원\s*=\s*', 
-        r'\[.*?기자\]',
-        r'기자\s+\w+',
-    ]
-    for pattern in reporter_patterns:
-        text = re.sub(pattern, '', text)
-    
-    # 저작권/출처 관련 제거
-    copyright_patterns = [
-        r'Copyright\s*©.*',
-        r'저작권자.*',
-        r'무단\s*전재.*',
-        r'배포\s*금지.*',
-        r'ⓒ.*',
-    ]
-    for pattern in copyright_patterns:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-    
-    # SNS 공유 관련 제거
-    text = re.sub(r'(카카오톡|페이스북|트위터|공유하기).*', '', text)
-    
-    # ===== 네이버 뉴스 특유 불필요 텍스트 제거 =====
-    naver_noise_patterns = [
-        r'기사 섹션 분류 안내.*?있습니다\.',  # 섹션 분류 안내
-        r'이 기사는 언론사에서.*?분류했습니다\.',  # 언론사 분류 안내
-        r'섹션으로 분류했습니다',
-        r'.*?바로가기\n?',  # 바로가기 링크
-        r'기사의 섹션 정보는.*',  # 섹션 정보 안내
-        r'언론사는 개별 기사를.*',  # 언론사 안내
-        r'\[.*?뉴스\]',  # [OO뉴스] 패턴
-        r'【.*?】',  # 【기사】 패턴
-        r'▶.*?\n?',  # ▶ 관련기사 등
-        r'◆.*?\n?',  # ◆ 관련기사 등
-        r'■.*?\n?',  # ■ 관련기사 등
-        r'☞.*?\n?',  # ☞ 관련기사 등
-        r'▷.*?\n?',  # ▷ 관련기사 등
-        r'사진=.*?\n?',  # 사진 출처
-        r'\(사진.*?\)',  # (사진 설명)
-        r'영상=.*?\n?',  # 영상 출처
-    ]
-    for pattern in naver_noise_patterns:
-        text = re.sub(pattern, '', text, flags=re.DOTALL)
-    
-    # 여러 줄바꿈을 2개로 정리
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    
-    # 앞뒤 공백 제거
-    text = text.strip()
-    
-    return text
+def _job_journal(job):
+    return _journal.get() if job['link'] else None
+
+
+def _advance(job, stage, **artifacts):
+    """stage 완료 기록 (저널이 없으면 job에만 반영)."""
+    journal = _job_journal(job)
+    if journal is not None:
+        journal.advance(job, stage, **artifacts)
+    else:
+        job.update(artifacts, stage=stage)
+
+
+def _give_up(job, error, rewind_to=None):
+    """이번 실행에서는 실패 처리. 저널에는 실패 1회로 남기고, rewind_to가 있으면 그 단계로 되돌림."""
+    _bump(job['stats'], 'failed')
+    _release_near_dup(job)
+    journal = _job_journal(job)
+    if journal is None or job.get('id') is None:
+        return
+    if rewind_to:
+        journal.rewind(job, rewind_to, error)
+    else:
+        journal.fail(job, error)
+    if job.get('state') == stage_journal.STUCK:
+        print(f"   ⛔ {journal.max_attempts}회 연속 실패 → 자동 재시도 중단 (scripts/manage_stage_journal.py)")
+
+
+def _release_near_dup(job):
+    """_stage_script에서 잡아 둔 유사 기사 색인 자리를 돌려준다 (에피소드가 만들어지지 않은 경우)."""
+    if job.pop('near_dup_reserved', False):
+        index = _get_near_dup_index()
+        if index is not None:
+            index.release(job.get('simhash'), ref=job['title'])
+
+
+def _stage_fetch(job):
+    """본문 다운로드 (호스트별 동시성/간격 제한은 ArticleFetcher가 적용)."""
+    if _shutdown_requested:
+        # 아직 비용을 쓰지 않은 기사는 다음 실행에서 (resolved에 없으므로 재시도됨)
+        return None
+    content = _article_fetcher.fetch(job['link'], stats=job['stats']) if job['link'] else ""
+    job['content'] = content or ""
+    print(f"언론사: {job['press']}")
+    print(f"제목: {job['title']}")
+    print(f"링크: {job['link']}")
+    if not (job['use_ai'] and content and "본문 내용을 추출할 수 없습니다" not in content):
+        print(f"[본문 추출 실패 또는 AI 처리 건너뛰기] {job['title']}")
+        _bump(job['stats'], 'failed')
+        return None
+    return job
+
+
+def _stage_script(job):
+    """유사 기사 확인 → 저널 기록(fetched) → 대본 생성(scripted)."""
+    title, link = job['title'], job['link']
+    if job['stage'] in (None, stage_journal.FETCHED):
+        if _shutdown_requested:
+            return None
+        # 다른 언론사가 재송고한 같은 기사면 대본/TTS 비용을 쓰기 전에 건너뜀.
+        # 통과하면 바로 색인에 자리를 잡아, 동시에 처리 중인 같은 본문도 여기서 걸러지게 한다
+        fingerprint = near_dup.simhash(job['content'])
+        index = _get_near_dup_index()
+        match = index.reserve(fingerprint, ref=title) if index is not None else None
+        if index is not None and match is None and fingerprint is not None:
+            job.update(simhash=fingerprint, near_dup_reserved=True)
+        if match:
+            print(f"[유사 기사 건너뛰기] {title} - '{match[0]}'와 거의 같은 본문 (해밍 거리 {match[1]})")
+            _bump(job['stats'], 'near_duplicate')
+            job['resolved'].append(link)
+            journal = _job_journal(job)
+            if journal is not None and job.get('id') is not None:
+                journal.discard(job)
+            return None
+        if job['stage'] is None:
+            job.update(simhash=fingerprint, summary=_build_summary(job['content']))
+            journal = _job_journal(job)
+            if journal is not None:
+                journal.begin(job)
+            else:
+                job['stage'] = stage_journal.FETCHED
+
+    if job['stage'] == stage_journal.FETCHED:
+        print(f"\n[AI 팟캐스트 대본 생성 중...] {title}")
+        script = generate_podcast_script(title, job['content'], requirements=job['requirements'])
+        _advance(job, stage_journal.SCRIPTED, script=script)
+        print(f"--- 팟캐스트 대본 ({title}) ---\n{script[:200]}...\n---------------------")
+    if not job['make_audio']:
+        _release_near_dup(job)  # 에피소드로 저장하지 않음
+        return None
+    return job
+
+
+def _stage_render(job):
+    """TTS + MP3 합치기(rendered). 결과 파일 크기 검증."""
+    title = job['title']
+    print(f"[오디오 파일 생성 중...] {title}")
+    filename = _episode_audio_path(job)
+
+    # Pass title to audio generator for announcement
+    audio_result = run_audio_generation(job['script'], filename, title=title)
+
+    # Check if audio was successfully generated
+    if not audio_result:
+        print(f"❌ 오디오 생성 실패 - 유효한 대본이 없습니다. 업로드 및 DB 저장 건너뜀. ({title})")
+        _give_up(job, "오디오 생성 실패 (유효한 대본 없음)", rewind_to=stage_journal.FETCHED)
+        return None
+
+    # ✅ 파일 크기 이중 검증 (안전장치)
+    try:
+        file_size = os.path.getsize(filename)
+        file_size_mb = file_size / (1024 * 1024)
+
+        if file_size < 1048576:  # 1MB = 1048576 bytes
+            print(f"❌ 파일 크기 부족: {file_size_mb:.2f}MB (최소 1MB 필요) - {title}")
+            print(f"   업로드 및 DB 등록 건너뜀")
+            if os.path.exists(filename):
+                os.remove(filename)
+                print(f"   로컬 파일 삭제: {filename}")
+            _give_up(job, f"파일 크기 부족 ({file_size_mb:.2f}MB)", rewind_to=stage_journal.FETCHED)
+            return None
+
+        print(f"✅ 파일 크기 검증 통과: {file_size_mb:.2f}MB")
+    except Exception as e:
+        print(f"❌ 파일 크기 확인 중 오류: {e}")
+        _give_up(job, f"파일 크기 확인 오류: {e}", rewind_to=stage_journal.SCRIPTED)
+        return None
+    _advance(job, stage_journal.RENDERED, mp3_path=filename)
+    return job
+
+
+def _stage_upload(job):
+    """SFTP 업로드(uploaded) + 재생 길이 측정."""
+    filename = job['mp3_path']
+    if not os.path.exists(filename):
+        print(f"❌ 보관 중인 MP3 없음: {filename} → 다음 실행에서 오디오 다시 생성")
+        _give_up(job, "MP3 파일 유실", rewind_to=stage_journal.SCRIPTED)
+        return None
+
+    print(f"[서버로 업로드 중...] {job['title']}")
+    remote_path = upload_file(filename)
+    if not remote_path:
+        # 업로드 최종 실패: 저널이 있으면 MP3를 보관해 다음 실행에서 업로드만 다시 시도
+        if _job_journal(job) is not None:
+            print("[업로드 실패] MP3 보관 - 다음 실행에서 업로드부터 재시도")
+        else:
+            print("[업로드 실패] 로컬 파일 유지 (24h 후 자동 정리)")
+        _give_up(job, "업로드 실패")
+        return None
+    _advance(job, stage_journal.UPLOADED, remote_path=remote_path, duration_sec=_measure_mp3_duration(filename))
+    return job
+
+
+def _stage_record(job):
+    """DB 저장 요청. 실제 INSERT는 EpisodeWriter가 모아서 한 트랜잭션으로 하고 _finish_record를 호출."""
+    title, link = job['title'], job['link']
+    # 저장 직후 저널 기록 전에 죽었던 경우 다시 넣지 않음
+    if job.get('resumed') and db_manager.is_duplicate_news(link):
+        print(f"[DB에 이미 저장됨] {title}")
+        _finish_record(job, db_manager.DUPLICATE, None)
+        return None
+    print(f"[DB 저장 대기] {title}")
+    future = _episode_writer.get().add(
+        press=job['press'], title=title, link=link, mp3_path=job['remote_path'],
+        keyword_id=job['keyword_id'],
+        duration_sec=job['duration_sec'],
+        summary=job['summary'],
+        content_simhash=job['simhash'],
+    )
+    future.add_done_callback(lambda f: _finish_record(job, *f.result()))
+    return None
+
+
+def _finish_record(job, outcome, error):
+    """일괄 저장 결과 반영: 성공/이미 있음이면 recorded + 로컬 MP3 삭제, 실패면 다음 실행에서 DB 저장만 재시도."""
+    title = job['title']
+    if outcome == db_manager.FAILED:
+        print(f"[DB 저장 실패] {title}: {error}")
+        _give_up(job, f"DB 저장 실패: {error}")
+        return
+    if outcome == db_manager.INSERTED and not job.pop('near_dup_reserved', False):
+        # 대본 단계를 거치지 않고 이어서 처리한 기사는 여기서 색인에 추가
+        index = _get_near_dup_index()
+        if index is not None:
+            index.add(job['simhash'], ref=title)
+    _advance(job, stage_journal.RECORDED)
+
+    filename = job.get('mp3_path')
+    if filename and safe_remove(filename):
+        print(f"[로컬 파일 삭제] {filename}")
+    _bump(job['stats'], 'success')
+    job['resolved'].append(job['link'])
+
+
+def _on_stage_error(stage, job, error):
+    print(f"[기사 처리 중 오류] ({stage}) {job['title']}: {error}")
+    _give_up(job, f"{stage}: {error}")
+
+
+# ===== 단계별 파이프라인 =====
+# 본문 다운로드 → 대본(Claude) → 오디오(TTS/ffmpeg) → 업로드(SFTP) → DB 저장을 단계마다
+# 별도 워커로 겹쳐 실행. 모든 키워드 작업이 한 파이프라인을 공유하므로 단계별 동시성이 전체에 적용된다.
+PIPELINE_SCRIPT_WORKERS = config.PIPELINE_SCRIPT_WORKERS
+PIPELINE_RENDER_WORKERS = config.PIPELINE_RENDER_WORKERS
+PIPELINE_UPLOAD_WORKERS = config.PIPELINE_UPLOAD_WORKERS
+PIPELINE_RECORD_WORKERS = config.PIPELINE_RECORD_WORKERS
+# 단계 사이 큐 크기 (앞 단계가 이만큼 앞서면 기다림)
+PIPELINE_QUEUE_SIZE = config.PIPELINE_QUEUE_SIZE
+
+# 저널의 마지막 완료 단계 → 다음에 실행할 파이프라인 단계
+_NEXT_STAGE = {
+    None: "fetch",
+    stage_journal.FETCHED: "script",
+    stage_journal.SCRIPTED: "render",
+    stage_journal.RENDERED: "upload",
+    stage_journal.UPLOADED: "record",
+}
+
+
+def _entry_stage(job):
+    return _NEXT_STAGE[job['stage']]
+
+
+def _build_pipeline():
+    return stage_pipeline.Pipeline([
+        stage_pipeline.Stage("fetch", _stage_fetch, FETCH_MAX_WORKERS, PIPELINE_QUEUE_SIZE),
+        stage_pipeline.Stage("script", _stage_script, PIPELINE_SCRIPT_WORKERS, PIPELINE_QUEUE_SIZE),
+        stage_pipeline.Stage("render", _stage_render, PIPELINE_RENDER_WORKERS, PIPELINE_QUEUE_SIZE),
+        stage_pipeline.Stage("upload", _stage_upload, PIPELINE_UPLOAD_WORKERS, PIPELINE_QUEUE_SIZE),
+        stage_pipeline.Stage("record", _stage_record, PIPELINE_RECORD_WORKERS, PIPELINE_QUEUE_SIZE),
+    ], on_error=_on_stage_error, name="episode")
+
+
+_pipeline = _Lazy(_build_pipeline)
+
+
+def _get_pipeline():
+    return _pipeline.get()
+
+
+def _open_episode_writer():
+    writer = episode_writer.EpisodeWriter()
+    atexit.register(writer.close)  # 종료 시 버퍼에 남은 행 저장
+    return writer
+
 
-def get_news_content(url):
+_episode_writer = _Lazy(_open_episode_writer)
+
+
+def _flush_episodes():
+    """버퍼에 모인 에피소드를 지금 저장 (결과 콜백까지 끝난 뒤 반환)."""
+    if _episode_writer.created:
+        _episode_writer.get().flush()
+
+
+def _print_pipeline_report():
+    """실행 구간의 단계별 사용률 / 큐 길이 출력 후 측정 초기화."""
+    if not _pipeline.created:
+        return
+    print("⚙️ 파이프라인 단계별 현황")
+    print(stage_pipeline.format_report(_pipeline.get().report(reset=True)))
+
+
+# ===== 본문 추출 프로세스 풀 =====
+# trafilatura.extract + 정제는 CPU 작업이라 GIL 때문에 스레드로는 코어 하나만 씀.
+# 다운로드는 fetch 스레드에 두고 추출만 프로세스 풀로 넘긴다. 0이면 현재 프로세스에서 실행.
+# 작업자는 fork 대신 forkserver(없으면 spawn)로 만든다: fetch/업로드 스레드가 잡고 있던
+# 잠금(로깅, 커넥션 풀, SQLite)이 fork된 자식에 잠긴 채 복사되면 작업자가 멈출 수 있음.
+# 작업자가 실행 스크립트를 다시 import하므로 진입점은 if __name__ == "__main__": 안에서 실행해야 한다.
+EXTRACT_WORKERS = config.EXTRACT_WORKERS
+
+_extract_pool = None
+_extract_pool_lock = threading.Lock()
+
+
+def _get_extract_pool():
+    global _extract_pool
+    with _extract_pool_lock:
+        if _extract_pool is None and EXTRACT_WORKERS > 0:
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _extract_pool = ProcessPoolExecutor(max_workers=EXTRACT_WORKERS,
+                                                mp_context=multiprocessing.get_context(method))
+            atexit.register(_extract_pool.shutdown, wait=False, cancel_futures=True)
+        return _extract_pool
+
+
+def _run_extraction(html):
+    """프로세스 풀에서 extract_article 실행. 풀이 죽었으면 새로 만들고 이번 건은 직접 처리."""
+    global _extract_pool
+    pool = _get_extract_pool()
+    if pool is None:
+        return extract_article(html)
+    try:
+        return pool.submit(extract_article, html).result()
+    except BrokenProcessPool as e:
+        logger.warning(f"추출 프로세스 풀 재시작: {e}")
+        with _extract_pool_lock:
+            if _extract_pool is pool:
+                _extract_pool = None
+        return extract_article(html)
+
+
+# 추출 결과 영구 캐시 (정규화 URL → 정제 본문/요약, 실패 기록은 TTL)
+_extraction_cache = _Lazy(extraction_cache.open_extraction_cache)
+
+# 유사 기사 색인 (최근 N일 본문 SimHash). 첫 사용 시 DB에서 한 번 적재
+_near_dup_index = near_dup.NearDuplicateIndex() if near_dup.NEAR_DUP_ENABLED else None
+_near_dup_lock = threading.Lock()
+
+
+def _get_near_dup_index():
+    if _near_dup_index is None:
+        return None
+    with _near_dup_lock:
+        if not _near_dup_index.loaded:
+            _near_dup_index.load(db_manager.get_recent_simhashes(_near_dup_index.days))
+    return _near_dup_index
+
+
+# 기사별 처리 단계 저널 (크래시 후 마지막 완료 단계 다음부터 이어서 처리)
+_journal = _Lazy(stage_journal.open_stage_journal)
+
+
+def _open_watermarks():
+    state = watermarks.open_watermarks()
+    if state is not None:
+        atexit.register(state.save)
+    return state
+
+
+# 키워드별 처리 지점 (이미 처리한 링크에서 파싱 중단, 조용한 키워드는 확인 간격 늘림)
+_watermarks = _Lazy(_open_watermarks)
+
+
+def _save_state():
+    """학습한 요청 속도 / 워터마크 / HTTP 캐시 접근 시각 저장 (만들어진 것만)."""
+    if _rate_limiter.created:
+        _rate_limiter.get().save()
+    if _http_client.created and _http_client.get().cache is not None:
+        _http_client.get().cache.flush()
+    if _watermarks.created and _watermarks.get() is not None:
+        _watermarks.get().save()
+
+
+# 다시 요청해도 같은 결과일 응답만 실패 캐시에 남김 (429/408/5xx, 빈 본문은 일시적일 수 있어 다음 실행에서 재시도)
+_TRANSIENT_CLIENT_STATUS = (408, 429)
+
+
+def _is_permanent_failure(status_code):
+    return 400 <= status_code < 500 and status_code not in _TRANSIENT_CLIENT_STATUS
+
+
+def _remember_failure(url, reason):
+    cache = _extraction_cache.get()
+    if cache is not None:
+        cache.put_failure(url, reason)
+
+
+def get_news_content(url, stats=None):
     """
     trafilatura로 기사 본문 추출.
     실패 시 빈 문자열 반환 → 호출부에서 해당 기사 스킵.
+    stats를 넘기면 HTTP 캐시/본문 캐시 적중 수가 누적된다.
     """
     if not _TRAFILATURA_AVAILABLE:
         print(f"  [오류] trafilatura 미설치")
         return ""
 
+    cache = _extraction_cache.get()
+    if cache is not None:
+        entry = cache.get(url)
+        if entry is not None:
+            _bump(stats, "extract_cache_hit")
+            if entry["status"] != "ok":
+                print(f"  [캐시] 최근 실패 기록({entry['status']}) 링크 스킵: {url}")
+                return ""
+            article = ArticleText(entry["text"])
+            article.summary = entry["summary"]
+            print(f"  [캐시] 저장된 본문 사용 ({len(article)}자)")
+            return article
+
     try:
-        downloaded = trafilatura.fetch_url(url)
-        if not downloaded:
-            print(f"  [실패] 페이지 다운로드 실패: {url}")
+        response = get_http_client().cached_get(url, fresh_for=HTTP_CACHE_ARTICLE_TTL, stats=stats)
+        if response.status_code != 200 or not response.content:
+            print(f"  [실패] 페이지 다운로드 실패 (HTTP {response.status_code}): {url}")
+            if _is_permanent_failure(response.status_code):
+                _remember_failure(url, extraction_cache.DOWNLOAD_FAILED)
             return ""
-
-        extracted = trafilatura.extract(
-            downloaded,
-            include_comments=False,
-            include_tables=False,
-            favor_precision=True,
-        )
-        if not extracted:
+        # bytes 그대로 넘겨 trafilatura가 charset(EUC-KR 등)을 판별하도록 함
+        # 추출+정제는 CPU 작업이므로 프로세스 풀에서 실행 (이 스레드는 결과만 대기)
+        status, text, summary = _run_extraction(response.content)
+        if status == extraction_cache.EXTRACT_FAILED:
             print(f"  [실패] 본문 추출 실패: {url}")
+            _remember_failure(url, status)
             return ""
-
-        cleaned = clean_article_text(extracted)
-        if not validate_content(cleaned):
+        if status == extraction_cache.VALIDATION_FAILED:
             print(f"  [실패] 본문 검증 실패 (너무 짧거나 한글 비율 낮음)")
+            _remember_failure(url, status)
             return ""
 
+        cleaned = ArticleText(text)
+        cleaned.summary = summary
         print(f"  [추출] trafilatura ({len(cleaned)}자)")
+        if cache is not None:
+            cache.put(url, str(cleaned), cleaned.summary)
         return cleaned
     except Exception as e:
+        # 타임아웃 등 일시적 오류는 실패 기록을 남기지 않음 (다음 실행에서 재시도)
         print(f"  [오류] 추출 중 예외: {e}")
         return ""
 
 
-def run_crawling_job():
+_STAT_KEYS = ('total', 'success', 'duplicate', 'failed', 'cache_hit', 'cache_miss', 'cache_bytes_saved',
+              'extract_cache_hit', 'watermark_skip', 'pages', 'near_duplicate', 'resumed')
+
+
+def _merge_stats(total, stats):
+    for key in _STAT_KEYS:
+        total[key] += (stats or {}).get(key, 0)
+
+
+def _run_keywords(keywords, max_workers=None):
+    """키워드 목록을 병렬 처리하고 합계 통계 반환. 종료 요청 후에는 새 키워드를 시작하지 않는다."""
+    workers = max(1, min(max_workers or KEYWORD_WORKERS, len(keywords)))
+    claims = RunClaims()
+    totals = dict.fromkeys(_STAT_KEYS, 0)
+
+    def _run_keyword(k):
+        if _shutdown_requested:
+            return None
+        print(f"\n>>> 검색어 '{k['keyword']}' (우선순위: {k.get('priority', 0)}) 크롤링 시작...")
+        return crawl_naver_news(
+            query=k['keyword'],
+            keyword_id=k['id'],
+            requirements=k['requirements'],
+            use_ai=True,
+            make_audio=True,
+            claims=claims,
+        )
+
+    # 우선순위 순으로 제출 → 풀의 FIFO 큐가 높은 우선순위부터 시작시킴.
+    # 같은 기사를 여러 키워드가 찾으면 먼저 선점(claims)한 쪽만 처리.
+    print(f"🔀 키워드 {len(keywords)}개를 워커 {workers}개로 처리")
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="keyword") as pool:
+        futures = [(k, pool.submit(_run_keyword, k)) for k in keywords]
+        for k, fut in futures:
+            try:
+                _merge_stats(totals, fut.result())
+            except Exception as e:
+                print(f"[키워드 처리 중 오류] {k['keyword']}: {e}")
+
+    _save_state()
+    print(f"\n📊 전체 통계 - 키워드: {len(keywords)} (새 기사 없어 건너뜀 {totals['watermark_skip']}), "
+          f"검색 페이지: {totals['pages']}, 총: {totals['total']}, 성공: {totals['success']}, "
+          f"중복: {totals['duplicate']}, 유사: {totals['near_duplicate']}, 실패: {totals['failed']}, 재개: {totals['resumed']} | 캐시 적중: {totals['cache_hit']}, "
+          f"미스: {totals['cache_miss']}, 절약: {totals['cache_bytes_saved'] / 1024:.0f}KB, "
+          f"본문캐시: {totals['extract_cache_hit']}")
+    dedup = db_manager.get_dedup_stats()
+    if dedup is not None:
+        print(f"🧠 중복 확인 - 메모리: {dedup['memory_hits']}건, DB: {dedup['db_lookups']}건")
+    pool = db_manager.get_pool_stats()
+    if pool is not None:
+        print(f"🔌 DB 커넥션 풀 - 대여: {pool['acquired']}회, 재사용률: {pool['hit_rate'] * 100:.0f}%, "
+              f"새 연결: {pool['created']}개, 대기: {pool['waited']}회 (평균 {pool['avg_wait_ms']:.1f}ms, "
+              f"최대 {pool['max_wait_ms']:.0f}ms), 폐기: {pool['discarded'] + pool['ping_failed'] + pool['expired']}개")
+    if _episode_writer.created:
+        w = _episode_writer.get().stats
+        print(f"💾 에피소드 일괄 저장 - {w['rows']}건 / {w['batches']}회 커밋, 저장: {w[db_manager.INSERTED]}, "
+              f"이미 있음: {w[db_manager.DUPLICATE]}, 실패: {w[db_manager.FAILED]}, 소요: {w['flush_sec']:.2f}s")
+    _print_pipeline_report()
+    print()
+    return totals
+
+
+def run_crawling_job(max_workers=None):
     # 이전 실행에서 업로드 실패로 남은 오래된 MP3 정리
     cleanup_stale_mp3(mp3_dir="MP3", age_hours=24)
 
     keywords = db_manager.get_active_keywords()
+    # 링크/제목 중복 확인용 색인을 한 번에 적재 (이후 페이지별 중복 조회는 대부분 메모리에서 처리)
+    db_manager.preload_dedup_index(days=7)
 
     if not keywords:
         print("활성화된 검색어가 없습니다. 기본값 '인공지능'으로 실행합니다.")
         crawl_naver_news("인공지능", use_ai=True, make_audio=True)
+        _print_pipeline_report()
         return
 
-    for k in keywords:
-        print(f"\n>>> 검색어 '{k['keyword']}' (우선순위: {k.get('priority', 0)}) 크롤링 시작...")
-        crawl_naver_news(
-            query=k['keyword'],
-            keyword_id=k['id'],
-            requirements=k['requirements'],
-            use_ai=True,
-            make_audio=True
-        )
+    return _run_keywords(keywords, max_workers)
+
+
+# ===== 상주(daemon) 모드 =====
+# cron마다 프로세스를 새로 띄우는 대신 한 번 떠서 키워드별 주기로 크롤링.
+# import/ffmpeg 탐색/init_db는 시작 시 한 번, HTTP 세션·SFTP 연결·색인은 계속 재사용.
+DAEMON_DEFAULT_INTERVAL_MIN = config.DAEMON_DEFAULT_INTERVAL_MIN
+# 키워드 목록 재조회/다음 실행 확인 최대 간격(초)
+DAEMON_TICK_SEC = config.DAEMON_TICK_SEC
+# 중복 색인 재적재 + 오래된 MP3 정리 주기(분)
+DAEMON_REFRESH_MIN = config.DAEMON_REFRESH_MIN
+
+
+def _keyword_interval_sec(k):
+    return float(k.get('crawl_interval_min') or DAEMON_DEFAULT_INTERVAL_MIN) * 60
+
+
+def run_daemon(max_workers=None):
+    """
+    SIGTERM/SIGINT까지 상주. 실행할 때가 된 키워드만 모아 _run_keywords로 처리하고,
+    종료 요청이 오면 진행 중인 기사까지만 마무리(drain)한 뒤 반환한다.
+    """
+    sftp_uploader.keep_connection_warm()
+    next_run = {}
+    refreshed_at = 0.0
+    print(f"🛰️ 상주 모드 시작 (기본 주기 {DAEMON_DEFAULT_INTERVAL_MIN:g}분)")
+    try:
+        while not _shutdown_requested:
+            now = time.time()
+            if now - refreshed_at >= DAEMON_REFRESH_MIN * 60:
+                cleanup_stale_mp3(mp3_dir="MP3", age_hours=24)
+                db_manager.preload_dedup_index(days=7)
+                refreshed_at = now
+
+            keywords = db_manager.get_active_keywords()
+            due = [k for k in keywords if next_run.get(k['id'], 0) <= now]
+            if due:
+                print(f"\n[{datetime.now().strftime('%H:%M:%S')}] 실행 대상 키워드 {len(due)}개")
+                _run_keywords(due, max_workers)
+                for k in due:
+                    next_run[k['id']] = now + _keyword_interval_sec(k)
+
+            upcoming = [next_run.get(k['id'], 0) for k in keywords]
+            wait = min(upcoming) - time.time() if upcoming else DAEMON_TICK_SEC
+            _shutdown_event.wait(max(1.0, min(wait, DAEMON_TICK_SEC)))
+    finally:
+        _flush_episodes()
+        sftp_uploader.close_connection()
+        _save_state()
+        print("🛰️ 상주 모드 종료 (진행 중 작업 완료)")
 
 if __name__ == "__main__":
+    import argparse
     import traceback
+
+    parser = argparse.ArgumentParser(description="네이버 뉴스 → 팟캐스트 크롤러")
+    parser.add_argument("--daemon", action="store_true",
+                        help="상주 모드: 키워드별 주기로 반복 실행, SIGTERM 시 진행 중 작업 마무리 후 종료")
+    args = parser.parse_args()
     
     logger.info("=" * 60)
     logger.info("크롤러 프로세스 시작")
@@ -490,8 +1488,11 @@ if __name__ == "__main__":
         
         logger.info(f"[{datetime.now().strftime('%H:%M:%S')}] 크롤러 시작")
         
-        # 한 번 실행 후 종료
-        run_crawling_job()
+        if args.daemon:
+            run_daemon()
+        else:
+            # 한 번 실행 후 종료
+            run_crawling_job()
         
         logger.info(f"✅ 크롤링 완료! [{datetime.now().strftime('%H:%M:%S')}]")
     except Exception as e:
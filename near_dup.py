@@ -0,0 +1,179 @@
+"""
+유사 기사(같은 통신사 기사를 여러 언론사가 제목만 바꿔 재송고) 탐지
+
+정제된 본문으로 64비트 SimHash를 만들어 episodes.content_simhash에 저장하고,
+최근 N일치 지문을 밴드(LSH)로 색인해 해밍 거리 NEAR_DUP_MAX_DISTANCE 이하인
+에피소드가 있으면 대본 생성(Claude) / TTS 전에 건너뛴다.
+
+밴드 수 = 허용 거리 + 1 → 거리 k 이하인 두 지문은 비둘기집 원리로 최소 한 밴드가
+반드시 같으므로, 후보만 비교해도 놓치는 유사 기사가 없다.
+"""
+import re
+import time
+import hashlib
+import threading
+from collections import Counter
+
+from config import config
+
+NEAR_DUP_ENABLED = config.NEAR_DUP_ENABLED
+# 허용 해밍 거리 (0~15). 클수록 더 느슨하게 같은 기사로 판단
+NEAR_DUP_MAX_DISTANCE = config.NEAR_DUP_MAX_DISTANCE
+NEAR_DUP_DAYS = config.NEAR_DUP_DAYS
+
+SIMHASH_BITS = 64
+# 만료(days 경과) 항목을 버킷에서 지우는 간격 (초). 데몬이 오래 돌아도 색인이 계속 커지지 않도록
+PRUNE_INTERVAL = 3600
+_MASK = (1 << SIMHASH_BITS) - 1
+_TOKEN_RE = re.compile(r"[0-9A-Za-z가-힣]+")
+
+
+def _features(text, width=2):
+    """어절 2-gram 빈도. 문장부호/공백 차이는 무시."""
+    tokens = _TOKEN_RE.findall(text.lower())
+    if len(tokens) < width:
+        return Counter(tokens)
+    return Counter(" ".join(tokens[i:i + width]) for i in range(len(tokens) - width + 1))
+
+
+def simhash(text):
+    """본문 → 64비트 SimHash (부호 없는 정수). 토큰이 없으면 None."""
+    if not text:
+        return None
+    features = _features(text)
+    if not features:
+        return None
+    weights = [0] * SIMHASH_BITS
+    for feature, count in features.items():
+        h = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            if h >> bit & 1:
+                weights[bit] += count
+            else:
+                weights[bit] -= count
+    value = 0
+    for bit, w in enumerate(weights):
+        if w > 0:
+            value |= 1 << bit
+    return value
+
+
+def hamming(a, b):
+    return bin((a ^ b) & _MASK).count("1")
+
+
+class NearDuplicateIndex:
+    """최근 지문의 밴드별 색인. 실행 중 새로 저장한 에피소드도 add()로 바로 반영."""
+
+    def __init__(self, max_distance=None, days=None):
+        self.max_distance = NEAR_DUP_MAX_DISTANCE if max_distance is None else max_distance
+        self.days = NEAR_DUP_DAYS if days is None else days
+        self.bands = self.max_distance + 1
+        self.band_bits = SIMHASH_BITS // self.bands
+        self._buckets = [dict() for _ in range(self.bands)]
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._next_prune = 0.0
+
+    def _band_keys(self, value):
+        band_mask = (1 << self.band_bits) - 1
+        return [(value >> (i * self.band_bits)) & band_mask for i in range(self.bands)]
+
+    def add(self, value, ref=None, created_at=None):
+        if value is None:
+            return
+        entry = (value, ref, created_at or time.time())
+        with self._lock:
+            self._maybe_prune()
+            for bucket, key in zip(self._buckets, self._band_keys(value)):
+                bucket.setdefault(key, []).append(entry)
+
+    def load(self, rows):
+        """rows: [(simhash, ref, created_at epoch), ...]"""
+        for value, ref, created_at in rows:
+            self.add(value, ref, created_at)
+        with self._lock:
+            self._prune(time.time() - self.days * 86400)
+        self._loaded = True
+
+    def _maybe_prune(self):
+        """_lock 안에서 호출. PRUNE_INTERVAL마다 한 번 만료 항목 정리."""
+        now = time.time()
+        if now >= self._next_prune:
+            self._prune(now - self.days * 86400)
+
+    def _prune(self, cutoff):
+        """_lock 안에서 호출. created_at이 cutoff보다 오래된 항목과 빈 버킷 삭제. 지운 항목 수 반환."""
+        removed = 0
+        for bucket in self._buckets:
+            for key in list(bucket):
+                entries = bucket[key]
+                kept = [e for e in entries if e[2] >= cutoff]
+                removed += len(entries) - len(kept)
+                if kept:
+                    bucket[key] = kept
+                else:
+                    del bucket[key]
+        self._next_prune = time.time() + PRUNE_INTERVAL
+        return removed // self.bands
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(entries) for entries in self._buckets[0].values())
+
+    @property
+    def loaded(self):
+        return self._loaded
+
+    def reserve(self, value, ref=None):
+        """
+        find + add를 한 번에 (잠금 안에서). 유사 항목이 있으면 (ref, 거리)를 돌려주고 추가하지 않음,
+        없으면 지금 항목을 넣고 None. 동시에 처리 중인 같은 본문 두 개가 모두 통과하지 않도록
+        대본 생성 전에 자리를 잡는 용도 → 처리가 실패하면 release().
+        """
+        if value is None:
+            return None
+        entry = (value, ref, time.time())
+        with self._lock:
+            self._maybe_prune()
+            best = self._find(value)
+            if best is None:
+                for bucket, key in zip(self._buckets, self._band_keys(value)):
+                    bucket.setdefault(key, []).append(entry)
+        return best
+
+    def release(self, value, ref=None):
+        """reserve()/add()로 넣은 항목 하나를 뺀다."""
+        if value is None:
+            return
+        with self._lock:
+            for bucket, key in zip(self._buckets, self._band_keys(value)):
+                entries = bucket.get(key)
+                if not entries:
+                    continue
+                for i, (other, other_ref, _) in enumerate(entries):
+                    if other == value and other_ref == ref:
+                        del entries[i]
+                        break
+                if not entries:
+                    del bucket[key]
+
+    def find(self, value):
+        """가장 가까운 유사 항목 (ref, 거리). 없으면 None."""
+        if value is None:
+            return None
+        with self._lock:
+            return self._find(value)
+
+    def _find(self, value):
+        """_lock 안에서 호출."""
+        cutoff = time.time() - self.days * 86400
+        best = None
+        for bucket, key in zip(self._buckets, self._band_keys(value)):
+            for other, ref, created_at in bucket.get(key, ()):
+                if created_at < cutoff:
+                    continue
+                d = hamming(value, other)
+                if d <= self.max_distance and (best is None or d < best[1]):
+                    best = (ref, d)
+        return best
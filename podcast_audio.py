@@ -1,8 +1,9 @@
-import edge_tts
 import asyncio
 import os
-from pydub import AudioSegment
 import re
+import threading
+
+# edge_tts(aiohttp), pydub는 import 비용이 커서 실제로 오디오를 만들 때 불러온다.
 
 # Voices (Microsoft Edge TTS - 완전 무료)
 # https://github.com/rany2/edge-tts
@@ -10,30 +11,46 @@ VOICE_A = "ko-KR-InJoonNeural"           # Male, Host A (상현) - Deep & Profes
 VOICE_B = "ko-KR-SunHiNeural"            # Female, Host B (지민) - Soft & Clear
 VOICE_ANNOUNCER = "ko-KR-HyunsuMultilingualNeural"  # Male, Title Announcer
 
-# ===== FFmpeg 경로 설정 =====
-# 우선순위: FFMPEG_PATH 환경변수 > 프로젝트 로컬 ffmpeg(.exe) > 시스템 PATH
-import platform
-
 current_dir = os.path.dirname(os.path.abspath(__file__))
-_env_ffmpeg = os.getenv("FFMPEG_PATH", "")
-_local_candidates = [
-    os.path.join(current_dir, "ffmpeg"),
-    os.path.join(current_dir, "ffmpeg.exe"),
-]
-_local_ffmpeg = next((p for p in _local_candidates if os.path.exists(p)), None)
-
-if _env_ffmpeg and os.path.exists(_env_ffmpeg):
-    print(f"Using FFmpeg from FFMPEG_PATH: {_env_ffmpeg}")
-    AudioSegment.converter = _env_ffmpeg
-    AudioSegment.ffmpeg = _env_ffmpeg
-    os.environ["PATH"] += os.pathsep + os.path.dirname(_env_ffmpeg)
-elif _local_ffmpeg:
-    print(f"Using local FFmpeg: {_local_ffmpeg}")
-    AudioSegment.converter = _local_ffmpeg
-    AudioSegment.ffmpeg = _local_ffmpeg
-    os.environ["PATH"] += os.pathsep + current_dir
-else:
-    print(f"Using system FFmpeg from PATH ({platform.system()})")
+
+_audio_segment = None
+_audio_segment_lock = threading.Lock()
+
+
+def get_audio_segment():
+    """
+    pydub.AudioSegment 반환. 처음 호출 시 import 후 FFmpeg 경로를 설정한다.
+    우선순위: FFMPEG_PATH 환경변수 > 프로젝트 로컬 ffmpeg(.exe) > 시스템 PATH
+    """
+    global _audio_segment
+    with _audio_segment_lock:
+        if _audio_segment is not None:
+            return _audio_segment
+        import platform
+        from config import config
+        from pydub import AudioSegment
+
+        _env_ffmpeg = config.FFMPEG_PATH
+        _local_candidates = [
+            os.path.join(current_dir, "ffmpeg"),
+            os.path.join(current_dir, "ffmpeg.exe"),
+        ]
+        _local_ffmpeg = next((p for p in _local_candidates if os.path.exists(p)), None)
+
+        if _env_ffmpeg and os.path.exists(_env_ffmpeg):
+            print(f"Using FFmpeg from FFMPEG_PATH: {_env_ffmpeg}")
+            AudioSegment.converter = _env_ffmpeg
+            AudioSegment.ffmpeg = _env_ffmpeg
+            os.environ["PATH"] += os.pathsep + os.path.dirname(_env_ffmpeg)
+        elif _local_ffmpeg:
+            print(f"Using local FFmpeg: {_local_ffmpeg}")
+            AudioSegment.converter = _local_ffmpeg
+            AudioSegment.ffmpeg = _local_ffmpeg
+            os.environ["PATH"] += os.pathsep + current_dir
+        else:
+            print(f"Using system FFmpeg from PATH ({platform.system()})")
+        _audio_segment = AudioSegment
+        return _audio_segment
 
 
 async def generate_audio_segment_async(text, voice_name, output_file):
@@ -41,6 +58,8 @@ async def generate_audio_segment_async(text, voice_name, output_file):
     Generates audio using Microsoft Edge TTS (completely free).
     """
     try:
+        import edge_tts
+
         # Clean up text
         text = text.replace("*", "").strip()
         if not text:
@@ -64,6 +83,8 @@ def generate_audio_segment(text, voice_name, output_file):
     Sync wrapper for async TTS generation.
     """
     try:
+        import edge_tts
+
         # Clean up text
         text = text.replace("*", "").strip()
         if not text:
@@ -87,12 +108,14 @@ def create_podcast_audio(script_text, output_filename="podcast.mp3", title_text=
     """
     lines = script_text.split('\n')
     temp_files = []
+    # 키워드 병렬 처리 시 스레드끼리 임시 파일이 겹치지 않도록 접두어 분리
+    temp_prefix = f"temp_{os.getpid()}_{threading.get_ident()}"
     
     print(f"오디오 생성 시작 (Edge TTS - 무료): {output_filename}")
     
     try:
         # 1. Generate Title Audio (if title provided)
-        title_audio_file = "temp_title.mp3"
+        title_audio_file = f"{temp_prefix}_title.mp3"
         has_title = False
         if title_text:
             print(f"제목 오디오 생성 중: {title_text}")
@@ -135,7 +158,7 @@ def create_podcast_audio(script_text, output_filename="podcast.mp3", title_text=
             text = text.replace("###", "").replace("**", "").strip()
             
             if text:
-                temp_file = f"temp_{segment_index}.mp3"
+                temp_file = f"{temp_prefix}_{segment_index}.mp3"
                 success = generate_audio_segment(text, voice, temp_file)
                 if success:
                     temp_files.append(temp_file)
@@ -153,6 +176,7 @@ def create_podcast_audio(script_text, output_filename="podcast.mp3", title_text=
             return None
         
         # Combine files using pydub
+        AudioSegment = get_audio_segment()
         combined = AudioSegment.empty()
         
         # Add Title Announcer
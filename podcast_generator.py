@@ -1,8 +1,8 @@
-import os
 import subprocess
-from dotenv import load_dotenv
 import time
 
+from config import config
+
 
 def call_claude_cli(prompt, model="sonnet", timeout=300):
     """Claude Code CLI로 대본 생성 (OAuth/Claude Max 구독 사용)."""
@@ -17,9 +17,6 @@ def call_claude_cli(prompt, model="sonnet", timeout=300):
         raise Exception(f"claude CLI 실패 (rc={result.returncode}): {result.stderr.strip()}")
     return result.stdout
 
-# Load environment variables
-load_dotenv()
-
 def truncate_content_smart(content, max_chars=15000):
     """
     Intelligently truncate content to fit within context window.
@@ -104,7 +101,7 @@ def generate_podcast_script(news_title, news_content, requirements=None, model=N
     Generates a podcast script from news content using Claude CLI.
     """
     if model is None:
-        model = os.getenv("PODCAST_MODEL", "sonnet")
+        model = config.PODCAST_MODEL
 
     optimized_content = truncate_content_smart(news_content, max_chars=15000)
 
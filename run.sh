@@ -1,4 +1,7 @@
 #!/bin/bash
+# 사용법:
+#   run.sh            cron에서 1회 실행
+#   run.sh --daemon   상주 모드 (락을 쥔 채 계속 실행 → 그동안 cron 실행은 스킵)
 set -e
 export PATH="/home/sddari/.local/bin:/usr/local/bin:/usr/bin:/bin"
 PROJECT=/mnt/nas/data2/news
@@ -38,4 +41,5 @@ else
 fi
 echo "[run.sh] PODCAST_BACKEND=$PODCAST_BACKEND (DOW=$DOW HOUR=$HOUR)" >> "$LOG"
 
-exec python naver_crawler.py >> "$LOG" 2>&1
+# exec로 교체해도 fd 200(락)은 python 프로세스가 이어받아 종료 시까지 유지됨
+exec python naver_crawler.py "$@" >> "$LOG" 2>&1
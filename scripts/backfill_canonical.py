@@ -0,0 +1,87 @@
+"""
+episodes.canonical_link / title_fingerprint 채우기 (기존 행 backfill)
+
+중복 검사는 canonical URL과 정규화 제목 지문을 쓰므로, 컬럼 추가 전에 저장된 행도 계산해 둔다.
+canonical.py의 정규화 규칙을 바꾼 뒤에는 --all로 전체를 다시 계산한다.
+
+사용법:
+    python scripts/backfill_canonical.py             # 비어 있는 행만
+    python scripts/backfill_canonical.py --all       # 전체 재계산
+    python scripts/backfill_canonical.py --dry-run   # 변경될 행 수만 확인
+"""
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db_manager
+from canonical import canonical_url, title_fingerprint
+
+
+def backfill(recompute_all=False, batch_size=1000, dry_run=False):
+    conn = db_manager.get_connection()
+    where = "" if recompute_all else "AND (canonical_link IS NULL OR title_fingerprint IS NULL)"
+    last_id, scanned, changed = 0, 0, 0
+    try:
+        with conn.cursor() as cursor:
+            while True:
+                cursor.execute(
+                    f"SELECT id, link, title, canonical_link, title_fingerprint FROM episodes "
+                    f"WHERE id > %s {where} ORDER BY id LIMIT %s",
+                    (last_id, batch_size),
+                )
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+                last_id = rows[-1]['id']
+                scanned += len(rows)
+
+                updates = []
+                for r in rows:
+                    link, fingerprint = canonical_url(r['link']), title_fingerprint(r['title'])
+                    if (link, fingerprint) != (r['canonical_link'], r['title_fingerprint']):
+                        updates.append((link, fingerprint, r['id']))
+                changed += len(updates)
+                if updates and not dry_run:
+                    cursor.executemany(
+                        "UPDATE episodes SET canonical_link = %s, title_fingerprint = %s WHERE id = %s",
+                        updates,
+                    )
+                    conn.commit()
+                print(f"  ~id {last_id}: {scanned}행 확인, {changed}행 {'변경 예정' if dry_run else '갱신'}")
+    finally:
+        conn.close()
+    return scanned, changed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="canonical_link / title_fingerprint backfill")
+    parser.add_argument("--all", action="store_true", help="이미 값이 있는 행도 다시 계산")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true", help="DB를 바꾸지 않고 개수만 출력")
+    args = parser.parse_args()
+
+    # 컬럼/인덱스는 scripts/migrate.py가 만든다 (여기서는 확인만 → --dry-run이 스키마를 바꾸지 않음)
+    pending = db_manager.pending_migrations()
+    if pending:
+        names = ", ".join(f"{m.version:04d}_{m.name}" for m in pending)
+        print(f"❌ 적용되지 않은 DB 마이그레이션: {names}")
+        print("   python scripts/migrate.py 로 먼저 적용하세요")
+        sys.exit(1)
+    scanned, changed = backfill(args.all, args.batch_size, args.dry_run)
+    print(f"✅ 완료: {scanned}행 확인, {changed}행 {'변경 예정' if args.dry_run else '갱신'}")
+
+    # 정규화 후 같은 기사로 묶이는 기존 중복 현황
+    conn = db_manager.get_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "SELECT COUNT(*) AS groups_, COALESCE(SUM(cnt), 0) AS rows_ FROM "
+                "(SELECT COUNT(*) AS cnt FROM episodes WHERE canonical_link IS NOT NULL "
+                "GROUP BY canonical_link HAVING cnt > 1) t"
+            )
+            dup = cursor.fetchone()
+        print(f"ℹ️ canonical_link가 겹치는 기존 에피소드: {dup['groups_']}묶음 / {dup['rows_']}행")
+    finally:
+        conn.close()
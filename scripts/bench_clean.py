@@ -0,0 +1,105 @@
+"""
+기사 본문 정제 엔진 벤치마크 + 결과 동일성 검증
+
+기존 naver_crawler.clean_article_text / validate_content / _build_summary(re.sub 방식, tests/legacy_cleaner.py)와
+article_cleaner 엔진을 같은 입력에 돌려 결과가 완전히 같은지 확인하고 처리량(chars/sec)을 비교.
+같은 동일성 검사는 tests/test_article_cleaner.py에서 pytest로도 돈다.
+
+입력:
+    - tests/fixtures/articles/*.txt : 추출 본문 기사 (기자 서명, 저작권 문구, ▶ 관련기사 등 포함)
+    - --corpus DIR : 추가 추출 본문(*.txt) 코퍼스
+    - 최악 입력    : 앵커 없는 긴 줄, 닫히지 않는 괄호, 긴 단어 뒤 '@' 등 되추적 유발 입력
+    - --fuzz N     : 노이즈 토큰을 무작위 조합한 N개 입력 (동일성만 검사)
+
+사용법:
+    python scripts/bench_clean.py
+    python scripts/bench_clean.py --corpus saved_articles/ --fuzz 5000
+"""
+import os
+import sys
+import glob
+import time
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "tests"))
+
+import article_cleaner
+from legacy_cleaner import legacy_clean_article_text, legacy_pipeline, fuzz_inputs
+
+FIXTURE_DIR = os.path.join(ROOT, "tests", "fixtures", "articles")
+
+
+def new_pipeline(text):
+    article = article_cleaner.process_article(text)
+    if article is None:
+        return None
+    return str(article), article_cleaner.build_summary(article)
+
+
+# ===== 입력 =====
+def worst_case_inputs(size=200_000):
+    """기존 패턴이 되추적하는 입력: 각 항목은 (이름, 본문)."""
+    word = "가" * 50 + " "
+    return [
+        ("앵커 없는 긴 한 줄", ("가나다라마바사 " * (size // 8))),
+        ("긴 줄 끝의 '기자 ='", ("가나다라마바사 " * (size // 8)) + "기자 = 본문"),
+        ("닫히지 않는 '['", ("[가나다 " * (size // 5))),
+        ("긴 단어 + '@'", (word * (size // len(word))) + "@"),
+        ("'(사진' 반복", ("(사진 설명 " * (size // 7))),
+    ]
+
+
+def throughput(fn, texts, repeat):
+    chars = sum(len(t) for t in texts) * repeat
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for t in texts:
+            fn(t)
+    elapsed = time.perf_counter() - start
+    return chars / elapsed, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기사 정제 엔진 벤치마크")
+    parser.add_argument("--corpus", default=None, help="추출 본문 *.txt 디렉토리")
+    parser.add_argument("--repeat", type=int, default=20, help="반복 횟수")
+    parser.add_argument("--fuzz", type=int, default=2000, help="무작위 동일성 검사 입력 수")
+    parser.add_argument("--worst-size", type=int, default=20_000, help="최악 입력 길이(자)")
+    args = parser.parse_args()
+
+    corpus = []
+    for directory in [FIXTURE_DIR] + ([args.corpus] if args.corpus else []):
+        for path in sorted(glob.glob(os.path.join(directory, "*.txt"))):
+            with open(path, encoding="utf-8") as f:
+                corpus.append(f.read())
+
+    print("=" * 70)
+    print(f"🧹 코퍼스 {len(corpus)}건 ({sum(map(len, corpus)):,}자), 반복 {args.repeat}회")
+    print("=" * 70)
+
+    mismatches = [i for i, t in enumerate(corpus) if legacy_pipeline(t) != new_pipeline(t)]
+    fuzz = fuzz_inputs(args.fuzz)
+    fuzz_mismatches = sum(1 for t in fuzz if legacy_clean_article_text(t) != article_cleaner.clean_article_text(t))
+    print(f"  결과 일치: 코퍼스 {len(corpus) - len(mismatches)}/{len(corpus)}, "
+          f"퍼징 {len(fuzz) - fuzz_mismatches}/{len(fuzz)}")
+    if mismatches:
+        print(f"  ❌ 불일치 코퍼스 인덱스: {mismatches}")
+
+    old_cps, _ = throughput(legacy_pipeline, corpus, args.repeat)
+    new_cps, _ = throughput(new_pipeline, corpus, args.repeat)
+    print(f"  기존: {old_cps / 1e6:8.2f}M chars/s")
+    print(f"  신규: {new_cps / 1e6:8.2f}M chars/s  ({new_cps / old_cps:.1f}x)")
+
+    print("-" * 70)
+    print(f"⏱️ 최악 입력 ({args.worst_size:,}자)")
+    for name, text in worst_case_inputs(args.worst_size):
+        _, t_old = throughput(legacy_clean_article_text, [text], 1)
+        _, t_new = throughput(article_cleaner.clean_article_text, [text], 1)
+        same = "일치" if legacy_clean_article_text(text) == article_cleaner.clean_article_text(text) else "불일치"
+        print(f"  {name:<20} 기존 {t_old * 1000:9.1f}ms  신규 {t_new * 1000:7.2f}ms  ({same})")
+
+
+if __name__ == "__main__":
+    main()
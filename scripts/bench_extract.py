@@ -0,0 +1,85 @@
+"""
+본문 추출 처리량 벤치마크 (작업자 프로세스 수 1..N)
+
+저장해 둔 기사 HTML(*.html) 코퍼스에 article_cleaner.extract_article
+(trafilatura 추출 + 정제 + 검증)을 ProcessPoolExecutor로 돌려 articles/sec를 측정.
+코퍼스가 없으면 합성 기사 HTML을 사용한다.
+
+사용법:
+    python scripts/bench_extract.py
+    python scripts/bench_extract.py --corpus saved_html/ --max-workers 8 --repeat 3
+"""
+import os
+import sys
+import glob
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from article_cleaner import extract_article
+
+_PARAGRAPH = (
+    "정부가 내년부터 인공지능 반도체 연구개발에 3조 원을 투입한다고 밝혔다. "
+    "과학기술정보통신부는 오늘 관계부처 합동 회의를 열고 이 같은 내용의 종합 계획을 발표했다. "
+    "업계는 대체로 환영한다는 입장이지만, 일부 전문가들은 인력 확보가 관건이라고 지적했다. "
+)
+
+
+def synthetic_article(n):
+    """네이버 기사 페이지 크기(수백 KB)를 흉내 낸 HTML: 메뉴/광고 잡음 + 본문."""
+    nav = "".join(f"<li><a href='/section/{k}'>메뉴 {k}</a></li>" for k in range(400))
+    body = "".join(f"<p>{_PARAGRAPH}{n}번 기사 {k}번째 문단.</p>" for k in range(30))
+    related = "".join(f"<li><a href='/article/{k}'>관련 기사 제목 {k}</a></li>" for k in range(200))
+    return (
+        "<html><head><meta charset='utf-8'><title>합성 기사</title></head><body>"
+        f"<nav><ul>{nav}</ul></nav><article><h1>합성 기사 {n}</h1>{body}</article>"
+        f"<aside><ul>{related}</ul></aside><footer>Copyright ⓒ 합성일보</footer></body></html>"
+    ).encode("utf-8")
+
+
+def run(corpus, workers, repeat):
+    items = corpus * repeat
+    start = time.perf_counter()
+    if workers == 0:
+        results = [extract_article(html) for html in items]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(extract_article, items, chunksize=1))
+    elapsed = time.perf_counter() - start
+    ok = sum(1 for status, _, _ in results if status == "ok")
+    return len(items) / elapsed, ok, len(items)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="본문 추출 처리량 벤치마크")
+    parser.add_argument("--corpus", default=None, help="기사 *.html 디렉토리")
+    parser.add_argument("--articles", type=int, default=24, help="합성 기사 수 (코퍼스 없을 때)")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1, help="최대 작업자 수")
+    parser.add_argument("--repeat", type=int, default=2, help="코퍼스 반복 횟수")
+    args = parser.parse_args()
+
+    corpus = []
+    if args.corpus:
+        for path in sorted(glob.glob(os.path.join(args.corpus, "*.html"))):
+            with open(path, "rb") as f:
+                corpus.append(f.read())
+    if not corpus:
+        print("저장된 HTML 없음 → 합성 기사 사용")
+        corpus = [synthetic_article(n) for n in range(args.articles)]
+
+    print("=" * 70)
+    print(f"📰 기사 {len(corpus)}개 × {args.repeat}회 "
+          f"(평균 {sum(map(len, corpus)) // len(corpus) // 1024}KB), CPU {os.cpu_count()}개")
+    print("=" * 70)
+
+    base, ok, total = run(corpus, 0, args.repeat)
+    print(f"  인라인(풀 없음): {base:7.1f} articles/s  (성공 {ok}/{total})")
+    for workers in range(1, args.max_workers + 1):
+        rate, ok, total = run(corpus, workers, args.repeat)
+        print(f"  작업자 {workers:>2}개:     {rate:7.1f} articles/s  ({rate / base:.1f}x, 성공 {ok}/{total})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+기사 본문 다운로드 벤치마크 (순차 vs ArticleFetcher 동시 다운로드)
+
+로컬 mock HTTP 서버를 띄우고, 127.0.0.x 주소를 서로 다른 언론사 호스트로
+취급해 기존 순차 루프(고정 sleep + get_news_content)와 동시 다운로드를 비교.
+동시 다운로드 쪽 도메인별 초기 속도는 순차 루프의 평균 sleep 간격과 같게 맞춘다.
+
+사용법:
+    python scripts/bench_fetch.py
+    python scripts/bench_fetch.py --articles 24 --hosts 6 --latency 0.3
+"""
+import os
+import sys
+import io
+import time
+import random
+import argparse
+import threading
+import contextlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# 두 방식 모두 실제 다운로드를 측정하도록 HTTP/본문 캐시는 끄고, 속도 제한 학습값도 분리
+os.environ.setdefault("HTTP_CACHE_ENABLED", "0")
+os.environ.setdefault("EXTRACT_CACHE_ENABLED", "0")
+os.environ.setdefault("RATE_LIMIT_STATE_PATH", os.path.join(tempfile.mkdtemp(), "rate_limits.json"))
+
+_PARAGRAPH = (
+    "정부는 오늘 인공지능 산업 육성을 위한 종합 대책을 발표했다. "
+    "이번 대책에는 연구개발 예산 확대와 인재 양성 방안이 포함됐으며, "
+    "업계는 대체로 환영한다는 입장을 밝혔다. 전문가들은 실행 속도가 관건이라고 지적했다. "
+)
+
+
+def _article_html(n):
+    body = "".join(f"<p>{_PARAGRAPH}{n}번 기사 {k}번째 문단입니다.</p>" for k in range(12))
+    return (
+        "<html><head><meta charset='utf-8'><title>벤치마크 기사</title></head>"
+        f"<body><article><h1>벤치마크 기사 {n}</h1>{body}</article></body></html>"
+    ).encode("utf-8")
+
+
+def start_mock_server(latency):
+    """지연(latency초)을 흉내 내는 기사 서버. 0.0.0.0 바인딩 → 127.0.0.x 모두 응답."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            payload = _article_html(self.path.rsplit("/", 1)[-1])
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("0.0.0.0", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_sequential(urls, delay_range):
+    """기존 crawl_naver_news 방식: 기사마다 고정 sleep 후 순차 추출."""
+    from naver_crawler import get_news_content
+
+    results = []
+    for url in urls:
+        time.sleep(random.uniform(*delay_range))
+        results.append(get_news_content(url))
+    return results
+
+
+def run_concurrent(urls, workers, per_host):
+    from naver_crawler import ArticleFetcher
+
+    fetcher = ArticleFetcher(max_workers=workers, per_host_limit=per_host)
+    return fetcher.fetch_all(urls)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기사 본문 다운로드 벤치마크")
+    parser.add_argument("--articles", type=int, default=12, help="기사 수")
+    parser.add_argument("--hosts", type=int, default=4, help="가상 언론사 호스트 수")
+    parser.add_argument("--latency", type=float, default=0.2, help="서버 응답 지연(초)")
+    parser.add_argument("--delay-min", type=float, default=0.2, help="politeness delay 최소(초)")
+    parser.add_argument("--delay-max", type=float, default=0.4, help="politeness delay 최대(초)")
+    parser.add_argument("--workers", type=int, default=8, help="동시 다운로드 스레드 수")
+    parser.add_argument("--per-host", type=int, default=2, help="호스트별 동시 접속 제한")
+    args = parser.parse_args()
+    # naver_crawler import 전에 설정해야 rate_limiter 초기 속도에 반영됨
+    os.environ["RATE_LIMIT_INITIAL"] = str(2 / (args.delay_min + args.delay_max))
+
+    server = start_mock_server(args.latency)
+    port = server.server_address[1]
+    urls = [f"http://127.0.0.{(n % args.hosts) + 1}:{port}/article/{n}"
+            for n in range(args.articles)]
+    delay_range = (args.delay_min, args.delay_max)
+
+    print("=" * 70)
+    print(f"📰 기사 {args.articles}개 / 호스트 {args.hosts}개 / 지연 {args.latency}s "
+          f"/ delay {args.delay_min}~{args.delay_max}s")
+    print("=" * 70)
+
+    timings = {}
+    for label, fn in (
+        ("순차", lambda: run_sequential(urls, delay_range)),
+        ("동시", lambda: run_concurrent(urls, args.workers, args.per_host)),
+    ):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            results = fn()
+            elapsed = time.perf_counter() - start
+        ok = sum(1 for r in results if r)
+        timings[label] = elapsed
+        print(f"  {label}: {elapsed:6.2f}s  (성공 {ok}/{len(urls)}, "
+              f"{len(urls) / elapsed:.1f} articles/s)")
+
+    server.shutdown()
+    print("-" * 70)
+    print(f"⚡ 속도 향상: {timings['순차'] / timings['동시']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+에피소드 목록 페이지네이션 벤치마크 (OFFSET vs keyset)
+
+별도 벤치마크 DB(기본: <DB_NAME>_bench)에 마이그레이션을 적용하고 가짜 에피소드를 채운 뒤,
+같은 페이지를 LIMIT/OFFSET과 db_manager.list_episodes(keyset 커서)로 읽는 시간을 깊이별로 비교.
+OFFSET은 깊이에 비례해 느려지고, keyset은 깊이와 관계없이 일정해야 한다.
+생성한 DB는 다음 실행에서 재사용한다 (--drop이면 끝난 뒤 삭제).
+
+사용법:
+    python scripts/bench_pagination.py                       # 100만 행
+    python scripts/bench_pagination.py --rows 200000 --depths 1,100,5000
+    python scripts/bench_pagination.py --keyword 3           # 키워드 필터 걸고 비교
+    python scripts/bench_pagination.py --drop
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pymysql
+
+import db_manager
+import db_migrate
+
+_OFFSET_SQL = (
+    "SELECT id, title, press, link, mp3_path, duration_sec, summary, created_at FROM episodes {where} "
+    "ORDER BY created_at DESC, id DESC LIMIT %s OFFSET %s"
+)
+
+
+def _connect(database=None):
+    return pymysql.connect(
+        host=db_manager.DB_HOST, port=db_manager.DB_PORT, user=db_manager.DB_USER,
+        password=db_manager.DB_PASS, db=database, charset='utf8mb4',
+        cursorclass=pymysql.cursors.DictCursor, autocommit=True,
+    )
+
+
+def prepare(database, rows, keywords, batch=10000):
+    """벤치마크 DB 생성 + 마이그레이션 + 부족한 행 채우기."""
+    conn = _connect()
+    with conn.cursor() as cursor:
+        cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{database}` CHARACTER SET utf8mb4")
+    conn.close()
+
+    conn = _connect(database)
+    with conn.cursor() as cursor:
+        # 0003 마이그레이션이 keywords 테이블을 전제로 함
+        cursor.execute("CREATE TABLE IF NOT EXISTS keywords (id INT AUTO_INCREMENT PRIMARY KEY, "
+                       "keyword VARCHAR(100), requirements TEXT, priority INT DEFAULT 0)")
+    db_migrate.migrate(conn)
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT COUNT(*) AS cnt FROM episodes")
+        have = cursor.fetchone()["cnt"]
+    if have >= rows:
+        print(f"기존 {have:,}행 재사용")
+        return conn
+
+    print(f"에피소드 {rows - have:,}행 생성 중...")
+    started = time.time()
+    now = datetime.now().replace(microsecond=0)
+    rng = random.Random(have)
+    sql = ("INSERT INTO episodes (press, title, link, mp3_path, duration_sec, summary, keyword_id, created_at) "
+           "VALUES (%s,%s,%s,%s,%s,%s,%s,%s)")
+    for first in range(have, rows, batch):
+        values = []
+        for i in range(first, min(first + batch, rows)):
+            values.append((
+                f"언론사{i % 50}", f"벤치마크 기사 제목 {i}", f"https://bench.example/news/{i}",
+                f"/static/podcast/bench/{i}.mp3", rng.randint(120, 600), f"요약 {i} " * 10,
+                rng.randint(1, keywords), now - timedelta(seconds=rng.randint(0, 365 * 86400)),
+            ))
+        with conn.cursor() as cursor:
+            cursor.executemany(sql, values)
+        done = min(first + batch, rows)
+        if done % 100000 == 0 or done == rows:
+            print(f"   {done:,}/{rows:,} ({time.time() - started:.0f}초)")
+    with conn.cursor() as cursor:
+        cursor.execute("ANALYZE TABLE episodes")
+    return conn
+
+
+def _timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="에피소드 목록 페이지네이션 벤치마크")
+    parser.add_argument("--database", default=f"{db_manager.DB_NAME}_bench", help="벤치마크용 DB 이름")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--keywords", type=int, default=20, help="가짜 키워드 수")
+    parser.add_argument("--keyword", type=int, default=None, help="이 keyword_id로 거른 목록을 측정")
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--depths", default="1,10,100,1000,10000,40000", help="측정할 페이지 번호")
+    parser.add_argument("--repeat", type=int, default=5, help="깊이별 반복 (중앙값)")
+    parser.add_argument("--drop", action="store_true", help="끝난 뒤 벤치마크 DB 삭제")
+    args = parser.parse_args()
+
+    conn = prepare(args.database, args.rows, args.keywords)
+    db_manager.DB_NAME = args.database  # list_episodes가 벤치마크 DB의 풀을 쓰도록
+    where, params = ("WHERE keyword_id = %s", [args.keyword]) if args.keyword is not None else ("", [])
+    size = args.page_size
+
+    print("=" * 70)
+    print(f"📄 {args.rows:,}행 / 페이지 {size}개"
+          f"{f' / keyword_id={args.keyword}' if args.keyword is not None else ''}")
+    print("=" * 70)
+    print(f"  {'페이지':>8} {'OFFSET':>12} {'keyset':>10}")
+    for depth in [int(d) for d in args.depths.split(",")]:
+        offset = (depth - 1) * size
+        with conn.cursor() as cursor:
+            cursor.execute(_OFFSET_SQL.format(where=where), params + [1, max(offset - 1, 0)])
+            last = cursor.fetchone()
+        if last is None:
+            print(f"  {depth:>8}  (행 부족)")
+            break
+        # 이전 페이지의 마지막 행으로 커서를 만든다 (첫 페이지는 커서 없음)
+        cursor_token = db_manager._encode_cursor(last['created_at'], last['id']) if offset else None
+
+        def run_offset():
+            with conn.cursor() as cursor:
+                cursor.execute(_OFFSET_SQL.format(where=where), params + [size, offset])
+                return cursor.fetchall()
+
+        def run_keyset():
+            return db_manager.list_episodes(keyword_id=args.keyword, cursor=cursor_token, limit=size)[0]
+
+        assert [r['id'] for r in run_offset()] == [r['id'] for r in run_keyset()], "페이지 내용 불일치"
+        print(f"  {depth:>8} {_timed(run_offset, args.repeat):>10.1f}ms {_timed(run_keyset, args.repeat):>8.1f}ms")
+
+    with conn.cursor() as cursor:
+        cursor.execute("EXPLAIN SELECT id FROM episodes " + (where + " AND" if where else "WHERE")
+                       + " (created_at < NOW() OR (created_at = NOW() AND id < 1)) "
+                       "ORDER BY created_at DESC, id DESC LIMIT 21", params)
+        plan = cursor.fetchone()
+    print("-" * 70)
+    print(f"keyset 페이지 선택 계획: key={plan['key']}, type={plan['type']}, Extra={plan['Extra']}")
+
+    db_manager.close_pool()
+    if args.drop:
+        with conn.cursor() as cursor:
+            cursor.execute(f"DROP DATABASE `{args.database}`")
+        print(f"🧹 {args.database} 삭제")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
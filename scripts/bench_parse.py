@@ -0,0 +1,149 @@
+"""
+검색 결과 페이지 파서 벤치마크 (기존 html.parser + find_previous vs SearchResultParser)
+
+저장해 둔 네이버 검색 결과 HTML(*.html)로 두 방식의 속도와 결과 일치 여부를 비교.
+페이지가 없으면 현재 마크업을 흉내 낸 합성 페이지로 측정한다.
+
+사용법:
+    python scripts/bench_parse.py                           # 합성 페이지
+    python scripts/bench_parse.py --pages saved_pages/      # 저장된 페이지
+    python scripts/bench_parse.py --save 인공지능 --pages saved_pages/  # 실제 페이지 저장 후 측정
+"""
+import os
+import sys
+import glob
+import time
+import argparse
+import urllib.parse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+
+from search_parser import SearchResultParser, PARSER_BACKEND
+
+
+def legacy_parse(html):
+    """기존 crawl_naver_news 파싱 로직 (비교 기준)."""
+    soup = BeautifulSoup(html, 'html.parser')
+    news_list_ul = soup.select_one("ul.list_news")
+    if not news_list_ul:
+        return None
+
+    headline_selectors = [
+        lambda c: c and 'sds-comps-text-type-headline1' in c,
+        lambda c: c and 'news_tit' in c,
+        lambda c: c and 'title' in c.lower() and 'news' in c.lower(),
+    ]
+    headlines = []
+    for selector in headline_selectors:
+        headlines = news_list_ul.find_all(class_=selector)
+        if headlines:
+            break
+
+    press_selectors = [
+        lambda c: c and 'sds-comps-profile-info-title-text' in c,
+        lambda c: c and 'press' in c.lower(),
+        lambda c: c and 'info_group' in c,
+    ]
+    records = []
+    for headline in headlines:
+        link_el = headline.find_parent("a")
+        press = "언론사 정보 없음"
+        for press_selector in press_selectors:
+            press_el = headline.find_previous(class_=press_selector)
+            if press_el:
+                press = press_el.get_text(strip=True)
+                break
+        records.append({
+            "title": headline.get_text(strip=True),
+            "link": link_el['href'] if link_el else "",
+            "press": press,
+        })
+    return records
+
+
+def synthetic_page(n_cards=30, noise_kb=300):
+    """sds 마크업을 흉내 낸 결과 페이지 + 앞뒤로 검색 페이지만큼의 잡음."""
+    cards = []
+    for i in range(n_cards):
+        cards.append(
+            "<li class='bx'><div class='sds-comps-profile'>"
+            f"<span class='sds-comps-profile-info-title-text'><a href='#'>언론사{i % 7}</a></span>"
+            f"<span class='sds-comps-profile-info-subtext'>{i + 1}시간 전</span>"
+            f"<a href='https://n.news.naver.com/mnews/article/001/{i:010d}'>네이버뉴스</a></div>"
+            f"<a href='https://press{i % 7}.example.com/news/{i}'>"
+            f"<span class='sds-comps-text sds-comps-text-type-headline1'>기사 제목 {i} 인공지능 정책 발표</span></a>"
+            f"<div class='sds-comps-text-type-body1'>{'본문 미리보기 문장입니다. ' * 10}</div></li>"
+        )
+    noise = "<div class='etc'>" + ("<span class='x'>잡음 요소</span>" * (noise_kb * 1024 // 40)) + "</div>"
+    return (f"<html><head><title>검색</title></head><body>{noise}"
+            f"<ul class='list_news'>{''.join(cards)}</ul>{noise}</body></html>")
+
+
+def save_live_page(query, pages_dir):
+    from naver_crawler import http_client
+
+    os.makedirs(pages_dir, exist_ok=True)
+    url = ("https://search.naver.com/search.naver?ssc=tab.news.all&query="
+           f"{urllib.parse.quote(query)}&sm=tab_opt&sort=1&nso=so%3Add")
+    response = http_client.get(url)
+    response.raise_for_status()
+    path = os.path.join(pages_dir, f"{int(time.time())}.html")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(response.text)
+    print(f"💾 저장: {path}")
+
+
+def bench(fn, pages, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            fn(html)
+    return (time.perf_counter() - start) / (repeat * len(pages))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검색 결과 파서 벤치마크")
+    parser.add_argument("--pages", default=None, help="저장된 검색 결과 *.html 디렉토리")
+    parser.add_argument("--save", default=None, help="이 검색어의 실제 결과 페이지를 --pages에 저장")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    args = parser.parse_args()
+
+    if args.save:
+        save_live_page(args.save, args.pages or "saved_pages")
+
+    pages = []
+    if args.pages:
+        for path in sorted(glob.glob(os.path.join(args.pages, "*.html"))):
+            with open(path, encoding="utf-8") as f:
+                pages.append(f.read())
+    if not pages:
+        print("저장된 페이지 없음 → 합성 페이지 사용")
+        pages = [synthetic_page()]
+
+    fast = SearchResultParser()
+    print("=" * 70)
+    print(f"📄 페이지 {len(pages)}개 (평균 {sum(map(len, pages)) // len(pages) // 1024}KB), "
+          f"반복 {args.repeat}회, 백엔드 {PARSER_BACKEND}")
+    print("=" * 70)
+
+    mismatches = 0
+    for html in pages:
+        old, new = legacy_parse(html) or [], fast.parse(html) or []
+        old_keys = [(r["title"], r["link"], r["press"]) for r in old]
+        new_keys = [(r["title"], r["link"], r["press"]) for r in new]
+        if old_keys != new_keys:
+            mismatches += 1
+    print(f"  결과 일치: {len(pages) - mismatches}/{len(pages)}")
+
+    t_old = bench(legacy_parse, pages, args.repeat)
+    t_new = bench(fast.parse, pages, args.repeat)
+    print(f"  기존: {t_old * 1000:8.1f}ms/page")
+    print(f"  신규: {t_new * 1000:8.1f}ms/page  (전략: {fast.strategy})")
+    print("-" * 70)
+    print(f"⚡ 속도 향상: {t_old / t_new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
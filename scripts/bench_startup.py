@@ -0,0 +1,108 @@
+"""
+시작 시간(import 비용) 벤치마크
+
+모듈마다 새 파이썬 프로세스에서 `python -X importtime -c "import 모듈"`을 실행해
+총 import 시간과 누적 시간이 큰 하위 모듈을 보여준다. --ref를 주면 해당 git 커밋의
+트리를 임시 디렉터리에 풀어 같은 방식으로 측정하고 전/후를 비교한다.
+
+사용법:
+    python scripts/bench_startup.py                         # 현재 트리
+    python scripts/bench_startup.py --ref HEAD~1            # 이전 커밋과 비교
+    python scripts/bench_startup.py --modules naver_crawler --top 20 --repeat 10
+"""
+import os
+import sys
+import shutil
+import argparse
+import tempfile
+import subprocess
+import statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULES = ["naver_crawler", "db_manager", "podcast_audio", "sftp_uploader", "search_parser"]
+
+
+def import_profile(module, cwd):
+    """
+    (총 import 시간 ms, [(누적 ms, 모듈명), ...]) 반환.
+    importtime 출력 형식: "import time: self [us] | cumulative | imported package"
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else "import 실패")
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative) / 1000, name[1:].rstrip()))  # 앞 공백 수 = import 깊이
+    # 측정 대상 모듈(최상위 행)과 그 아래에서 import된 행만 남김 (site 등 인터프리터 시작분 제외)
+    end = max((i for i, (_, name) in enumerate(rows) if name == module), default=None)
+    if end is None:
+        return 0.0, []
+    start = end
+    while start > 0 and rows[start - 1][1].startswith(" "):
+        start -= 1
+    return rows[end][0], rows[start:end]
+
+
+def measure(module, cwd, repeat):
+    """repeat회 측정한 총 import 시간의 중앙값과 마지막 실행의 상세 행."""
+    totals, rows = [], []
+    for _ in range(repeat):
+        total, rows = import_profile(module, cwd)
+        totals.append(total)
+    return statistics.median(totals), rows
+
+
+def extract_ref(ref):
+    """git archive로 ref의 트리를 임시 디렉터리에 풀어 경로 반환."""
+    tmp = tempfile.mkdtemp(prefix="bench_startup_")
+    archive = subprocess.run(["git", "archive", ref], cwd=ROOT, capture_output=True, check=True)
+    subprocess.run(["tar", "-x", "-C", tmp], input=archive.stdout, check=True)
+    # 설정(.env)은 추적되지 않으므로 현재 것을 복사 (import 시 같은 조건)
+    env_file = os.path.join(ROOT, ".env")
+    if os.path.exists(env_file):
+        shutil.copy(env_file, tmp)
+    return tmp
+
+
+def main():
+    parser = argparse.ArgumentParser(description="import 시간 벤치마크")
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES)
+    parser.add_argument("--repeat", type=int, default=5, help="모듈별 측정 횟수 (중앙값 사용)")
+    parser.add_argument("--top", type=int, default=10, help="누적 시간 상위 N개 하위 모듈 표시")
+    parser.add_argument("--ref", help="비교할 git 커밋/브랜치 (예: HEAD~1)")
+    args = parser.parse_args()
+
+    base_dir = extract_ref(args.ref) if args.ref else None
+    try:
+        print("=" * 70)
+        print(f"🚀 import 시간 (중앙값, {args.repeat}회)" + (f" - 비교 대상: {args.ref}" if args.ref else ""))
+        print("=" * 70)
+        for module in args.modules:
+            current, rows = measure(module, ROOT, args.repeat)
+            line = f"  {module:<16} {current:8.1f}ms"
+            if base_dir:
+                try:
+                    before, _ = measure(module, base_dir, args.repeat)
+                    line += f"   ({args.ref}: {before:8.1f}ms, {before / current if current else 0:.1f}x)"
+                except RuntimeError as e:
+                    line += f"   ({args.ref}: 측정 실패 - {e})"
+            print(line)
+
+            heavy = sorted(rows, reverse=True)[:args.top]
+            for ms, name in heavy:
+                print(f"      {ms:8.1f}ms {name.strip()}")
+        print("-" * 70)
+    finally:
+        if base_dir:
+            shutil.rmtree(base_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 """
 2주 이상된 팟캐스트 파일 자동 정리 스크립트
 - MP3 파일 삭제 (로컬 또는 SFTP)
-- DB 레코드 삭제 (episodes 테이블)
+- DB 레코드 삭제 (episodes 테이블) + 달력 집계(episode_calendar)에서 같은 트랜잭션으로 차감
 
 사용법:
     python scripts/cleanup_old_podcasts.py          # SFTP로 원격 삭제
@@ -54,7 +54,7 @@ def get_db_connection():
 def get_old_episodes(cursor, days):
     """보관 기간이 지난 에피소드 조회"""
     query = """
-        SELECT id, title, mp3_path, created_at 
+        SELECT id, title, mp3_path, created_at, keyword_id, duration_sec
         FROM episodes 
         WHERE created_at < NOW() - INTERVAL %s DAY
         ORDER BY created_at ASC
@@ -63,6 +63,27 @@ def get_old_episodes(cursor, days):
     return cursor.fetchall()
 
 
+def subtract_from_calendar(cursor, episodes):
+    """삭제한 에피소드만큼 episode_calendar 차감 (마이그레이션 0004 전이면 건너뜀)."""
+    cursor.execute("SHOW TABLES LIKE 'episode_calendar'")
+    if not cursor.fetchall() or not episodes:
+        return
+    totals = {}
+    for ep in episodes:
+        key = (ep['created_at'].date(), ep['keyword_id'] or 0)
+        count, duration = totals.get(key, (0, 0))
+        totals[key] = (count + 1, duration + (ep['duration_sec'] or 0))
+    cursor.executemany(
+        "UPDATE episode_calendar SET "
+        "episode_count = IF(episode_count > %s, episode_count - %s, 0), "
+        "total_duration_sec = IF(total_duration_sec > %s, total_duration_sec - %s, 0) "
+        "WHERE day = %s AND keyword_id = %s",
+        [(c, c, d, d, day, kid) for (day, kid), (c, d) in totals.items()],
+    )
+    cursor.execute("DELETE FROM episode_calendar WHERE episode_count = 0")
+    print(f"   📅 달력 집계 {len(totals)}개 날짜/키워드 차감")
+
+
 def delete_local_file(file_path):
     """로컬 파일 삭제"""
     try:
@@ -152,6 +173,7 @@ def cleanup_old_podcasts(dry_run=False, limit=None, local_mode=False, days=14):
         
         deleted_files = 0
         deleted_db = 0
+        deleted_episodes = []
         total_size = 0
         
         print("\n" + "-" * 70)
@@ -188,12 +210,14 @@ def cleanup_old_podcasts(dry_run=False, limit=None, local_mode=False, days=14):
             try:
                 cursor.execute("DELETE FROM episodes WHERE id = %s", (ep_id,))
                 deleted_db += 1
+                deleted_episodes.append(ep)
                 print("   ✅ DB 레코드 삭제 완료")
             except Exception as e:
                 print(f"   ❌ DB 삭제 실패: {e}")
         
         # 커밋
         if not dry_run:
+            subtract_from_calendar(cursor, deleted_episodes)
             conn.commit()
             if local_mode:
                 cleanup_empty_directories_local()
@@ -0,0 +1,88 @@
+"""
+기사 본문 추출 캐시 조회/정리
+
+사용법:
+    python scripts/manage_extraction_cache.py stats
+    python scripts/manage_extraction_cache.py list [--status validation_failed] [--limit 20]
+    python scripts/manage_extraction_cache.py show <URL>
+    python scripts/manage_extraction_cache.py purge --negative         # 실패 기록만 삭제
+    python scripts/manage_extraction_cache.py purge --url <URL>        # 특정 URL 삭제
+    python scripts/manage_extraction_cache.py purge --older-than 7     # 7일 이상 안 쓴 항목 삭제
+    python scripts/manage_extraction_cache.py purge --all
+"""
+import os
+import sys
+import argparse
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from extraction_cache import ExtractionCache
+
+
+def _fmt_time(ts):
+    return datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M') if ts else "-"
+
+
+def cmd_stats(cache, args):
+    stats = cache.stats()
+    print("=" * 70)
+    print(f"📦 본문 캐시: {cache.path}")
+    print("=" * 70)
+    for status, cnt in sorted(stats["urls"].items()):
+        print(f"   {status:<20} {cnt:>6}개 URL")
+    print(f"   저장된 본문: {stats['contents']}개, "
+          f"{stats['bytes'] / (1024 * 1024):.1f}MB / {stats['max_bytes'] / (1024 * 1024):.0f}MB")
+
+
+def cmd_list(cache, args):
+    rows = cache.entries(status=args.status, limit=args.limit)
+    for r in rows:
+        size = f"{r['size'] / 1024:.1f}KB" if r["size"] else "-"
+        expires = f" (만료 {_fmt_time(r['expires_at'])})" if r["expires_at"] else ""
+        print(f"[{r['status']}] {_fmt_time(r['accessed_at'])} {size:>8}  {r['url']}{expires}")
+    print(f"\n{len(rows)}개 표시")
+
+
+def cmd_show(cache, args):
+    entry = cache.get(args.url)
+    if entry is None:
+        print("캐시에 없음")
+    elif entry["status"] != "ok":
+        print(f"실패 기록: {entry['status']} (만료 {_fmt_time(entry['expires_at'])})")
+    else:
+        print(f"요약: {entry['summary']}")
+        print("-" * 70)
+        print(entry["text"])
+
+
+def cmd_purge(cache, args):
+    if not (args.all or args.negative or args.url or args.older_than is not None):
+        print("삭제 조건을 지정하세요 (--all, --negative, --url, --older-than)")
+        return
+    deleted = cache.purge(url=args.url, negative_only=args.negative, older_than_days=args.older_than)
+    print(f"🧹 {deleted}개 URL 기록 삭제")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="기사 본문 추출 캐시 관리")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("stats", help="상태별 개수와 용량")
+
+    p_list = sub.add_parser("list", help="최근 접근 순 목록")
+    p_list.add_argument("--status", default=None, help="ok / download_failed / extract_failed / validation_failed")
+    p_list.add_argument("--limit", type=int, default=50)
+
+    p_show = sub.add_parser("show", help="URL의 캐시 내용 출력")
+    p_show.add_argument("url")
+
+    p_purge = sub.add_parser("purge", help="캐시 항목 삭제")
+    p_purge.add_argument("--all", action="store_true", help="전체 삭제")
+    p_purge.add_argument("--negative", action="store_true", help="실패 기록만")
+    p_purge.add_argument("--url", default=None, help="특정 URL만")
+    p_purge.add_argument("--older-than", type=float, default=None, help="N일 이상 접근 없는 항목")
+
+    args = parser.parse_args()
+    cache = ExtractionCache()
+    {"stats": cmd_stats, "list": cmd_list, "show": cmd_show, "purge": cmd_purge}[args.command](cache, args)
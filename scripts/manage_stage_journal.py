@@ -0,0 +1,107 @@
+"""
+기사별 처리 단계 저널 조회/재시도/포기
+
+사용법:
+    python scripts/manage_stage_journal.py stats
+    python scripts/manage_stage_journal.py list                      # 멈춘(stuck) 항목
+    python scripts/manage_stage_journal.py list --state active --limit 20
+    python scripts/manage_stage_journal.py show <ID>
+    python scripts/manage_stage_journal.py retry <ID> [<ID> ...]      # 마지막 완료 단계 다음부터 재시도
+    python scripts/manage_stage_journal.py retry <ID> --from fetched  # 대본부터 다시 생성
+    python scripts/manage_stage_journal.py abandon <ID> [<ID> ...]    # 포기 (보관 MP3 삭제)
+    python scripts/manage_stage_journal.py purge --older-than 14      # 완료/포기 기록 정리
+"""
+import os
+import sys
+import argparse
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import stage_journal
+from stage_journal import StageJournal
+
+
+def _fmt_time(ts):
+    return datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M') if ts else "-"
+
+
+def cmd_stats(journal, args):
+    print("=" * 70)
+    print(f"📒 단계 저널: {journal.path}")
+    print("=" * 70)
+    for r in sorted(journal.stats(), key=lambda r: (r["state"], stage_journal.STAGES.index(r["stage"]))):
+        print(f"   {r['state']:<10} {r['stage']:<10} {r['cnt']:>6}건")
+
+
+def cmd_list(journal, args):
+    rows = journal.entries(state=args.state, limit=args.limit)
+    for r in rows:
+        error = f"\n      └ {r['last_error']}" if r["last_error"] else ""
+        print(f"#{r['id']:<6} [{r['state']}/{r['stage']}] 시도 {r['attempts']}회, "
+              f"{_fmt_time(r['updated_at'])}  {r['title']}{error}")
+    print(f"\n{len(rows)}개 표시")
+
+
+def cmd_show(journal, args):
+    job = journal.get(args.id)
+    if job is None:
+        print("저널에 없음")
+        return
+    for key in ("id", "state", "stage", "attempts", "last_error", "title", "press", "link",
+                "keyword_id", "query", "mp3_path", "remote_path", "duration_sec"):
+        print(f"{key:>12}: {job[key]}")
+    print(f"{'created_at':>12}: {_fmt_time(job['created_at'])}")
+    print(f"{'updated_at':>12}: {_fmt_time(job['updated_at'])}")
+    if job["script"]:
+        print("-" * 70)
+        print(job["script"])
+
+
+def cmd_retry(journal, args):
+    for item_id in args.ids:
+        ok = journal.retry(item_id, stage=args.from_stage)
+        print(f"#{item_id}: {'다음 실행에서 재시도' if ok else '재시도할 수 없음 (없거나 완료됨)'}")
+
+
+def cmd_abandon(journal, args):
+    for item_id in args.ids:
+        ok = journal.abandon(item_id)
+        print(f"#{item_id}: {'포기 처리' if ok else '포기할 수 없음 (없거나 완료됨)'}")
+
+
+def cmd_purge(journal, args):
+    deleted = journal.purge(older_than_days=args.older_than)
+    print(f"🧹 완료/포기 기록 {deleted}건 삭제")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="기사별 처리 단계 저널 관리")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("stats", help="상태/단계별 개수")
+
+    p_list = sub.add_parser("list", help="최근 갱신 순 목록")
+    p_list.add_argument("--state", default=stage_journal.STUCK, help="active / stuck / done / abandoned")
+    p_list.add_argument("--limit", type=int, default=50)
+
+    p_show = sub.add_parser("show", help="항목 상세 (대본 포함)")
+    p_show.add_argument("id", type=int)
+
+    p_retry = sub.add_parser("retry", help="다시 active로 (실패 횟수 초기화)")
+    p_retry.add_argument("ids", type=int, nargs="+")
+    p_retry.add_argument("--from", dest="from_stage", default=None, choices=stage_journal.STAGES[:-1],
+                         help="이 단계까지만 완료된 것으로 되돌림")
+
+    p_abandon = sub.add_parser("abandon", help="포기 (검색 결과에 다시 나와도 건너뜀)")
+    p_abandon.add_argument("ids", type=int, nargs="+")
+
+    p_purge = sub.add_parser("purge", help="완료/포기 기록 삭제")
+    p_purge.add_argument("--older-than", type=float, default=14, help="N일 이상 지난 기록 (기본 14)")
+
+    args = parser.parse_args()
+    journal = StageJournal()
+    {
+        "stats": cmd_stats, "list": cmd_list, "show": cmd_show,
+        "retry": cmd_retry, "abandon": cmd_abandon, "purge": cmd_purge,
+    }[args.command](journal, args)
@@ -0,0 +1,65 @@
+"""
+DB 스키마 마이그레이션 적용/조회 (migrations/*.sql)
+
+크롤러 시작 시(init_db)에는 최신 여부만 확인하고, 테이블을 바꾸는 DDL은 이 명령으로 실행한다.
+큰 episodes 테이블의 MODIFY COLUMN / 인덱스 추가는 오래 걸릴 수 있으니 크롤러가 쉬는 시간에 실행.
+
+사용법:
+    python scripts/migrate.py              # 밀린 마이그레이션 모두 적용
+    python scripts/migrate.py up --to 3    # 3번까지만
+    python scripts/migrate.py up --dry-run # 적용할 목록만 출력
+    python scripts/migrate.py status       # 적용 현황
+"""
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db_manager
+import db_migrate
+
+
+def cmd_up(args):
+    applied = db_manager.run_migrations(target=args.to, dry_run=args.dry_run)
+    if not applied:
+        print("✅ 적용할 마이그레이션 없음 (최신 상태)")
+    elif not args.dry_run:
+        print(f"✅ 마이그레이션 {len(applied)}개 적용")
+
+
+def cmd_status(args):
+    conn = db_manager.get_connection()
+    try:
+        rows = db_migrate.status(conn)
+    finally:
+        conn.close()
+    print("=" * 70)
+    print(f"📜 스키마 마이그레이션 ({db_migrate.MIGRATIONS_DIR})")
+    print("=" * 70)
+    for m, row, changed in rows:
+        if row is None:
+            state = "대기"
+        else:
+            state = f"적용 {row['applied_at']} ({row['duration_ms'] or 0}ms)"
+            if changed:
+                state += "  ⚠️ 적용 후 파일이 바뀜"
+        print(f"   {m.version:04d} {m.name:<35} {state}")
+    pending = sum(1 for _, row, _ in rows if row is None)
+    print(f"\n대기 중: {pending}개")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DB 스키마 마이그레이션")
+    sub = parser.add_subparsers(dest="command")
+
+    p_up = sub.add_parser("up", help="밀린 마이그레이션 적용 (기본)")
+    p_up.add_argument("--to", type=int, default=None, help="이 번호까지만 적용")
+    p_up.add_argument("--dry-run", action="store_true", help="적용하지 않고 목록만 출력")
+
+    sub.add_parser("status", help="적용 현황")
+
+    args = parser.parse_args()
+    if args.command is None:
+        args = parser.parse_args(["up"])
+    {"up": cmd_up, "status": cmd_status}[args.command](args)
@@ -0,0 +1,34 @@
+"""
+달력 집계(episode_calendar) 점검/재계산
+
+집계는 에피소드 저장/정리 때 함께 갱신되지만, DB를 직접 고치거나 마이그레이션 전에 저장된
+에피소드가 있으면 어긋날 수 있다. --check로 차이를 보고, 인자 없이 실행하면 다시 계산한다.
+
+사용법:
+    python scripts/rebuild_calendar.py --check          # 차이만 출력
+    python scripts/rebuild_calendar.py                  # 전체 재계산
+    python scripts/rebuild_calendar.py --days 30        # 최근 30일만 재계산
+"""
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db_manager
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="달력 집계 점검/재계산")
+    parser.add_argument("--days", type=int, default=None, help="최근 N일만 (기본: 전체)")
+    parser.add_argument("--check", action="store_true", help="재계산하지 않고 차이만 출력")
+    args = parser.parse_args()
+
+    drift = db_manager.check_calendar(days=args.days)
+    for day, keyword_id, (have_cnt, have_sec), (want_cnt, want_sec) in drift:
+        print(f"   {day} 키워드 {keyword_id:>4}: 집계 {have_cnt}건/{have_sec}초 → 실제 {want_cnt}건/{want_sec}초")
+    print(f"📅 어긋난 날짜/키워드: {len(drift)}개")
+
+    if not args.check and drift:
+        rows = db_manager.rebuild_calendar(days=args.days)
+        print(f"✅ 재계산 완료: 집계 {rows}행")
@@ -0,0 +1,147 @@
+"""
+에피소드 검색 보조 (순수 파이썬 역색인 + 결과 캐시)
+
+MySQL에서는 db_manager.search_episodes가 ngram FULLTEXT(제목 + 요약)로 검색한다.
+FULLTEXT를 쓸 수 없을 때(마이그레이션 전, SEARCH_BACKEND=python, 테스트/내장 환경)는
+같은 규칙을 흉내 낸 InvertedIndex로 답한다.
+- 토큰: MySQL ngram 파서처럼 단어를 글자 2-gram으로 자름 (한국어는 띄어쓰기가 불규칙해 단어 단위로는 못 찾음)
+- 검색어의 각 단어는 모두 있어야 함 (단어의 2-gram이 모두 있는 문서)
+- 점수: tf × idf 합 × 최신성 가중치 0.5 ** (경과 일수 / half_life_days)
+
+ResultCache는 (검색어, 키워드, 개수) → 결과를 TTL 동안 보관하는 LRU. 에피소드를 저장하면 비운다.
+"""
+import re
+import math
+import time
+import threading
+import unicodedata
+from collections import Counter, OrderedDict
+
+NGRAM = 2  # MySQL ngram_token_size 기본값
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def query_terms(query):
+    """검색어 → 단어 목록 (NFKC 소문자, 중복 제거, ngram보다 짧은 단어는 색인에 없으므로 제외)."""
+    words = _WORD_RE.findall(unicodedata.normalize("NFKC", query or "").lower())
+    return list(dict.fromkeys(w for w in words if len(w) >= NGRAM))
+
+
+def ngrams(text):
+    tokens = []
+    for word in _WORD_RE.findall(unicodedata.normalize("NFKC", text or "").lower()):
+        if len(word) < NGRAM:
+            continue
+        tokens.extend(word[i:i + NGRAM] for i in range(len(word) - NGRAM + 1))
+    return tokens
+
+
+def recency_weight(created_at_ts, half_life_days, now=None):
+    age_days = max(0.0, ((now or time.time()) - created_at_ts) / 86400)
+    return 0.5 ** (age_days / half_life_days)
+
+
+class InvertedIndex:
+    """2-gram → {문서 id: 출현 횟수}. 문서는 (id, 제목 + 요약, 작성 시각, keyword_id)."""
+
+    def __init__(self):
+        self._postings = {}
+        self._docs = {}  # id → (created_at timestamp, keyword_id, 2-gram 집합)
+        self._lock = threading.Lock()
+
+    def add(self, doc_id, text, created_at_ts, keyword_id=None):
+        counts = Counter(ngrams(text))
+        with self._lock:
+            self._remove(doc_id)
+            self._docs[doc_id] = (created_at_ts, keyword_id, frozenset(counts))
+            for token, tf in counts.items():
+                self._postings.setdefault(token, {})[doc_id] = tf
+
+    def remove(self, doc_id):
+        with self._lock:
+            self._remove(doc_id)
+
+    def _remove(self, doc_id):
+        """_lock 안에서 호출."""
+        doc = self._docs.pop(doc_id, None)
+        if doc is None:
+            return
+        for token in doc[2]:
+            posting = self._postings.get(token)
+            if posting is not None:
+                posting.pop(doc_id, None)
+                if not posting:
+                    del self._postings[token]
+
+    def search(self, query, keyword_id=None, limit=20, half_life_days=30.0, now=None):
+        """[(문서 id, 점수)] 점수 높은 순."""
+        terms = query_terms(query)
+        if not terms:
+            return []
+        tokens = list(dict.fromkeys(t for term in terms for t in ngrams(term)))
+        with self._lock:
+            postings = [self._postings.get(t) for t in tokens]
+            if not all(postings):
+                return []
+            # 가장 짧은 목록부터 교집합 → 모든 단어(2-gram)가 있는 문서
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates.intersection_update(posting)
+                if not candidates:
+                    return []
+            total = len(self._docs)
+            idf = [math.log(1 + total / len(p)) for p in postings]
+            scored = []
+            for doc_id in candidates:
+                created_at_ts, doc_keyword, _ = self._docs[doc_id]
+                if keyword_id is not None and doc_keyword != keyword_id:
+                    continue
+                relevance = sum(p[doc_id] * w for p, w in zip(postings, idf))
+                scored.append((doc_id, relevance * recency_weight(created_at_ts, half_life_days, now)))
+        scored.sort(key=lambda x: (-x[1], -x[0]))
+        return scored[:limit]
+
+    def __len__(self):
+        return len(self._docs)
+
+
+class ResultCache:
+    """스레드 안전 LRU + TTL."""
+
+    def __init__(self, size=256, ttl=60.0):
+        self.size = size
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key → (저장 시각, 값)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.time() - entry[0] > self.ttl:
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value):
+        if self.size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
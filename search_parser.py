@@ -0,0 +1,162 @@
+"""
+네이버 뉴스 검색 결과 카드 파서
+
+ul.list_news 하위만 파싱(SoupStrainer)하고, 결과 카드마다 요소를 한 번씩만
+순회하며 제목/링크/언론사/상대 시각/네이버뉴스 링크를 뽑아낸다.
+헤드라인마다 find_previous로 문서를 거꾸로 훑던 방식 대신, 순회 중 마지막으로 본
+언론사 요소를 기억해 두었다가 헤드라인에 붙인다.
+
+마지막으로 맞은 헤드라인 셀렉터 전략을 기억해 다음 페이지에서는 그 전략만 먼저 확인.
+stop_links를 주면 (최신순 결과에서) 이미 처리한 링크에 닿는 순간 순회를 멈춘다.
+"""
+import re
+
+from bs4 import BeautifulSoup, SoupStrainer, NavigableString, Tag
+
+# lxml은 trafilatura 의존성으로 함께 설치됨. 없으면 내장 파서로 동작.
+try:
+    import lxml  # noqa: F401
+    PARSER_BACKEND = "lxml"
+except ImportError:
+    PARSER_BACKEND = "html.parser"
+
+# (이름, 클래스 문자열 판별 함수) - 앞쪽이 우선순위 높음
+HEADLINE_RULES = [
+    ("sds", lambda c: 'sds-comps-text-type-headline1' in c),  # Current selector
+    ("legacy", lambda c: 'news_tit' in c),  # Legacy selector
+    ("generic", lambda c: 'title' in c.lower() and 'news' in c.lower()),  # Generic
+]
+
+PRESS_RULES = [
+    lambda c: 'sds-comps-profile-info-title-text' in c,
+    lambda c: 'press' in c.lower(),
+    lambda c: 'info_group' in c,
+]
+
+NAVER_NEWS_HOST = "n.news.naver.com"
+NO_PRESS = "언론사 정보 없음"
+
+_TIME_RE = re.compile(r"\d+\s*(?:초|분|시간|일|주|개월)\s*전|\d{4}\.\d{1,2}\.\d{1,2}\.?")
+
+_news_list_strainer = SoupStrainer("ul", class_="list_news")
+
+
+class SearchResultParser:
+    """검색 결과 HTML → 기사 레코드 리스트. 인스턴스가 마지막 전략을 기억한다."""
+
+    def __init__(self, backend=None):
+        self.backend = backend or PARSER_BACKEND
+        self.preferred_rule = 0
+
+    def parse(self, html):
+        """
+        Returns:
+            None  - ul.list_news 자체가 없음
+            list  - [{'title', 'link', 'press', 'time', 'naver_link'}, ...] (없으면 빈 리스트)
+        """
+        return self.parse_new(html)[0]
+
+    def parse_new(self, html, stop_links=None):
+        """
+        stop_links에 든 링크를 만나기 전까지의 레코드만 반환.
+
+        Returns:
+            (records, reached) - records는 parse()와 같고, reached는 stop_links에 닿아 멈췄는지 여부
+        """
+        soup = BeautifulSoup(html, self.backend, parse_only=_news_list_strainer)
+        news_list_ul = soup.find("ul", class_="list_news")
+        if news_list_ul is None:
+            return None, False
+
+        cards = [c for c in news_list_ul.children if isinstance(c, Tag)]
+        stop_links = stop_links or ()
+
+        # 지난번에 맞은 전략 하나만 먼저 시도, 실패하면 나머지를 우선순위 순으로
+        rule, records, reached = self._walk(cards, [self.preferred_rule], stop_links)
+        if rule is None:
+            others = [i for i in range(len(HEADLINE_RULES)) if i != self.preferred_rule]
+            rule, records, reached = self._walk(cards, others, stop_links)
+        if rule is not None:
+            self.preferred_rule = rule
+        return records, reached
+
+    def _walk(self, cards, rule_indexes, stop_links):
+        """Returns: (맞은 전략 인덱스 또는 None, 레코드 리스트, stop_links 도달 여부)"""
+        found = {i: [] for i in rule_indexes}
+        matched = dict.fromkeys(rule_indexes, 0)
+        stopped = set()
+        last_press = [None] * len(PRESS_RULES)
+
+        for card in cards:
+            card_time = None
+            card_naver_link = None
+            pending = {i: [] for i in rule_indexes}
+
+            for el in card.descendants:
+                if isinstance(el, NavigableString):
+                    if card_time is None:
+                        m = _TIME_RE.search(el)
+                        if m:
+                            card_time = m.group(0)
+                    continue
+                if not isinstance(el, Tag):
+                    continue
+
+                if el.name == "a" and card_naver_link is None:
+                    href = el.get("href", "")
+                    if NAVER_NEWS_HOST in href:
+                        card_naver_link = href
+
+                classes = el.get("class")
+                if not classes:
+                    continue
+                cls = " ".join(classes)
+
+                for p, rule in enumerate(PRESS_RULES):
+                    if rule(cls):
+                        last_press[p] = el
+
+                for i in rule_indexes:
+                    if i in stopped or not HEADLINE_RULES[i][1](cls):
+                        continue
+                    matched[i] += 1
+                    press_el = next((e for e in last_press if e is not None), None)
+                    record = self._record(el, press_el)
+                    if record["link"] in stop_links:
+                        stopped.add(i)
+                    else:
+                        pending[i].append(record)
+
+            for i, records in pending.items():
+                for record in records:
+                    record["time"] = card_time
+                    record["naver_link"] = card_naver_link
+                found[i].extend(records)
+            if len(stopped) == len(rule_indexes):
+                break
+
+        for i in rule_indexes:
+            if matched[i]:
+                return i, found[i], i in stopped
+        return None, [], False
+
+    @staticmethod
+    def _record(headline, press_el):
+        link_el = headline if headline.name == "a" else headline.find_parent("a")
+        return {
+            "title": headline.get_text(strip=True),
+            "link": link_el.get("href", "") if link_el else "",
+            "press": press_el.get_text(strip=True) if press_el else NO_PRESS,
+        }
+
+    @property
+    def strategy(self):
+        return HEADLINE_RULES[self.preferred_rule][0]
+
+
+default_parser = SearchResultParser()
+
+
+def parse_search_results(html, stop_links=None):
+    """모듈 공용 파서로 파싱 (전략 기억이 실행 내내 유지됨). (records, reached) 반환."""
+    return default_parser.parse_new(html, stop_links)
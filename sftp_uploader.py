@@ -1,24 +1,22 @@
-import paramiko
 import os
 import time
 import logging
+import threading
 from datetime import datetime
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+from config import config
 
 logger = logging.getLogger(__name__)
 
 # Server Configuration (from environment variables)
-HOST = os.getenv("SFTP_HOST", "")
-PORT = int(os.getenv("SFTP_PORT", "22"))
-USERNAME = os.getenv("SFTP_USER", "")
-PASSWORD = os.getenv("SFTP_PASSWORD", "")
-KEY_FILE = os.getenv("SFTP_KEY_FILE", "")
+HOST = config.SFTP_HOST
+PORT = config.SFTP_PORT
+USERNAME = config.SFTP_USER
+PASSWORD = config.SFTP_PASSWORD
+KEY_FILE = config.SFTP_KEY_FILE
 # Flask static folder (override via SFTP_REMOTE_DIR)
-REMOTE_DIR = os.getenv("SFTP_REMOTE_DIR", "/root/flask-app/static/podcast")
-WEB_URL = os.getenv("PODCAST_WEB_URL", "https://sosig.shop/podcast")
+REMOTE_DIR = config.SFTP_REMOTE_DIR
+WEB_URL = config.PODCAST_WEB_URL
 
 def create_remote_dir(sftp, path):
     """Recursively creates remote directories."""
@@ -39,6 +37,97 @@ def create_remote_dir(sftp, path):
                 except Exception:
                     logger.warning(f"SFTP mkdir 실패: {current_path} - {e}")
 
+# ===== 상주(daemon) 모드용 연결 재사용 =====
+# 기본은 업로드마다 접속/종료. keep_connection_warm() 이후에는 SSH 연결 하나를 유지하며
+# 업로드를 직렬화하고, 끊기면 다음 시도에서 다시 접속한다.
+SFTP_KEEPALIVE_SEC = config.SFTP_KEEPALIVE_SEC
+
+_persistent = False
+_session = None  # (client, sftp)
+_session_lock = threading.Lock()
+
+
+def _connect():
+    import paramiko  # import 비용이 커서 실제 업로드 때 불러옴
+
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    # password 전용 인증으로 강제.
+    # paramiko 기본값(look_for_keys/allow_agent=True)으로 두면
+    # ~/.ssh 키나 agent 키를 먼저 시도하다가 서버의
+    # PubkeyAcceptedAlgorithms(ssh-rsa 제외) 정책에 막혀
+    # password fallback 없이 실패하는 문제가 있음.
+    try:
+        if KEY_FILE and os.path.exists(KEY_FILE):
+            client.connect(
+                HOST, PORT, USERNAME,
+                key_filename=KEY_FILE,
+                timeout=30, banner_timeout=30,
+                allow_agent=False, look_for_keys=False,
+            )
+        else:
+            client.connect(
+                HOST, PORT, USERNAME, PASSWORD,
+                timeout=30, banner_timeout=30,
+                allow_agent=False, look_for_keys=False,
+            )
+        return client, client.open_sftp()
+    except Exception:
+        client.close()
+        raise
+
+
+def _close(client, sftp):
+    try:
+        if sftp: sftp.close()
+        if client: client.close()
+    except Exception as e:
+        logger.debug(f"SFTP 연결 정리 중 무시된 오류: {e}")
+
+
+def keep_connection_warm(enabled=True):
+    """상주 모드: 업로드 간 SSH/SFTP 연결 유지."""
+    global _persistent
+    _persistent = enabled
+    if not enabled:
+        close_connection()
+
+
+def close_connection():
+    with _session_lock:
+        _discard_session()
+
+
+def _discard_session():
+    """_session_lock 안에서 호출."""
+    global _session
+    if _session is not None:
+        _close(*_session)
+        _session = None
+
+
+def _warm_session():
+    """유지 중인 연결 반환 (없거나 끊겼으면 새로 접속). _session_lock 안에서 호출."""
+    global _session
+    if _session is not None:
+        transport = _session[0].get_transport()
+        if transport is None or not transport.is_active():
+            _discard_session()
+    if _session is None:
+        _session = _connect()
+        _session[0].get_transport().set_keepalive(SFTP_KEEPALIVE_SEC)
+    return _session
+
+
+def _put(sftp, local_path, remote_folder, remote_path, attempt, max_attempts):
+    create_remote_dir(sftp, remote_folder)
+
+    print(f"Uploading to {remote_path}... (시도 {attempt}/{max_attempts})")
+    sftp.put(local_path, remote_path)
+    print("Upload successful.")
+    print(f"Web Player Updated: {WEB_URL}")
+
+
 def upload_file(local_path):
     """Uploads a file to the Flask server's static folder."""
     
@@ -76,34 +165,17 @@ def upload_file(local_path):
         client = None
         sftp = None
         try:
-            client = paramiko.SSHClient()
-            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            # password 전용 인증으로 강제.
-            # paramiko 기본값(look_for_keys/allow_agent=True)으로 두면
-            # ~/.ssh 키나 agent 키를 먼저 시도하다가 서버의
-            # PubkeyAcceptedAlgorithms(ssh-rsa 제외) 정책에 막혀
-            # password fallback 없이 실패하는 문제가 있음.
-            if KEY_FILE and os.path.exists(KEY_FILE):
-                client.connect(
-                    HOST, PORT, USERNAME,
-                    key_filename=KEY_FILE,
-                    timeout=30, banner_timeout=30,
-                    allow_agent=False, look_for_keys=False,
-                )
+            if _persistent:
+                with _session_lock:
+                    try:
+                        _put(_warm_session()[1], local_path, remote_folder, remote_path, attempt, max_attempts)
+                    except Exception:
+                        # 연결 상태를 알 수 없으므로 버리고 다음 시도에서 재접속
+                        _discard_session()
+                        raise
             else:
-                client.connect(
-                    HOST, PORT, USERNAME, PASSWORD,
-                    timeout=30, banner_timeout=30,
-                    allow_agent=False, look_for_keys=False,
-                )
-            sftp = client.open_sftp()
-
-            create_remote_dir(sftp, remote_folder)
-
-            print(f"Uploading to {remote_path}... (시도 {attempt}/{max_attempts})")
-            sftp.put(local_path, remote_path)
-            print("Upload successful.")
-            print(f"Web Player Updated: {WEB_URL}")
+                client, sftp = _connect()
+                _put(sftp, local_path, remote_folder, remote_path, attempt, max_attempts)
             return remote_path
 
         except Exception as e:
@@ -113,11 +185,7 @@ def upload_file(local_path):
                 print(f"  {backoff}초 후 재시도...")
                 time.sleep(backoff)
         finally:
-            try:
-                if sftp: sftp.close()
-                if client: client.close()
-            except Exception as e:
-                logger.debug(f"SFTP 연결 정리 중 무시된 오류: {e}")
+            _close(client, sftp)
 
     print(f"❌ SFTP 업로드 최종 실패 ({max_attempts}회 시도)")
     return None
@@ -0,0 +1,296 @@
+"""
+기사별 처리 단계 저널 (크래시 후 이어서 처리)
+
+기사 하나는 fetched → scripted → rendered → uploaded → recorded 순서로 진행한다.
+단계가 끝날 때마다 산출물(본문/요약/SimHash, 대본, MP3 경로, 원격 경로, 재생 길이)을
+sqlite3에 기록하므로, 대본 생성 후 업로드 전에 프로세스가 죽어도(타임아웃, OOM, cron kill)
+다음 실행은 마지막으로 끝난 단계 다음부터 진행한다 → Claude/TTS 비용을 다시 쓰지 않음.
+
+상태(state)
+- active    : 진행 중 / 다음 실행에서 이어서 처리
+- stuck     : JOURNAL_MAX_ATTEMPTS회 연속 실패 → 자동 재시도 중단 (CLI로 retry/abandon)
+- done      : DB 저장까지 완료
+- abandoned : 포기 → 검색 결과에 다시 나와도 건너뜀
+
+렌더링한 MP3는 JOURNAL_AUDIO_DIR에 보관한다 (MP3/ 폴더의 24시간 정리 대상이 아님).
+관리 CLI: python scripts/manage_stage_journal.py
+"""
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+
+from canonical import canonical_url
+from config import config
+
+JOURNAL_ENABLED = config.JOURNAL_ENABLED
+JOURNAL_PATH = config.JOURNAL_PATH
+JOURNAL_AUDIO_DIR = config.JOURNAL_AUDIO_DIR
+# 이 횟수만큼 연속 실패하면 stuck으로 바꿔 자동 재시도 중단
+JOURNAL_MAX_ATTEMPTS = config.JOURNAL_MAX_ATTEMPTS
+
+# 단계 (마지막으로 끝난 단계를 기록)
+FETCHED = "fetched"
+SCRIPTED = "scripted"
+RENDERED = "rendered"
+UPLOADED = "uploaded"
+RECORDED = "recorded"
+STAGES = (FETCHED, SCRIPTED, RENDERED, UPLOADED, RECORDED)
+
+# 상태
+ACTIVE = "active"
+STUCK = "stuck"
+DONE = "done"
+ABANDONED = "abandoned"
+
+# 단계를 되돌릴 때 지우는 산출물 (해당 단계가 만든 것)
+_STAGE_ARTIFACTS = {
+    SCRIPTED: ("script",),
+    RENDERED: ("mp3_path",),
+    UPLOADED: ("remote_path", "duration_sec"),
+}
+
+
+def _to_sqlite_int(h):
+    """SimHash(부호 없는 64비트) → sqlite INTEGER(부호 있는 64비트) 범위로."""
+    if h is None:
+        return None
+    return h - (1 << 64) if h >= 1 << 63 else h
+
+
+def _from_sqlite_int(v):
+    if v is None:
+        return None
+    return v + (1 << 64) if v < 0 else v
+
+
+def _row(r):
+    job = dict(r)
+    if "simhash" in job:
+        job["simhash"] = _from_sqlite_int(job["simhash"])
+    return job
+
+
+def _item_key(link):
+    return hashlib.sha256(canonical_url(link).encode("utf-8")).hexdigest()
+
+
+class StageJournal:
+    """sqlite3 기반 기사 → (단계, 산출물, 상태) 기록."""
+
+    def __init__(self, path=None, max_attempts=None):
+        self.path = path or JOURNAL_PATH
+        self.max_attempts = max_attempts or JOURNAL_MAX_ATTEMPTS
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # 단계가 끝난 직후 기록이 디스크에 있어야 하므로 synchronous는 기본값(FULL) 유지
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                item_key TEXT NOT NULL UNIQUE,
+                link TEXT NOT NULL,
+                title TEXT,
+                press TEXT,
+                keyword_id INTEGER,
+                query TEXT,
+                stage TEXT NOT NULL,
+                state TEXT NOT NULL,
+                content TEXT,
+                summary TEXT,
+                simhash INTEGER,  -- 부호 있는 64비트로 저장 (_to_sqlite_int)
+                script TEXT,
+                mp3_path TEXT,
+                remote_path TEXT,
+                duration_sec INTEGER,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_items_state ON items (state, keyword_id);
+        """)
+        self._conn.commit()
+
+    def _update(self, item_id, **fields):
+        """_lock 안에서 호출."""
+        fields["updated_at"] = time.time()
+        cols = ", ".join(f"{k} = ?" for k in fields)
+        self._conn.execute(f"UPDATE items SET {cols} WHERE id = ?", (*fields.values(), item_id))
+        self._conn.commit()
+
+    # ===== 크롤러용 =====
+    def begin(self, job):
+        """
+        본문을 받은 기사를 fetched 단계로 기록하고 job['id'], job['stage']를 채운다.
+        이미 기록이 있으면(예: 포기 후 재등장) 기존 행을 fetched부터 다시 시작한다.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO items (item_key, link, title, press, keyword_id, query, stage, state, "
+                "content, summary, simhash, created_at, updated_at) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?) "
+                "ON CONFLICT(item_key) DO UPDATE SET stage = excluded.stage, state = excluded.state, "
+                "content = excluded.content, summary = excluded.summary, simhash = excluded.simhash, "
+                "script = NULL, mp3_path = NULL, remote_path = NULL, duration_sec = NULL, "
+                "attempts = 0, last_error = NULL, updated_at = excluded.updated_at",
+                (_item_key(job["link"]), job["link"], job["title"], job["press"], job.get("keyword_id"),
+                 job.get("query"), FETCHED, ACTIVE, job["content"], job.get("summary"),
+                 _to_sqlite_int(job.get("simhash")),
+                 now, now),
+            )
+            job["id"] = self._conn.execute(
+                "SELECT id FROM items WHERE item_key = ?", (_item_key(job["link"]),)
+            ).fetchone()[0]
+            self._conn.commit()
+        job["stage"] = FETCHED
+        return job
+
+    def advance(self, job, stage, **artifacts):
+        """stage까지 끝났음을 산출물과 함께 기록. recorded면 완료 처리하고 큰 산출물은 비움."""
+        job.update(artifacts, stage=stage)
+        fields = dict(artifacts, stage=stage, last_error=None)
+        if stage == RECORDED:
+            fields.update(state=DONE, content=None, script=None)
+        with self._lock:
+            self._update(job["id"], **fields)
+
+    def rewind(self, job, stage, error):
+        """
+        산출물이 쓸모없어졌을 때(대본이 유효하지 않음, MP3 유실 등) stage로 되돌리고 실패 1회로 센다.
+        """
+        cleared = {}
+        for later in STAGES[STAGES.index(stage) + 1:]:
+            for col in _STAGE_ARTIFACTS.get(later, ()):
+                cleared[col] = None
+        job.update(cleared, stage=stage)
+        with self._lock:
+            self._update(job["id"], stage=stage, **cleared)
+        self.fail(job, error)
+
+    def fail(self, job, error):
+        """실패 1회 기록. 연속 실패가 max_attempts에 닿으면 stuck."""
+        with self._lock:
+            attempts = self._conn.execute(
+                "SELECT attempts FROM items WHERE id = ?", (job["id"],)
+            ).fetchone()[0] + 1
+            state = STUCK if attempts >= self.max_attempts else ACTIVE
+            self._update(job["id"], attempts=attempts, last_error=str(error)[:500], state=state)
+        job["attempts"], job["state"] = attempts, state
+
+    def discard(self, job):
+        """더 진행할 필요가 없어진 기사(유사 기사로 판명 등)의 기록 삭제."""
+        with self._lock:
+            self._conn.execute("DELETE FROM items WHERE id = ?", (job["id"],))
+            self._conn.commit()
+
+    def pending(self, keyword_id=None, query=None):
+        """이어서 처리할 active 항목 (오래된 순). keyword_id가 없으면 query로 찾음."""
+        if keyword_id is not None:
+            where, params = "keyword_id = ?", (keyword_id,)
+        else:
+            where, params = "keyword_id IS NULL AND query = ?", (query,)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM items WHERE state = ? AND {where} ORDER BY id", (ACTIVE, *params)
+            ).fetchall()
+        return [_row(r) for r in rows]
+
+    def states(self, links):
+        """{link: state} - 기록이 있는 링크만."""
+        keys = {_item_key(link): link for link in links if link}
+        if not keys:
+            return {}
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT item_key, state FROM items WHERE item_key IN ({placeholders})", list(keys)
+            ).fetchall()
+        return {keys[r["item_key"]]: r["state"] for r in rows}
+
+    # ===== 관리용 =====
+    def get(self, item_id):
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM items WHERE id = ?", (item_id,)).fetchone()
+        return _row(row) if row else None
+
+    def stats(self):
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT state, stage, COUNT(*) AS cnt FROM items GROUP BY state, stage"
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+    def entries(self, state=None, limit=50):
+        sql = ("SELECT id, link, title, keyword_id, query, stage, state, attempts, last_error, "
+               "mp3_path, created_at, updated_at FROM items")
+        params = []
+        if state:
+            sql += " WHERE state = ?"
+            params.append(state)
+        sql += " ORDER BY updated_at DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            return [dict(r) for r in self._conn.execute(sql, params)]
+
+    def retry(self, item_id, stage=None):
+        """stuck/abandoned 항목을 다시 active로. stage를 주면 그 단계로 되돌려 다음 단계부터 다시 진행."""
+        job = self.get(item_id)
+        if job is None or job["state"] == DONE:
+            return False
+        fields = {"state": ACTIVE, "attempts": 0, "last_error": None}
+        if stage is not None and STAGES.index(stage) < STAGES.index(job["stage"]):
+            fields["stage"] = stage
+            for later in STAGES[STAGES.index(stage) + 1:]:
+                for col in _STAGE_ARTIFACTS.get(later, ()):
+                    fields[col] = None
+            if job["mp3_path"] and fields.get("mp3_path", job["mp3_path"]) is None:
+                _remove_file(job["mp3_path"])
+        with self._lock:
+            self._update(item_id, **fields)
+        return True
+
+    def abandon(self, item_id):
+        """포기 처리하고 보관 중인 MP3 삭제. 검색 결과에 다시 나와도 건너뛴다."""
+        job = self.get(item_id)
+        if job is None or job["state"] == DONE:
+            return False
+        if job["mp3_path"]:
+            _remove_file(job["mp3_path"])
+        with self._lock:
+            self._update(item_id, state=ABANDONED, content=None, script=None, mp3_path=None)
+        return True
+
+    def purge(self, older_than_days=0, states=(DONE, ABANDONED)):
+        """states 상태로 older_than_days일 이상 지난 기록 삭제. 삭제 수 반환."""
+        placeholders = ",".join("?" * len(states))
+        with self._lock:
+            deleted = self._conn.execute(
+                f"DELETE FROM items WHERE state IN ({placeholders}) AND updated_at < ?",
+                (*states, time.time() - older_than_days * 86400),
+            ).rowcount
+            self._conn.commit()
+            self._conn.execute("VACUUM")
+        return deleted
+
+
+def _remove_file(path):
+    try:
+        if os.path.exists(path):
+            os.remove(path)
+    except OSError as e:
+        print(f"⚠️ 저널 MP3 삭제 실패 ({path}): {e}")
+
+
+def open_stage_journal():
+    """설정에 따라 저널을 열고, 비활성/실패 시 None."""
+    if not JOURNAL_ENABLED:
+        return None
+    try:
+        return StageJournal()
+    except Exception as e:
+        print(f"⚠️ 단계 저널 비활성화 (열기 실패): {e}")
+        return None
@@ -0,0 +1,194 @@
+"""
+단계별 스레드 파이프라인 (생산자/소비자)
+
+단계마다 워커 스레드 N개와 입력 큐(크기 제한)를 두고, 각 단계 함수가 돌려준 항목을
+다음 단계 큐로 넘긴다. 업로드가 N번째 에피소드를 보내는 동안 TTS는 N+1번째를,
+Claude는 N+2번째 대본을 만든다. 큐가 가득 차면 앞 단계가 기다리므로(backpressure)
+메모리/디스크에 쌓이는 중간 산출물이 제한된다.
+
+- 단계 함수 fn(item) → 다음 단계로 넘길 item, 또는 None(여기서 종료)
+- 예외가 나면 on_error(단계 이름, item, 예외) 호출 후 그 항목은 종료
+- run_batch(items)는 넘긴 항목이 모두 파이프라인을 빠져나올 때까지 기다린다
+  (여러 스레드가 동시에 호출해도 됨 → 키워드 작업들이 한 파이프라인을 공유)
+- report()는 단계별 처리 수, 사용률(작업 시간 / 워커 수 × 경과 시간), 평균 대기, 큐 길이(평균/최대)
+"""
+import time
+import queue
+import threading
+
+_STOP = object()
+
+
+class _Batch:
+    """run_batch 한 번에 넘긴 항목 수를 세는 카운트다운 래치."""
+
+    def __init__(self, count):
+        self._remaining = count
+        self._cond = threading.Condition()
+
+    def done(self):
+        with self._cond:
+            self._remaining -= 1
+            if self._remaining <= 0:
+                self._cond.notify_all()
+
+    def wait(self):
+        with self._cond:
+            while self._remaining > 0:
+                self._cond.wait()
+
+
+class Stage:
+    def __init__(self, name, fn, workers=1, queue_size=2):
+        self.name = name
+        self.fn = fn
+        self.workers = max(1, workers)
+        self.queue = queue.Queue(maxsize=max(1, queue_size))
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = time.time()
+            self.processed = 0
+            self.errors = 0
+            self.busy_sec = 0.0
+            self.wait_sec = 0.0
+            self.max_depth = self.queue.qsize()
+            self._depth_area = 0.0
+            self._depth = self.queue.qsize()
+            self._depth_changed_at = self.started_at
+
+    def _track_depth(self):
+        """큐 길이가 바뀔 때마다 호출 → 시간 가중 평균 길이 계산용 누적."""
+        now = time.time()
+        with self._lock:
+            self._depth_area += self._depth * (now - self._depth_changed_at)
+            self._depth = self.queue.qsize()
+            self._depth_changed_at = now
+            self.max_depth = max(self.max_depth, self._depth)
+
+    def put(self, entry):
+        self.queue.put(entry)
+        self._track_depth()
+
+    def get(self):
+        entry = self.queue.get()
+        self._track_depth()
+        return entry
+
+    def record(self, waited, busy, failed=False):
+        with self._lock:
+            self.processed += 1
+            self.errors += failed
+            self.wait_sec += waited
+            self.busy_sec += busy
+
+    def snapshot(self):
+        self._track_depth()
+        with self._lock:
+            elapsed = max(time.time() - self.started_at, 1e-9)
+            return {
+                "stage": self.name,
+                "workers": self.workers,
+                "processed": self.processed,
+                "errors": self.errors,
+                "utilization": self.busy_sec / (self.workers * elapsed),
+                "avg_busy_sec": self.busy_sec / self.processed if self.processed else 0.0,
+                "avg_wait_sec": self.wait_sec / self.processed if self.processed else 0.0,
+                "avg_depth": self._depth_area / elapsed,
+                "max_depth": self.max_depth,
+                "capacity": self.queue.maxsize,
+            }
+
+
+class Pipeline:
+    def __init__(self, stages, on_error=None, name="pipeline"):
+        self.stages = list(stages)
+        self._index = {s.name: i for i, s in enumerate(self.stages)}
+        self.on_error = on_error
+        self.name = name
+        self._threads = []
+        self._start_lock = threading.Lock()
+
+    def start(self):
+        with self._start_lock:
+            if self._threads:
+                return
+            for i, stage in enumerate(self.stages):
+                for n in range(stage.workers):
+                    t = threading.Thread(
+                        target=self._worker, args=(i,), name=f"{self.name}-{stage.name}-{n}", daemon=True
+                    )
+                    t.start()
+                    self._threads.append(t)
+
+    def _worker(self, index):
+        stage = self.stages[index]
+        nxt = self.stages[index + 1] if index + 1 < len(self.stages) else None
+        while True:
+            entry = stage.get()
+            if entry is _STOP:
+                return
+            batch, item, enqueued_at = entry
+            began = time.time()
+            try:
+                result = stage.fn(item)
+                failed = False
+            except Exception as e:
+                result, failed = None, True
+                if self.on_error is not None:
+                    try:
+                        self.on_error(stage.name, item, e)
+                    except Exception:
+                        pass
+            stage.record(began - enqueued_at, time.time() - began, failed)
+            if result is not None and nxt is not None:
+                nxt.put((batch, result, time.time()))
+            else:
+                batch.done()
+
+    def run_batch(self, items, entry=None):
+        """
+        items를 파이프라인에 넣고 모두 끝날 때까지 대기.
+        entry(item) → 시작할 단계 이름 (없으면 첫 단계). 일부 단계를 이미 마친 항목용.
+        """
+        items = list(items)
+        if not items:
+            return
+        self.start()
+        batch = _Batch(len(items))
+        for item in items:
+            index = self._index[entry(item)] if entry is not None else 0
+            self.stages[index].put((batch, item, time.time()))
+        batch.wait()
+
+    def report(self, reset=True):
+        """단계별 통계 목록. reset이면 다음 측정 구간을 새로 시작."""
+        rows = [s.snapshot() for s in self.stages]
+        if reset:
+            for s in self.stages:
+                s.reset()
+        return rows
+
+    def close(self):
+        """워커 종료 (진행 중인 항목이 모두 끝난 뒤 호출)."""
+        with self._start_lock:
+            for stage in self.stages:
+                for _ in range(stage.workers):
+                    stage.queue.put(_STOP)
+            for t in self._threads:
+                t.join()
+            self._threads = []
+
+
+def format_report(rows):
+    lines = [f"  {'단계':<8} {'워커':>4} {'처리':>5} {'오류':>4} {'사용률':>7} {'평균 작업':>9} "
+             f"{'평균 대기':>9} {'큐 평균/최대':>12}"]
+    for r in rows:
+        lines.append(
+            f"  {r['stage']:<8} {r['workers']:>4} {r['processed']:>5} {r['errors']:>4} "
+            f"{r['utilization'] * 100:>6.0f}% {r['avg_busy_sec']:>8.1f}s {r['avg_wait_sec']:>8.1f}s "
+            f"{r['avg_depth']:>6.1f}/{r['max_depth']}({r['capacity']})"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,64 @@
+"""
+article_cleaner 도입 전 naver_crawler의 정제/검증/요약 구현 (re.sub 방식)
+
+article_cleaner가 이것과 같은 결과를 내는지 tests/test_article_cleaner.py와
+scripts/bench_clean.py가 비교한다. 동작 기준이므로 고치지 말 것.
+"""
+import re
+import random
+
+
+def legacy_clean_article_text(text):
+    if not text:
+        return text
+    text = re.sub(r'\w+@\w+\.\w+', '', text)
+    for pattern in [r'.*?기자\s*=\s*', r'.*?특파원\s*=\s*', r'\[.*?기자\]', r'기자\s+\w+']:
+        text = re.sub(pattern, '', text)
+    for pattern in [r'Copyright\s*©.*', r'저작권자.*', r'무단\s*전재.*', r'배포\s*금지.*', r'ⓒ.*']:
+        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+    text = re.sub(r'(카카오톡|페이스북|트위터|공유하기).*', '', text)
+    for pattern in [
+        r'기사 섹션 분류 안내.*?있습니다\.', r'이 기사는 언론사에서.*?분류했습니다\.',
+        r'섹션으로 분류했습니다', r'.*?바로가기\n?', r'기사의 섹션 정보는.*',
+        r'언론사는 개별 기사를.*', r'\[.*?뉴스\]', r'【.*?】', r'▶.*?\n?', r'◆.*?\n?',
+        r'■.*?\n?', r'☞.*?\n?', r'▷.*?\n?', r'사진=.*?\n?', r'\(사진.*?\)', r'영상=.*?\n?',
+    ]:
+        text = re.sub(pattern, '', text, flags=re.DOTALL)
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    return text.strip()
+
+
+def legacy_validate_content(content):
+    if not content or len(content) < 200:
+        return False
+    korean_chars = len([c for c in content if '가' <= c <= '힣'])
+    total_chars = len(content.replace('\n', '').replace(' ', ''))
+    if total_chars == 0:
+        return False
+    return korean_chars / total_chars >= 0.3
+
+
+def legacy_build_summary(content, limit=280):
+    if not content:
+        return None
+    cleaned = re.sub(r"\s+", " ", content).strip()
+    return cleaned[:limit] if cleaned else None
+
+
+def legacy_pipeline(text):
+    cleaned = legacy_clean_article_text(text)
+    if not legacy_validate_content(cleaned):
+        return None
+    return cleaned, legacy_build_summary(cleaned)
+
+
+def fuzz_inputs(n, seed=0):
+    tokens = [
+        "기자", "기자 =", "특파원=", "[", "]", "기자]", "뉴스]", "【", "】", "(사진", ")", "사진=",
+        "영상=", "▶", "◆", "■", "☞", "▷", "바로가기", "\n", "\n\n\n", " ", "a@b.cd", "hong@",
+        "Copyright ©", "저작권자", "무단 전재", "배포\n금지", "ⓒ", "Ⓒ", "카카오톡", "공유하기",
+        "기사의 섹션 정보는", "언론사는 개별 기사를", "기사 섹션 분류 안내", "있습니다.",
+        "이 기사는 언론사에서", "분류했습니다.", "섹션으로 분류했습니다", "가나다", "본문", "abc",
+    ]
+    rnd = random.Random(seed)
+    return ["".join(rnd.choice(tokens) for _ in range(rnd.randint(1, 60))) for _ in range(n)]
@@ -0,0 +1,31 @@
+from types import SimpleNamespace
+
+from naver_crawler import HttpCache
+
+
+def _response(body):
+    return SimpleNamespace(headers={}, content=body, encoding="utf-8")
+
+
+def test_hits_do_not_write_until_flush(tmp_path):
+    cache = HttpCache(path=str(tmp_path / "http.sqlite3"), max_mb=1, max_age_days=1)
+    cache.put("https://a.example/1", _response(b"x" * 100))
+    writes = cache._conn.total_changes
+    for _ in range(20):
+        assert cache.get("https://a.example/1")["body"] == b"x" * 100
+    assert cache._conn.total_changes == writes
+
+    cache.flush()
+    assert cache._conn.total_changes == writes + 1
+
+
+def test_eviction_uses_buffered_access_times(tmp_path):
+    cache = HttpCache(path=str(tmp_path / "http.sqlite3"), max_mb=1, max_age_days=1)
+    body = b"x" * 400_000
+    cache.put("https://a.example/old", _response(body))
+    cache.put("https://a.example/new", _response(body))
+    cache.get("https://a.example/old")  # 메모리에만 기록된 접근 → 정리 순서에 반영돼야 함
+    cache.put("https://a.example/third", _response(body))
+    cache.evict()
+    assert cache.get("https://a.example/old") is not None
+    assert cache.get("https://a.example/new") is None
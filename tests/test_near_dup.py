@@ -0,0 +1,21 @@
+import time
+
+import near_dup
+from near_dup import NearDuplicateIndex
+
+
+def test_expired_entries_are_pruned(monkeypatch):
+    index = NearDuplicateIndex(max_distance=3, days=1)
+    now = time.time()
+    index.load([(0x1234, 1, now - 3 * 86400), (0xFFFF0000, 2, now)])
+    assert len(index) == 1
+    assert index.find(0x1234) is None
+
+    # 실행 중에 만료된 항목은 다음 정리 주기에 빠진다
+    index.add(0xABCD, 3, now - 2 * 86400)
+    assert len(index) == 2
+    monkeypatch.setattr(near_dup, "PRUNE_INTERVAL", 0)
+    index._next_prune = 0.0
+    index.add(0x5555, 4)
+    assert len(index) == 2
+    assert index.find(0xABCD) is None
@@ -0,0 +1,14 @@
+from stage_journal import StageJournal
+
+
+def test_unsigned_simhash_round_trip(tmp_path):
+    journal = StageJournal(path=str(tmp_path / "journal.sqlite3"))
+    fingerprint = (1 << 64) - 12345  # 2^63 이상 (sqlite INTEGER 범위 밖)
+    job = {"link": "https://n.news.naver.com/article/001/0000000001", "title": "제목", "press": "언론사",
+           "keyword_id": 7, "query": "인공지능", "content": "본문", "summary": "요약", "simhash": fingerprint}
+    journal.begin(job)
+
+    pending = journal.pending(keyword_id=7)
+    assert len(pending) == 1
+    assert pending[0]["simhash"] == fingerprint
+    assert journal.get(job["id"])["simhash"] == fingerprint
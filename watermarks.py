@@ -0,0 +1,157 @@
+"""
+키워드별 증분 크롤링 워터마크
+
+키워드마다 "이미 처리가 끝난(성공 또는 중복 확인) 최근 링크"와 확인 이력을 저장.
+- 검색 결과를 최신순으로 훑다가 처리 끝난 링크에 닿으면 거기서 멈춤
+  → 그 아래 기사에 대한 DB 중복 조회를 하지 않음
+- 새 기사가 없던 실행이 이어지면 검색 페이지 확인 간격을 두 배씩 늘림(상한 있음)
+  → 조용한 키워드는 매 실행마다 네이버를 조회하지 않음. 새 기사가 나오면 즉시 초기화
+
+실패한 기사는 처리 완료로 기록하지 않는다. 다만 더 최신 기사가 처리 완료로 기록되면
+검색 결과 순회가 그 위에서 멈추므로, 본문 다운로드/추출에서 실패한 기사(저널 기록 전)는
+retry 목록에 따로 남겨 WATERMARK_RETRY_HOURS 동안 실행마다 후보로 다시 넣는다.
+(대본 단계 이후의 실패는 단계 저널이 이어서 처리)
+상태는 cache/watermarks.json (rate_limits.json과 같은 방식)에 저장.
+"""
+import os
+import json
+import time
+import threading
+
+from config import config
+
+WATERMARK_ENABLED = config.WATERMARK_ENABLED
+WATERMARK_PATH = config.WATERMARK_PATH
+# 새 기사 없는 실행 1회 후 다음 확인까지 최소 간격(분). 이후 2배씩 증가
+WATERMARK_QUIET_INTERVAL_MIN = config.WATERMARK_QUIET_INTERVAL_MIN
+WATERMARK_QUIET_MAX_MIN = config.WATERMARK_QUIET_MAX_MIN
+# 키워드당 기억할 처리 완료 링크 수
+WATERMARK_KEEP_LINKS = config.WATERMARK_KEEP_LINKS
+# 실패한 기사를 다시 시도하는 기간(시간)
+WATERMARK_RETRY_HOURS = config.WATERMARK_RETRY_HOURS
+
+
+def watermark_key(query, keyword_id=None):
+    return f"{keyword_id}:{query}" if keyword_id is not None else f"-:{query}"
+
+
+class KeywordWatermarks:
+    """키워드별 {seen_links, retry, newest_link, last_checked_at, last_new_at, quiet_runs} 저장소."""
+
+    def __init__(self, path=None):
+        self.path = path if path is not None else WATERMARK_PATH
+        self._lock = threading.Lock()
+        self._state = self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ 워터마크 로드 실패 (전체 재확인): {e}")
+            return {}
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            data = json.dumps(self._state, ensure_ascii=False, indent=1)
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp, self.path)
+        except Exception as e:
+            print(f"⚠️ 워터마크 저장 실패: {e}")
+
+    def seen_links(self, key):
+        with self._lock:
+            return set(self._state.get(key, {}).get("seen_links", []))
+
+    def next_check_at(self, key):
+        """조용한 키워드의 다음 검색 페이지 확인 가능 시각 (epoch). 제한 없으면 0."""
+        with self._lock:
+            entry = self._state.get(key)
+        if not entry or not entry.get("quiet_runs"):
+            return 0
+        interval = min(
+            WATERMARK_QUIET_MAX_MIN,
+            WATERMARK_QUIET_INTERVAL_MIN * (2 ** (entry["quiet_runs"] - 1)),
+        )
+        return entry.get("last_checked_at", 0) + interval * 60
+
+    def should_skip(self, key, now=None):
+        return (now or time.time()) < self.next_check_at(key)
+
+    def mark_checked(self, key, newest=None, found_new=False):
+        """
+        검색 결과 페이지 확인 후 호출.
+        newest: 페이지 맨 위(가장 최신) 레코드 {'link', 'time', ...}
+        found_new: 이미 처리한 지점 위에 기사가 하나라도 있었는지
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._state.setdefault(key, {"seen_links": [], "quiet_runs": 0})
+            if newest:
+                entry["newest_link"] = newest.get("link")
+                entry["newest_time"] = newest.get("time")
+            entry["last_checked_at"] = now
+            if found_new:
+                entry["last_new_at"] = now
+                entry["quiet_runs"] = 0
+            else:
+                entry["quiet_runs"] = entry.get("quiet_runs", 0) + 1
+
+    def mark_resolved(self, key, links):
+        """처리가 끝난 링크(저장 성공 또는 중복 확인)를 최근 순으로 앞에 추가. retry 목록에서는 뺀다."""
+        links = [link for link in links if link]
+        if not links:
+            return
+        with self._lock:
+            entry = self._state.setdefault(key, {"seen_links": [], "quiet_runs": 0})
+            fresh = set(links)
+            merged = links + [link for link in entry.get("seen_links", []) if link not in fresh]
+            entry["seen_links"] = merged[:WATERMARK_KEEP_LINKS]
+            retry = entry.get("retry")
+            if retry:
+                for link in fresh:
+                    retry.pop(link, None)
+
+    def mark_failed(self, key, records, resolved=()):
+        """
+        본문을 받지 못한 기사 {'title', 'link', 'press'}를 retry 목록에 추가하고, resolved 링크는 뺀다.
+        (mark_resolved는 할당량이 남은 실행에서 건너뛰므로 여기서 따로 정리)
+        처음 실패한 시각을 유지해 WATERMARK_RETRY_HOURS가 지나면 retry_records()에서 빠진다.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._state.setdefault(key, {"seen_links": [], "quiet_runs": 0})
+            retry = entry.setdefault("retry", {})
+            for link in resolved:
+                retry.pop(link, None)
+            for r in records:
+                if not r.get("link"):
+                    continue
+                first = retry.get(r["link"], {}).get("first_failed_at", now)
+                retry[r["link"]] = {"title": r["title"], "press": r.get("press"), "first_failed_at": first}
+            if len(retry) > WATERMARK_KEEP_LINKS:
+                newest = sorted(retry.items(), key=lambda kv: kv[1]["first_failed_at"], reverse=True)
+                entry["retry"] = dict(newest[:WATERMARK_KEEP_LINKS])
+
+    def retry_records(self, key, now=None):
+        """다시 시도할 기사 [{'title', 'link', 'press'}]. 기간이 지난 항목은 여기서 정리."""
+        cutoff = (now or time.time()) - WATERMARK_RETRY_HOURS * 3600
+        with self._lock:
+            retry = self._state.get(key, {}).get("retry")
+            if not retry:
+                return []
+            for link in [link for link, r in retry.items() if r["first_failed_at"] < cutoff]:
+                del retry[link]
+            return [{"title": r["title"], "link": link, "press": r["press"]} for link, r in retry.items()]
+
+
+def open_watermarks():
+    return KeywordWatermarks() if WATERMARK_ENABLED else None